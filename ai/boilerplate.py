@@ -0,0 +1,90 @@
+import hashlib
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+logger = logging.getLogger("orchestrator.boilerplate")
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Distinct block hashes kept per mission; plenty for a 20-page Scout.
+MAX_TRACKED_BLOCKS = 20_000
+
+
+def _key(block: str) -> str:
+    normalized = _WHITESPACE.sub(" ", block).strip().lower()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest() if normalized else ""
+
+
+@dataclass
+class BoilerplateModel:
+    """
+    Learns text blocks (innerText lines) that repeat across a mission's
+    pages - navigation, footers, cookie banners - and strips them from
+    later pages so analysis prompts carry only page-specific content.
+
+    A block counts as boilerplate once it has been seen on `min_pages`
+    earlier pages. Pages are learned from their raw text, so stripping
+    never hides a block from the model.
+    """
+    min_pages: int = 2
+    seen: Dict[str, int] = field(default_factory=dict) # block hash -> pages containing it
+    pages: int = 0
+    chars_in: int = 0
+    chars_out: int = 0
+
+    def strip(self, text: str) -> str:
+        """Remove known boilerplate from one page, then learn from it."""
+        kept: List[str] = []
+        page_keys = set()
+
+        for block in (text or "").split("\n"):
+            key = _key(block)
+            if not key:
+                continue
+            if key in page_keys:
+                continue # repeated within the page (e.g. duplicate CTA rows)
+            page_keys.add(key)
+            if self.seen.get(key, 0) < self.min_pages:
+                kept.append(block.strip())
+
+        for key in page_keys:
+            if key in self.seen:
+                self.seen[key] += 1
+            elif len(self.seen) < MAX_TRACKED_BLOCKS:
+                self.seen[key] = 1
+
+        stripped = "\n".join(kept)
+        self.pages += 1
+        self.chars_in += len(text or "")
+        self.chars_out += len(stripped)
+        return stripped
+
+    @property
+    def saved_ratio(self) -> float:
+        return 1 - self.chars_out / self.chars_in if self.chars_in else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"✂️ Boilerplate stripping: {self.saved_ratio:.0%} of page text removed over {self.pages} pages "
+            f"({self.chars_in:,} → {self.chars_out:,} chars)"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pages": self.pages,
+            "chars_in": self.chars_in,
+            "chars_out": self.chars_out,
+            "saved_ratio": round(self.saved_ratio, 4),
+            "tracked_blocks": len(self.seen),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"seen": dict(self.seen), "pages": self.pages, "chars_in": self.chars_in, "chars_out": self.chars_out}
+
+    def restore(self, state: Dict[str, Any]):
+        self.seen = dict(state.get("seen") or {})
+        self.pages = int(state.get("pages", 0))
+        self.chars_in = int(state.get("chars_in", 0))
+        self.chars_out = int(state.get("chars_out", 0))
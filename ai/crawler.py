@@ -1,12 +1,19 @@
 import asyncio
 import json
 import logging
+import time
 from typing import Set, List, Dict, Optional
 from urllib.parse import urlparse, parse_qs, urlencode
 from playwright.async_api import Page
+from ai.boilerplate import BoilerplateModel
 from ai.prompts import CRAWLER_ANALYSIS_PROMPT
 from ai.provider import AIProvider
-from data.supabase_client import db_bridge
+from ai.usage import char_allowance, current_ledger
+from automation.core.fingerprints import FingerprintCapturer
+from data.supabase_async import async_db_bridge
+from data.checkpoint import checkpoint_store
+from data.session_cache import session_cache
+from configs.settings import settings
 
 logger = logging.getLogger("orchestrator.crawler")
 
@@ -26,7 +33,8 @@ class AutonomousCrawler:
         credentials: Optional[Dict] = None,
         api_key: Optional[str] = None,
         provider: Optional[str] = None,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        session_restored: bool = False
     ):
         self.run_id = run_id
         self.user_id = user_id
@@ -40,7 +48,58 @@ class AutonomousCrawler:
         self.visited: Set[str] = set()
         self.queue: List[str] = [start_url]
         self.report_data: List[Dict] = []
-        self.is_logged_in = False
+        # A cached storage state counts as logged in until the target rejects it.
+        self.session_restored = session_restored
+        self.is_logged_in = session_restored
+        self.consecutive_ai_failures = 0
+        self.boilerplate = BoilerplateModel(min_pages=settings.CRAWLER_BOILERPLATE_MIN_PAGES)
+        self.fingerprints = FingerprintCapturer(user_id, settings.FINGERPRINT_MAX_ELEMENTS, settings.FINGERPRINT_CAPTURE)
+        self.elapsed_offset = 0.0
+        self._started_at = time.monotonic()
+        self._checkpointed_at = self._started_at
+
+    def elapsed(self) -> float:
+        """Crawl wall time including any runs before a resume."""
+        return self.elapsed_offset + (time.monotonic() - self._started_at)
+
+    def snapshot(self) -> Dict:
+        """Serializable crawl state for checkpointing."""
+        return {
+            "queue": list(self.queue),
+            "visited": sorted(self.visited),
+            "report_data": list(self.report_data),
+            "consecutive_ai_failures": self.consecutive_ai_failures,
+            "boilerplate": self.boilerplate.snapshot(),
+            "elapsed": self.elapsed(),
+        }
+
+    def restore(self, state: Dict):
+        """Resume from a snapshot. Login is redone unless a cached session was loaded."""
+        self.queue = list(state.get("queue") or [])
+        self.visited = set(state.get("visited") or [])
+        self.report_data = list(state.get("report_data") or [])
+        self.consecutive_ai_failures = int(state.get("consecutive_ai_failures", 0))
+        self.boilerplate.restore(state.get("boilerplate") or {})
+        self.elapsed_offset = float(state.get("elapsed", 0.0))
+        self._started_at = time.monotonic()
+        self.is_logged_in = self.session_restored
+        logger.info(f"♻️ Crawl resumed: {len(self.visited)} visited, {len(self.queue)} queued")
+
+    async def _checkpoint(self):
+        """
+        Snapshot the crawl, throttled to CRAWL_CHECKPOINT_SECONDS: a snapshot
+        carries every analyzed page, so one per page would be quadratic I/O
+        over a large crawl. A resume re-crawls at most one interval's pages.
+        """
+        now = time.monotonic()
+        if now - self._checkpointed_at < settings.CRAWL_CHECKPOINT_SECONDS:
+            return
+        self._checkpointed_at = now
+        await asyncio.to_thread(
+            checkpoint_store.save,
+            self.run_id,
+            {"mode": "scout", "phase": "crawling", "crawler": self.snapshot()}
+        )
 
     def _normalize_url(self, url: str) -> str:
         """Remove tracking parameters and normalize URL structure."""
@@ -57,6 +116,30 @@ class AutonomousCrawler:
         except Exception:
             return url
 
+    async def _login_form_visible(self, page: Page) -> bool:
+        try:
+            return await page.locator("input[type='password']").first.is_visible()
+        except Exception:
+            return False
+
+    async def _ensure_session(self, page: Page):
+        """
+        Log in only when needed. A restored session is trusted until a login
+        form shows up; then it is dropped and a full login is performed.
+        """
+        if self.session_restored and await self._login_form_visible(page):
+            logger.info("🔑 Cached session rejected by target - performing full login")
+            await asyncio.to_thread(session_cache.invalidate, self.user_id, self.start_url, self.credentials)
+            self.session_restored = False
+            self.is_logged_in = False
+
+        if self.is_logged_in:
+            return
+
+        if await self._handle_login(page):
+            state = await page.context.storage_state()
+            await asyncio.to_thread(session_cache.save, self.user_id, self.start_url, self.credentials, state)
+
     async def _handle_login(self, page: Page) -> bool:
         """Attempt automatic login if credentials provided."""
         if not self.credentials or self.is_logged_in:
@@ -84,23 +167,26 @@ class AutonomousCrawler:
     async def _analyze_page(self, page: Page, url: str) -> bool:
         """Analyze page content using AI and log results."""
         try:
-            body_text = await page.evaluate("document.body.innerText.slice(0, 10000)")
+            raw_text = await page.evaluate("(n) => document.body.innerText.slice(0, n)", settings.CRAWLER_RAW_TEXT_CHARS)
+            # Nav, footer and banners repeat on every page; send only what is specific to this one.
+            if settings.CRAWLER_BOILERPLATE_MIN_PAGES > 0:
+                raw_text = self.boilerplate.strip(raw_text) or raw_text
+            body_text = raw_text[:char_allowance(10000)] # shrinks once the mission budget runs tight
             prompt = CRAWLER_ANALYSIS_PROMPT.format(url=url, body_text=body_text)
 
-            resp = await AIProvider.generate(
+            data = await AIProvider.generate_json(
                 prompt=prompt,
                 provider=self.provider,
                 model=self.model,
                 encrypted_key=self.api_key,
-                json_mode=True
+                site="crawler",
+                kind=dict
             )
 
-            if not resp:
+            if not data:
                 logger.warning(f"Empty AI response for {url}")
                 return False
 
-            data = json.loads(resp)
-
             if not all(k in data for k in ["page_type", "status"]):
                 logger.warning(f"Incomplete AI response for {url}")
                 return False
@@ -115,7 +201,7 @@ class AutonomousCrawler:
             }
             self.report_data.append(report_entry)
 
-            db_bridge.log_step(
+            await async_db_bridge.log_step(
                 run_id=self.run_id,
                 step_id=len(self.report_data),
                 role="crawler",
@@ -127,13 +213,24 @@ class AutonomousCrawler:
 
             return True
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing failed for {url}: {e}")
-            return False
         except Exception as e:
             logger.error(f"Analysis failed for {url}: {e}")
             return False
 
+    async def _log_boilerplate_savings(self):
+        if not self.boilerplate.pages:
+            return
+        logger.info(self.boilerplate.summary())
+        await async_db_bridge.log_step(
+            run_id=self.run_id,
+            step_id=len(self.report_data) + 1,
+            role="system",
+            action="boilerplate",
+            status="INFO",
+            message=self.boilerplate.summary(),
+            details=json.dumps(self.boilerplate.stats())
+        )
+
     async def _discover_links(self, page: Page) -> List[str]:
         """Extract and normalize all in-domain links from current page."""
         try:
@@ -151,9 +248,23 @@ class AutonomousCrawler:
     async def run(self, page: Page) -> List[Dict]:
         """Execute autonomous crawl and return collected data."""
         logger.info(f"🚀 Starting Autonomous Crawler on {self.base_domain}")
-        consecutive_ai_failures = 0
 
         while self.queue and len(self.visited) < self.max_pages:
+            ledger = current_ledger()
+            if ledger and ledger.exhausted:
+                message = f"⏳ Scout budget: {ledger.exhausted_reason()}; reporting {len(self.report_data)} analyzed pages"
+                logger.warning(message)
+                await async_db_bridge.log_step(
+                    run_id=self.run_id,
+                    step_id=len(self.report_data) + 1,
+                    role="system",
+                    action="budget",
+                    status="INFO",
+                    message=message
+                )
+                break
+
+            await self._checkpoint()
             url = self.queue.pop(0)
 
             if url in self.visited:
@@ -168,29 +279,29 @@ class AutonomousCrawler:
                     logger.warning(f"Skipping {url} (HTTP {response.status if response else 'timeout'})")
                     continue
 
-                if not self.is_logged_in and self.credentials:
-                    await self._handle_login(page)
+                if self.credentials:
+                    await self._ensure_session(page)
 
                 success = await self._analyze_page(page, url)
+                await self.fingerprints.capture(page)
 
                 if success and url == self.start_url:
                     try:
                         screenshot_bytes = await page.screenshot(type="png")
-                        screenshot_url = db_bridge.upload_screenshot(screenshot_bytes)
-                        db_bridge.client.table("test_runs").update({
-                            "report_url": screenshot_url
-                        }).eq("id", self.run_id).execute()
+                        screenshot_url = await async_db_bridge.upload_screenshot(screenshot_bytes, self.run_id)
+                        if screenshot_url:
+                            await async_db_bridge.set_report_url(self.run_id, screenshot_url)
                     except Exception as e:
                         logger.warning(f"Scout entry capture failed: {e}")
 
                 if success:
-                    consecutive_ai_failures = 0
+                    self.consecutive_ai_failures = 0
                 else:
-                    consecutive_ai_failures += 1
+                    self.consecutive_ai_failures += 1
 
-                if consecutive_ai_failures >= 3:
+                if self.consecutive_ai_failures >= 3:
                     logger.error("⚠️ Neural uplink disconnected - aborting crawl")
-                    db_bridge.log_step(
+                    await async_db_bridge.log_step(
                         run_id=self.run_id,
                         step_id=999,
                         role="system",
@@ -210,4 +321,7 @@ class AutonomousCrawler:
                 continue
 
         logger.info(f"✅ Crawl complete: {len(self.visited)} pages analyzed")
+        if self.fingerprints.stats.pages:
+            logger.info(self.fingerprints.summary())
+        await self._log_boilerplate_savings()
         return self.report_data
@@ -1,30 +1,13 @@
-import json
 import logging
-import re
 from typing import Dict, Optional
 
 from playwright.async_api import Page
 from ai.provider import AIProvider
+from ai.usage import char_allowance
 
 logger = logging.getLogger("orchestrator.healer")
 
 
-def extract_json_object(text: str) -> Optional[Dict]:
-    if not text:
-        return None
-
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        match = re.search(r'(\{[\s\S]*\})', text)
-        if match:
-            try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
-                return None
-    return None
-
-
 async def heal_selector(
     page: Page,
     broken_selector: str,
@@ -56,8 +39,9 @@ async def heal_selector(
         except Exception:
             dom_html = await page.content()
 
-        if len(dom_html) > 55000:
-            dom_html = dom_html[:55000] + "\n<!-- TRUNCATED -->"
+        limit = char_allowance(55000) # shrinks once the mission budget runs tight
+        if len(dom_html) > limit:
+            dom_html = dom_html[:limit] + "\n<!-- TRUNCATED -->"
 
         prompt = f"""TASK: Resolve a broken UI selector.
 
@@ -89,20 +73,15 @@ If no suitable element exists:
 }}
 """.strip()
 
-        response = await AIProvider.generate(
+        result = await AIProvider.generate_json(
             prompt=prompt,
             provider=provider,
             model=model,
             encrypted_key=encrypted_key,
-            json_mode=True
+            site="healer",
+            kind=dict
         )
 
-        if not response:
-            logger.warning("Healer received empty AI response")
-            return None
-
-        result = extract_json_object(response)
-
         if not result or not result.get("found") or not result.get("selector"):
             logger.warning(f"Healer: No replacement found for '{broken_selector}'")
             return None
@@ -0,0 +1,149 @@
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Type
+
+THINK_OPEN = "<think>"
+THINK_CLOSE = "</think>"
+
+# Characters handed to the C parser per response, as a multiple of its
+# length. Nested candidates overlap, so this cap is what keeps extraction
+# linear in the response size.
+PARSE_BUDGET = 4
+
+# Every character the span scanner has to look at; everything else is skipped in C.
+_STRUCTURAL = re.compile(r'[\[\]{}"\\]')
+_OPENERS = re.compile(r"[\[{]")
+_FENCE = re.compile(r"```(?:json)?")
+_OBJECT_START = re.compile(r'\{\s*["}]') # cheap reject for prose like {placeholder}
+_CLOSER_OF = {"{": "}", "[": "]"}
+
+_decoder = json.JSONDecoder()
+
+
+@dataclass(frozen=True)
+class JSONMatch:
+    value: Any
+    text: str # the JSON as it appeared in the response
+
+
+def strip_think(text: str) -> str:
+    """Drop closed <think>...</think> blocks (reasoning models emit them before the answer)."""
+    if THINK_OPEN not in text:
+        return text
+    parts, pos = [], 0
+    while True:
+        start = text.find(THINK_OPEN, pos)
+        if start == -1:
+            break
+        end = text.find(THINK_CLOSE, start + len(THINK_OPEN))
+        if end == -1:
+            break # unclosed: keep the rest, it may still hold the answer
+        parts.append(text[pos:start])
+        pos = end + len(THINK_CLOSE)
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def strip_fences(text: str) -> str:
+    """Remove markdown code fence markers (``` and ```json)."""
+    return _FENCE.sub("", text).strip() if "```" in text else text.strip()
+
+
+def json_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Balanced {...} / [...] spans in one pass, sorted by start (outer before
+    inner). Brackets inside JSON strings are ignored; a closer that does not
+    match the open bracket abandons everything still open.
+    """
+    spans: List[Tuple[int, int]] = []
+    stack: List[int] = []
+    in_string = False
+    skip = -1
+    for match in _STRUCTURAL.finditer(text):
+        pos = match.start()
+        if pos == skip:
+            continue
+        ch = text[pos]
+        if in_string:
+            if ch == "\\":
+                skip = pos + 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = bool(stack) # prose quotes outside any bracket are not strings
+        elif ch == "{" or ch == "[":
+            stack.append(pos)
+        elif ch == "}" or ch == "]":
+            if stack and _CLOSER_OF[text[stack[-1]]] == ch:
+                spans.append((stack.pop(), pos + 1))
+            else:
+                stack.clear()
+    spans.sort()
+    return spans
+
+
+def _accept(value: Any, kind: Optional[Type]) -> bool:
+    return isinstance(value, (dict, list)) and (kind is None or isinstance(value, kind))
+
+
+def find_json(text: Optional[str], kind: Optional[Type] = None) -> Optional[JSONMatch]:
+    """
+    First JSON object or array in a model response (of `kind` when given,
+    e.g. dict), ignoring think blocks, code fences and surrounding prose.
+    """
+    if not text:
+        return None
+    text = strip_fences(strip_think(text))
+
+    # Fast path: the document alone (provider JSON modes), or wrapped in
+    # prose - first opener to the last matching closer, parsed once.
+    opener = _OPENERS.search(text)
+    if opener is None:
+        return None
+    start = opener.start()
+    end = text.rfind(_CLOSER_OF[text[start]]) + 1
+    if end > start:
+        try:
+            value = json.loads(text[start:end])
+            if _accept(value, kind):
+                return JSONMatch(value, text[start:end])
+        except (ValueError, RecursionError):
+            pass
+
+    tried = {start}
+    budget = PARSE_BUDGET * len(text)
+    for start, end in json_spans(text):
+        if text[start] == "{" and not _OBJECT_START.match(text, start):
+            continue
+        budget -= end - start
+        if budget < 0:
+            return None
+        tried.add(start)
+        try:
+            value = json.loads(text[start:end])
+        except (ValueError, RecursionError):
+            continue
+        if _accept(value, kind):
+            return JSONMatch(value, text[start:end])
+
+    # A stray quote in prose can hide a document from the scanner; decode from the remaining openers.
+    for opener in _OPENERS.finditer(text):
+        if opener.start() in tried:
+            continue
+        budget -= len(text) - opener.start()
+        if budget < 0:
+            break
+        try:
+            value, end = _decoder.raw_decode(text, opener.start())
+        except (ValueError, RecursionError):
+            continue
+        if _accept(value, kind):
+            return JSONMatch(value, text[opener.start():end])
+    return None
+
+
+def extract_json(text: Optional[str], kind: Optional[Type] = None) -> Any:
+    """Parsed value of find_json, or None."""
+    match = find_json(text, kind)
+    return match.value if match else None
@@ -64,3 +64,41 @@ class TestPlan(BaseModel):
     steps: List[TestStep]
     is_chaos_mode: bool = False # Triggers adversarial logic in the Runner
     target_url: Optional[str] = None # Anchors the navigation
+
+class AuditMetrics(BaseModel):
+    """Headline numbers of a Scout audit."""
+    total_pages: int
+    total_tests: int
+    passed: int
+    pass_rate: float
+    duration_seconds: float
+    stability_score: int
+
+class AuditEntry(BaseModel):
+    """One analysed page in the execution trace."""
+    url: str = "N/A"
+    page_type: str = "General"
+    test_executed: str = ""
+    test_result: str = "FAIL"
+    actions: List[Any] = []
+
+class AuditReport(BaseModel):
+    """
+    Format-neutral Scout audit, assembled once per mission.
+    JSON, HTML and PDF outputs are all rendered from this model.
+    """
+    schema_version: int = 1
+    run_id: Optional[str] = None
+    trace_id: str
+    generated_at: str
+    target_url: str
+    layout: str = "summary" # 'summary' digest or 'full' streamed trace
+    metrics: AuditMetrics
+    is_stable: bool
+    confidence: str
+    verdict: str
+    summary: str
+    findings: List[str] = []
+    recommendation: str
+    risk: List[Dict[str, Any]] = []
+    entries: List[AuditEntry] = []
@@ -0,0 +1,663 @@
+import time
+import logging
+from functools import lru_cache
+from io import BytesIO
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus.flowables import HRFlowable, Flowable
+from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+logger = logging.getLogger("orchestrator.pdf_renderer")
+
+COLOR_ACCENT = colors.HexColor('#6366f1')
+COLOR_BG_DARK = colors.HexColor('#0f172a')
+COLOR_TEXT_PRIMARY = colors.HexColor('#1e293b')
+COLOR_TEXT_SECONDARY = colors.HexColor('#64748b')
+COLOR_BORDER = colors.HexColor('#e2e8f0')
+COLOR_SUCCESS = colors.HexColor('#10b981')
+COLOR_WARNING = colors.HexColor('#f59e0b')
+COLOR_DANGER = colors.HexColor('#ef4444')
+COLOR_BG_LIGHT = colors.HexColor('#f8fafc')
+
+# Summary reports show a digest; larger crawls switch to the streaming layout.
+SUMMARY_TRACE_ROWS = 25
+SUMMARY_RISK_ROWS = 10
+STREAMING_CHUNK_ROWS = 60
+
+PASS_RESULTS = ('PASS', 'TRUE', 'OK')
+
+
+class ArgusCanvas(canvas.Canvas):
+    """
+    Tactical canvas with neural header/footer system.
+
+    Static frame artwork is drawn once into a reusable form, and the page
+    total is a form defined at save time, so pages are flushed as they are
+    finished instead of being buffered until the end of the document.
+    """
+
+    FRAME_FORM = "argusFrame"
+    PAGE_COUNT_FORM = "argusPageCount"
+    # The total is unknown until save(), so every footer reserves room for five digits.
+    PAGE_COUNT_WIDTH = stringWidth("0" * 5, "Courier", 7)
+
+    def __init__(self, *args, **kwargs):
+        self.trace_id = kwargs.pop('trace_id', int(time.time()))
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self._frame_defined = False
+
+    def showPage(self):
+        self.draw_neural_frame()
+        canvas.Canvas.showPage(self)
+
+    def save(self):
+        page_count = self._pageNumber - 1
+        self.beginForm(self.PAGE_COUNT_FORM)
+        self.setFont("Courier", 7)
+        self.setFillColor(COLOR_TEXT_SECONDARY)
+        self.drawRightString(self.PAGE_COUNT_WIDTH, 0, str(page_count))
+        self.endForm()
+        canvas.Canvas.save(self)
+
+    def _define_frame_form(self):
+        page_width, page_height = letter
+
+        self.beginForm(self.FRAME_FORM)
+        self.setStrokeColor(COLOR_ACCENT)
+        self.setLineWidth(2)
+        self.line(0.5*inch, page_height - 0.6*inch, page_width - 0.5*inch, page_height - 0.6*inch)
+
+        self.setFont("Courier-Bold", 9)
+        self.setFillColor(COLOR_BG_DARK)
+        self.drawString(0.75*inch, page_height - 0.5*inch, "ARGUS NEURAL WATCHMAN")
+
+        self.setFont("Courier", 8)
+        self.setFillColor(COLOR_TEXT_SECONDARY)
+        self.drawRightString(
+            page_width - 0.75*inch,
+            page_height - 0.5*inch,
+            "MODE: SCOUT // CLASSIFIED"
+        )
+
+        self.setStrokeColor(COLOR_BORDER)
+        self.setLineWidth(0.5)
+        self.line(0.5*inch, 0.7*inch, page_width - 0.5*inch, 0.7*inch)
+
+        self.setFont("Courier-Bold", 7)
+        self.setFillColor(COLOR_TEXT_SECONDARY)
+        self.drawString(
+            0.75*inch,
+            0.5*inch,
+            f"TRACE_ID: {self.trace_id}"
+        )
+        self.endForm()
+        self._frame_defined = True
+
+    def draw_neural_frame(self):
+        if not self._frame_defined:
+            self._define_frame_form()
+
+        page_width, _ = letter
+        right_edge = page_width - 0.75*inch
+
+        self.saveState()
+        self.doForm(self.FRAME_FORM)
+
+        self.setFont("Courier", 7)
+        self.setFillColor(COLOR_TEXT_SECONDARY)
+        self.drawRightString(right_edge - self.PAGE_COUNT_WIDTH, 0.5*inch, f"PAGE_{self._pageNumber}_OF_")
+        self.translate(right_edge - self.PAGE_COUNT_WIDTH, 0.5*inch)
+        self.doForm(self.PAGE_COUNT_FORM)
+        self.restoreState()
+
+
+class StreamingTable(Flowable):
+    """
+    Table that materialises its rows lazily, one page-sized chunk at a time.
+
+    It always reports itself as taller than the frame so platypus asks it to
+    split; each split lays out a single LongTable chunk and hands the rest of
+    the row iterator to a fresh StreamingTable. Only the rows of the page
+    being laid out are ever held as flowables.
+    """
+
+    def __init__(
+        self,
+        rows: Iterator[List[str]],
+        header: List[str],
+        col_widths: List[float],
+        base_style: List[Tuple],
+        row_style: Optional[Callable[[int, List[str]], List[Tuple]]] = None,
+        chunk_rows: int = STREAMING_CHUNK_ROWS,
+        pending: Optional[List[List[str]]] = None,
+    ):
+        Flowable.__init__(self)
+        self._rows = rows
+        self._pending = pending or []
+        self.header = header
+        self.col_widths = col_widths
+        self.base_style = base_style
+        self.row_style = row_style
+        self.chunk_rows = chunk_rows
+        self._row_height: Optional[float] = None
+
+    def _take(self, count: int) -> List[List[str]]:
+        taken = self._pending[:count]
+        self._pending = self._pending[count:]
+        if len(taken) < count:
+            taken.extend(islice(self._rows, count - len(taken)))
+        return taken
+
+    def _has_more(self) -> bool:
+        if self._pending:
+            return True
+        nxt = next(self._rows, None)
+        if nxt is None:
+            return False
+        self._pending.append(nxt)
+        return True
+
+    def _build(self, rows: List[List[str]]) -> LongTable:
+        commands = list(self.base_style)
+        if self.row_style:
+            for idx, row in enumerate(rows, start=1):
+                commands.extend(self.row_style(idx, row))
+        table = LongTable([self.header] + rows, colWidths=self.col_widths, repeatRows=1)
+        table.setStyle(TableStyle(commands))
+        return table
+
+    def _successor(self, leftover: List[List[str]]) -> "StreamingTable":
+        nxt = StreamingTable(
+            self._rows, self.header, self.col_widths, self.base_style,
+            self.row_style, self.chunk_rows, pending=leftover + self._pending
+        )
+        nxt._row_height = self._row_height
+        return nxt
+
+    def wrap(self, availWidth, availHeight):
+        return availWidth, availHeight + 1
+
+    def split(self, availWidth, availHeight):
+        # Rows are single-line and uniform, so once one chunk has been laid
+        # out the number of rows that fit a frame can be computed up front.
+        count = self.chunk_rows
+        if self._row_height:
+            count = max(1, int(availHeight // self._row_height) - 1)
+
+        rows = self._take(count)
+        if not rows:
+            return []
+
+        table = self._build(rows)
+        _, height = table.wrap(availWidth, availHeight)
+        self._row_height = height / (len(rows) + 1)
+        if height <= availHeight:
+            if not self._has_more():
+                return [table]
+            return [table, self._successor([])]
+
+        parts = table.split(availWidth, availHeight)
+        if not parts:
+            # Not even the header plus one row fits; retry in the next frame.
+            self._pending = rows + self._pending
+            return []
+
+        consumed = len(parts[0]._cellvalues) - 1
+        return [parts[0], self._successor(rows[consumed:])]
+
+    def draw(self):
+        # Never drawn directly: split() always replaces it with real tables.
+        pass
+
+
+@lru_cache(maxsize=1)
+def get_styles():
+    """Build the paragraph stylesheet once per renderer process."""
+    return PDFRenderer._create_styles()
+
+
+class PDFRenderer:
+    """Reportlab building blocks for the tactical audit layout."""
+
+    @staticmethod
+    def _create_styles():
+        styles = getSampleStyleSheet()
+
+        styles.add(ParagraphStyle(
+            name='TacticalHeader',
+            parent=styles['Normal'],
+            fontSize=9,
+            fontName='Courier-Bold',
+            textColor=COLOR_ACCENT,
+            letterSpacing=2,
+            spaceAfter=6,
+            alignment=TA_LEFT
+        ))
+
+        styles.add(ParagraphStyle(
+            name='MissionTitle',
+            parent=styles['Heading1'],
+            fontSize=32,
+            textColor=COLOR_BG_DARK,
+            fontName='Helvetica-Bold',
+            spaceAfter=8,
+            spaceBefore=12,
+            alignment=TA_LEFT,
+            leading=36
+        ))
+
+        styles.add(ParagraphStyle(
+            name='TargetInfo',
+            parent=styles['Normal'],
+            fontSize=10,
+            fontName='Courier',
+            textColor=COLOR_TEXT_SECONDARY,
+            spaceAfter=20,
+            leading=14
+        ))
+
+        styles.add(ParagraphStyle(
+            name='SectionTitle',
+            parent=styles['Heading2'],
+            fontSize=14,
+            fontName='Helvetica-Bold',
+            textColor=COLOR_BG_DARK,
+            spaceBefore=20,
+            spaceAfter=12,
+            leading=18
+        ))
+
+        styles.add(ParagraphStyle(
+            name='NeuralBody',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=COLOR_TEXT_PRIMARY,
+            fontName='Helvetica',
+            leading=15,
+            spaceAfter=10,
+            alignment=TA_JUSTIFY
+        ))
+
+        styles.add(ParagraphStyle(
+            name='FindingBullet',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=COLOR_TEXT_PRIMARY,
+            fontName='Helvetica',
+            leftIndent=20,
+            bulletIndent=10,
+            spaceAfter=8,
+            leading=14
+        ))
+
+        return styles
+
+    @staticmethod
+    def _create_tactical_banner(styles):
+        banner_data = [[
+            Paragraph(
+                "<b>⚡ AUTONOMOUS INTELLIGENCE AUDIT</b><br/>"
+                "<font size='8'>Powered by Neural Pattern Recognition & Predictive Stability Analysis</font>",
+                styles['NeuralBody']
+            )
+        ]]
+
+        banner = Table(banner_data, colWidths=[6.5*inch])
+        banner.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), COLOR_ACCENT),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 16),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 16),
+            ('BOX', (0, 0), (-1, -1), 2, COLOR_BG_DARK),
+        ]))
+
+        return banner
+
+    @staticmethod
+    def _create_metrics_grid(total_pages, total_tests, pass_rate, duration, stability_score, styles):
+        def metric_card(label, value, unit=""):
+            return Paragraph(
+                f"<font size='9' color='{COLOR_TEXT_SECONDARY.hexval()}'><b>{label}</b></font><br/>"
+                f"<font size='22' color='{COLOR_BG_DARK.hexval()}'><b>{value}</b></font>"
+                f"<font size='10' color='{COLOR_TEXT_SECONDARY.hexval()}'>{unit}</font>",
+                styles['NeuralBody']
+            )
+
+        score_color = (
+            COLOR_SUCCESS if stability_score >= 80 else
+            COLOR_WARNING if stability_score >= 60 else
+            COLOR_DANGER
+        )
+
+        metrics = [[
+            metric_card("NODES SCANNED", total_pages),
+            metric_card("TEST VECTORS", total_tests),
+            metric_card("PASS RATE", pass_rate, "%"),
+            Paragraph(
+                f"<font size='9' color='{COLOR_TEXT_SECONDARY.hexval()}'><b>STABILITY</b></font><br/>"
+                f"<font size='22' color='{score_color.hexval()}'><b>{stability_score}</b></font>"
+                f"<font size='10' color='{COLOR_TEXT_SECONDARY.hexval()}'>/100</font>",
+                styles['NeuralBody']
+            )
+        ]]
+
+        table = Table(metrics, colWidths=[1.7*inch]*4)
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), COLOR_BG_LIGHT),
+            ('BOX', (0, 0), (-1, -1), 1, COLOR_BORDER),
+            ('INNERGRID', (0, 0), (-1, -1), 0.5, COLOR_BORDER),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 16),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 16),
+        ]))
+
+        return table
+
+    @staticmethod
+    def _create_risk_heatmap(risk_data, styles):
+        if not risk_data:
+            return Paragraph(
+                "<i>No historical risk data available for target system.</i>",
+                styles['NeuralBody']
+            )
+
+        table_data = [[
+            Paragraph("<b>SIGNAL URL</b>", styles['NeuralBody']),
+            Paragraph("<b>RISK</b>", styles['NeuralBody']),
+            Paragraph("<b>STATUS</b>", styles['NeuralBody']),
+            Paragraph("<b>RECOMMENDATION</b>", styles['NeuralBody'])
+        ]]
+
+        for item in risk_data[:SUMMARY_RISK_ROWS]:
+            url = item.get('url', 'N/A')
+            risk = item.get('riskscore', 0)
+            status = item.get('status', 'UNKNOWN')
+            rec = item.get('recommendation', '')
+
+            if risk > 60:
+                badge = "🔴"
+                risk_color = COLOR_DANGER
+            elif risk > 25:
+                badge = "🟡"
+                risk_color = COLOR_WARNING
+            else:
+                badge = "🟢"
+                risk_color = COLOR_SUCCESS
+
+            table_data.append([
+                Paragraph(f"<font face='Courier' size='8'>{url[:52]}...</font>", styles['NeuralBody']),
+                Paragraph(f"<font color='{risk_color.hexval()}'><b>{risk}</b></font>", styles['NeuralBody']),
+                Paragraph(f"{badge} {status}", styles['NeuralBody']),
+                Paragraph(rec[:35] + "..." if len(rec) > 35 else rec, styles['NeuralBody'])
+            ])
+
+        table = Table(table_data, colWidths=[2.2*inch, 0.7*inch, 1.1*inch, 2.3*inch])
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), COLOR_BG_DARK),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (1, 0), (2, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 0.5, COLOR_BORDER),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, COLOR_BG_LIGHT]),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ]))
+
+        return table
+
+    @staticmethod
+    def _create_execution_log(crawl_data, styles):
+        table_data = [[
+            Paragraph("<b>TARGET URL</b>", styles['NeuralBody']),
+            Paragraph("<b>PAGE TYPE</b>", styles['NeuralBody']),
+            Paragraph("<b>TEST VECTOR</b>", styles['NeuralBody']),
+            Paragraph("<b>STATUS</b>", styles['NeuralBody'])
+        ]]
+
+        for entry in crawl_data[:SUMMARY_TRACE_ROWS]:
+            url = entry.get('url', 'N/A')
+            page_type = entry.get('page_type', 'GENERAL')
+            test = entry.get('test_executed', 'N/A')
+            result = entry.get('test_result', 'FAIL')
+
+            if str(result).upper() in PASS_RESULTS:
+                status = "✓ PASS"
+                status_color = COLOR_SUCCESS
+            else:
+                status = "✗ FAIL"
+                status_color = COLOR_DANGER
+
+            table_data.append([
+                Paragraph(f"<font face='Courier' size='7'>{url[:50]}...</font>", styles['NeuralBody']),
+                Paragraph(page_type, styles['NeuralBody']),
+                Paragraph(test[:25] + "..." if len(test) > 25 else test, styles['NeuralBody']),
+                Paragraph(f"<font color='{status_color.hexval()}'><b>{status}</b></font>", styles['NeuralBody'])
+            ])
+
+        table = Table(table_data, colWidths=[2.5*inch, 1*inch, 1.8*inch, 0.9*inch])
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), COLOR_BG_DARK),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, COLOR_BORDER),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, COLOR_BG_LIGHT]),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ]))
+
+        return table
+
+    @staticmethod
+    def _table_base_style(font_size: int, padding: int) -> List[Tuple]:
+        return [
+            ('BACKGROUND', (0, 0), (-1, 0), COLOR_BG_DARK),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), font_size),
+            ('GRID', (0, 0), (-1, -1), 0.5, COLOR_BORDER),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, COLOR_BG_LIGHT]),
+            ('TOPPADDING', (0, 0), (-1, -1), padding),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+        ]
+
+    @staticmethod
+    def _create_streaming_execution_log(crawl_data: Iterable[Dict]) -> StreamingTable:
+        def rows() -> Iterator[List[str]]:
+            for entry in crawl_data:
+                url = str(entry.get('url') or 'N/A')
+                test = str(entry.get('test_executed') or 'N/A')
+                passed = str(entry.get('test_result', 'FAIL')).upper() in PASS_RESULTS
+                yield [
+                    url[:60],
+                    str(entry.get('page_type') or 'GENERAL')[:18],
+                    test[:28],
+                    "PASS" if passed else "FAIL",
+                ]
+
+        def row_style(idx: int, row: List[str]) -> List[Tuple]:
+            if row[3] == "PASS":
+                return []
+            return [('TEXTCOLOR', (3, idx), (3, idx), COLOR_DANGER)]
+
+        base = PDFRenderer._table_base_style(font_size=7, padding=3)
+        base += [
+            ('FONTNAME', (0, 1), (0, -1), 'Courier'),
+            ('FONTNAME', (3, 1), (3, -1), 'Helvetica-Bold'),
+            ('TEXTCOLOR', (3, 1), (3, -1), COLOR_SUCCESS),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+        ]
+        return StreamingTable(
+            rows(),
+            header=["TARGET URL", "PAGE TYPE", "TEST VECTOR", "STATUS"],
+            col_widths=[2.9*inch, 1.1*inch, 1.6*inch, 0.7*inch],
+            base_style=base,
+            row_style=row_style,
+        )
+
+    @staticmethod
+    def _create_streaming_risk_heatmap(risk_data: Iterable[Dict]) -> StreamingTable:
+        def rows() -> Iterator[List[str]]:
+            for item in risk_data:
+                yield [
+                    str(item.get('url') or 'N/A')[:60],
+                    str(item.get('riskscore', 0)),
+                    str(item.get('status', 'UNKNOWN')),
+                    str(item.get('recommendation') or '')[:40],
+                ]
+
+        def row_style(idx: int, row: List[str]) -> List[Tuple]:
+            risk = float(row[1] or 0)
+            color = COLOR_DANGER if risk > 60 else COLOR_WARNING if risk > 25 else COLOR_SUCCESS
+            return [('TEXTCOLOR', (1, idx), (1, idx), color)]
+
+        base = PDFRenderer._table_base_style(font_size=7, padding=3)
+        base += [
+            ('FONTNAME', (0, 1), (0, -1), 'Courier'),
+            ('ALIGN', (1, 0), (2, -1), 'CENTER'),
+        ]
+        return StreamingTable(
+            rows(),
+            header=["SIGNAL URL", "RISK", "STATUS", "RECOMMENDATION"],
+            col_widths=[2.9*inch, 0.6*inch, 0.9*inch, 1.9*inch],
+            base_style=base,
+            row_style=row_style,
+        )
+
+
+def render_report_pdf(report: Dict[str, Any]) -> bytes:
+    """
+    Build the tactical audit PDF from a dumped AuditReport.
+
+    Runs inside the reporter's process pool, so it must not touch the event
+    loop, the database bridge or any AI provider.
+    """
+    trace_id = report["trace_id"]
+    metrics = report["metrics"]
+    crawl_data = report["entries"]
+    relevant_risk = report["risk"]
+    total_time_seconds = metrics["duration_seconds"]
+    stability_score = metrics["stability_score"]
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=1.1*inch,
+        bottomMargin=1*inch
+    )
+
+    styles = get_styles()
+    streaming = report.get("layout") == "full"
+    story = []
+
+    story.append(Paragraph(
+        f"GENERATED_BY_ARGUS_NEURAL_WATCHMAN // {trace_id}",
+        styles['TacticalHeader']
+    ))
+    story.append(Paragraph("TACTICAL AUDIT INTELLIGENCE", styles['MissionTitle']))
+    story.append(Paragraph(
+        f"Neural_Timestamp: {report['generated_at']}<br/>"
+        f"Target_Node: {report['target_url']}",
+        styles['TargetInfo']
+    ))
+
+    story.append(PDFRenderer._create_tactical_banner(styles))
+    story.append(Spacer(1, 0.3*inch))
+
+    story.append(Paragraph("SYSTEM METRICS // PERFORMANCE ANALYSIS", styles['SectionTitle']))
+    story.append(PDFRenderer._create_metrics_grid(
+        metrics["total_pages"], metrics["total_tests"], metrics["pass_rate"], total_time_seconds, stability_score, styles
+    ))
+    story.append(Spacer(1, 0.25*inch))
+
+    story.append(Paragraph("NEURAL INSIGHTS // PREDICTIVE ANALYSIS", styles['SectionTitle']))
+    story.append(HRFlowable(
+        width="25%",
+        thickness=2.5,
+        color=COLOR_ACCENT,
+        spaceAfter=12,
+        hAlign='LEFT'
+    ))
+
+    if report["summary"]:
+        story.append(Paragraph(report["summary"], styles['NeuralBody']))
+
+    story.append(Spacer(1, 0.2*inch))
+
+    if relevant_risk:
+        story.append(Paragraph("PREDICTIVE STABILITY HEATMAP", styles['SectionTitle']))
+        story.append(Paragraph(
+            "Historical risk analysis based on execution telemetry and failure patterns:",
+            styles['NeuralBody']
+        ))
+        story.append(Spacer(1, 0.1*inch))
+        if streaming:
+            story.append(PDFRenderer._create_streaming_risk_heatmap(relevant_risk))
+        else:
+            story.append(PDFRenderer._create_risk_heatmap(relevant_risk, styles))
+        story.append(Spacer(1, 0.3*inch))
+
+    story.append(PageBreak())
+    story.append(Paragraph("CRITICAL FINDINGS // MISSION ANALYSIS", styles['SectionTitle']))
+
+    for finding in report["findings"]:
+        story.append(Paragraph(f"• {finding}", styles['FindingBullet']))
+
+    story.append(Spacer(1, 0.3*inch))
+
+    story.append(Paragraph("EXECUTION TRACE // SIGNAL ANALYSIS", styles['SectionTitle']))
+    if streaming:
+        story.append(Paragraph(
+            f"Complete trace of all {len(crawl_data)} test executions:",
+            styles['NeuralBody']
+        ))
+        story.append(Spacer(1, 0.1*inch))
+        story.append(PDFRenderer._create_streaming_execution_log(crawl_data))
+    else:
+        story.append(Paragraph(
+            f"Detailed trace of {min(SUMMARY_TRACE_ROWS, len(crawl_data))} most recent test executions:",
+            styles['NeuralBody']
+        ))
+        story.append(Spacer(1, 0.1*inch))
+        story.append(PDFRenderer._create_execution_log(crawl_data, styles))
+
+    story.append(PageBreak())
+    story.append(Paragraph("FINAL ASSESSMENT // MISSION STATUS", styles['SectionTitle']))
+
+    verdict = ("✓ " if report["is_stable"] else "✗ ") + report["verdict"]
+    verdict_color = COLOR_SUCCESS if report["is_stable"] else COLOR_DANGER
+
+    story.append(Paragraph(
+        f"<font color='{verdict_color.hexval()}' size='14'><b>{verdict}</b></font>",
+        styles['NeuralBody']
+    ))
+    story.append(Paragraph(
+        f"<b>Confidence_Level:</b> {report['confidence']} | "
+        f"<b>Stability_Score:</b> {stability_score}/100 | "
+        f"<b>Duration:</b> {total_time_seconds:.2f}s",
+        styles['NeuralBody']
+    ))
+    story.append(Spacer(1, 0.15*inch))
+
+    story.append(Paragraph(report["recommendation"], styles['NeuralBody']))
+
+    doc.build(story, canvasmaker=lambda *args, **kwargs: ArgusCanvas(*args, trace_id=trace_id, **kwargs))
+
+    return buffer.getvalue()
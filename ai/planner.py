@@ -1,22 +1,27 @@
 import json
 import logging
-import re
-from typing import Optional
-from jsonschema import validate
-from ai.prompts import PLANNER_SYSTEM_PROMPT
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from ai.prompts import PLANNER_SYSTEM_PROMPT, PLAN_REPAIR_PROMPT
 from ai.models import TestPlan, TestStep, ActionType, Role
+from ai.json_extract import find_json, strip_fences, strip_think
 from ai.provider import AIProvider
 from ai.analyzer import RiskAnalyzer
+from ai.usage import current_ledger
+from configs.settings import settings
 
 logger = logging.getLogger("orchestrator.planner")
 
+PLAN_ACTIONS = ["navigate", "click", "input", "wait", "verify_text"]
+
 TEST_STEP_SCHEMA = {
     "type": "array",
     "items": {
         "type": "object",
         "properties": {
             "step_id": {"type": "integer"},
-            "action": {"type": "string", "enum": ["navigate", "click", "input", "wait", "verify_text"]},
+            "action": {"type": "string", "enum": PLAN_ACTIONS},
             "selector": {"type": "string"},
             "value": {"type": "string"},
             "description": {"type": "string"}
@@ -25,28 +30,181 @@ TEST_STEP_SCHEMA = {
     }
 }
 
+# Verbs models use for the plan actions; mapped locally instead of re-planning.
+ACTION_MAP = {
+    'goto': 'navigate',
+    'type': 'input',
+    'fill': 'input',
+    'press': 'click',
+    'check': 'verify_text',
+    'assert': 'verify_text'
+}
+
+_validator = None
+_validator_lock = threading.Lock()
 
-def extract_json_from_text(text: str) -> list:
-    """Extract JSON array from AI response with markdown fallback."""
-    if not text:
-        return []
 
-    clean_text = re.sub(r"```(?:json)?\s*|\s*```", "", text).strip()
+def step_validator():
+    """Validator for one plan step, compiled once (jsonschema is imported on first use)."""
+    global _validator
+    if _validator is None:
+        with _validator_lock:
+            if _validator is None:
+                from jsonschema.validators import validator_for
 
-    try:
-        result = json.loads(clean_text)
-        return result if isinstance(result, list) else [result]
-    except json.JSONDecodeError:
-        pass
+                schema = TEST_STEP_SCHEMA["items"]
+                cls = validator_for(schema)
+                cls.check_schema(schema)
+                _validator = cls(schema)
+    return _validator
 
-    match = re.search(r'\[\s*\{.*?\}\s*\]', clean_text, re.DOTALL)
-    if match:
-        try:
-            return json.loads(match.group(0))
-        except json.JSONDecodeError:
-            pass
 
-    return []
+def normalize_step(raw: Any, index: int) -> Any:
+    """Local fixes that need no model: action aliases and case, scalar types, null fields."""
+    if not isinstance(raw, dict):
+        return raw
+    step = {k: v for k, v in raw.items() if v is not None}
+    if isinstance(step.get("action"), str):
+        action = step["action"].lower().strip()
+        step["action"] = ACTION_MAP.get(action, action)
+    if isinstance(step.get("step_id"), str) and step["step_id"].strip().isdigit():
+        step["step_id"] = int(step["step_id"])
+    step.setdefault("step_id", index + 1)
+    for key in ("selector", "value"):
+        if isinstance(step.get(key), (int, float)) and not isinstance(step.get(key), bool):
+            step[key] = str(step[key])
+    if not step.get("description") and step.get("action") in PLAN_ACTIONS:
+        step["description"] = f"{step['action']} {step.get('selector') or step.get('value') or ''}".strip()
+    return step
+
+
+def extract_steps(text: Optional[str]) -> Optional[List[Any]]:
+    """
+    The step list of a planning answer: a bare array, a wrapper like
+    {"steps": [...]}, or a single step object. A step found inside an
+    array that never closed is a truncated plan, not a one-step one.
+    """
+    match = find_json(text, (list, dict))
+    if match is None:
+        return None
+    result = match.value
+    if isinstance(result, list):
+        return result
+    if "action" not in result:
+        for value in result.values():
+            if isinstance(value, list):
+                return value
+    cleaned = strip_fences(strip_think(text))
+    if "[" in cleaned[:cleaned.find(match.text)]:
+        return None
+    return [result]
+
+
+async def _generate_steps(
+    prompt: str,
+    provider: Optional[str],
+    model: Optional[str],
+    encrypted_key: Optional[str],
+) -> Optional[List[Any]]:
+    raw = await AIProvider.generate(prompt, provider, model, encrypted_key, json_mode=False, site="planner")
+    steps = extract_steps(raw)
+    if raw and steps is None:
+        logger.warning(f"[{provider or settings.AI_PROVIDER}] No plan steps in planning response")
+    return steps
+
+
+def step_errors(steps: List[Any]) -> Dict[int, List[str]]:
+    """Schema violations per step index; empty when the plan is valid."""
+    validator = step_validator()
+    errors: Dict[int, List[str]] = {}
+    for i, step in enumerate(steps):
+        found = [
+            f"{'/'.join(str(p) for p in e.absolute_path) or 'step'}: {e.message}"
+            for e in validator.iter_errors(step)
+        ]
+        if found:
+            errors[i] = found
+    return errors
+
+
+@dataclass
+class PlanningStats:
+    """Process-wide planning outcomes: how often a plan was saved by repair instead of regenerated."""
+    plans: int = 0
+    valid_first: int = 0 # valid as generated (after local alias mapping)
+    locally_fixed: int = 0 # steps changed by normalize_step
+    repair_calls: int = 0
+    repaired: int = 0 # plans made valid by targeted repair
+    replans: int = 0 # full planning calls after the first
+    failed: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        saved = self.repaired + self.replans
+        return {
+            "plans": self.plans,
+            "valid_first": self.valid_first,
+            "locally_fixed": self.locally_fixed,
+            "repair_calls": self.repair_calls,
+            "repaired": self.repaired,
+            "replans": self.replans,
+            "failed": self.failed,
+            "replans_avoided_ratio": round(self.repaired / saved, 3) if saved else None,
+        }
+
+
+planning_stats = PlanningStats()
+
+
+def _count(name: str, n: int = 1):
+    setattr(planning_stats, name, getattr(planning_stats, name) + n)
+    ledger = current_ledger()
+    if ledger:
+        ledger.count(f"plan_{name}", n)
+
+
+async def _repair_steps(
+    intent: str,
+    steps: List[Any],
+    errors: Dict[int, List[str]],
+    provider: Optional[str],
+    model: Optional[str],
+    encrypted_key: Optional[str],
+) -> List[Any]:
+    """Ask the model to fix only the invalid steps; returns the plan with its answers merged in."""
+    broken = [
+        {"step": steps[i], "errors": errors[i]}
+        for i in sorted(errors)
+    ]
+    prompt = PLAN_REPAIR_PROMPT.format(
+        intent=intent,
+        steps=json.dumps(broken, indent=2, default=str),
+        actions=", ".join(PLAN_ACTIONS),
+    )
+    _count("repair_calls")
+    fixed = await _generate_steps(prompt, provider, model, encrypted_key)
+    if not fixed or len(fixed) != len(broken):
+        logger.warning(f"Plan repair returned {len(fixed or [])} steps for {len(broken)} invalid ones")
+        return steps
+
+    repaired = list(steps)
+    for i, step in zip(sorted(errors), fixed):
+        repaired[i] = normalize_step(step, i)
+    return repaired
+
+
+def _build_plan(intent: str, steps_data: List[Dict[str, Any]]) -> TestPlan:
+    steps = [
+        TestStep(
+            step_id=s.get('step_id', i + 1),
+            role=Role.CUSTOMER,
+            action=ActionType(s['action']),
+            selector=s.get('selector', ""),
+            value=str(s.get('value', "")),
+            description=s.get('description', f"Step {i+1}")
+        )
+        for i, s in enumerate(steps_data)
+    ]
+    return TestPlan(intent=intent, steps=steps)
 
 
 async def generate_test_plan(
@@ -72,51 +230,40 @@ async def generate_test_plan(
     base_prompt = system_prompt_override or PLANNER_SYSTEM_PROMPT
     full_prompt = f"{base_prompt}{stability_hint}\n\nINTENT: {raw_input}"
 
-    ACTION_MAP = {
-        'goto': 'navigate',
-        'type': 'input',
-        'fill': 'input',
-        'press': 'click',
-        'check': 'verify_text',
-        'assert': 'verify_text'
-    }
-
     for attempt in range(3):
         try:
-            response_text = await AIProvider.generate(
-                prompt=full_prompt,
-                provider=provider,
-                model=model,
-                encrypted_key=encrypted_key,
-                json_mode=True
-            )
-
-            steps_data = extract_json_from_text(response_text)
+            if attempt:
+                _count("replans")
+            # A truncated plan yields nothing and is retried.
+            steps_data = await _generate_steps(full_prompt, provider, model, encrypted_key)
             if not steps_data:
-                raise ValueError("No JSON array found in AI response")
-
-            validate(instance=steps_data, schema=TEST_STEP_SCHEMA)
-
-            steps = [
-                TestStep(
-                    step_id=s.get('step_id', i + 1),
-                    role=Role.CUSTOMER,
-                    action=ActionType(ACTION_MAP.get(
-                        str(s.get('action')).lower().strip(),
-                        str(s.get('action')).lower().strip()
-                    )),
-                    selector=s.get('selector', ""),
-                    value=str(s.get('value', "")),
-                    description=s.get('description', f"Step {i+1}")
-                )
-                for i, s in enumerate(steps_data)
-            ]
-
-            return TestPlan(intent=raw_input, steps=steps)
+                raise ValueError("No plan steps found in AI response")
+
+            steps = [normalize_step(s, i) for i, s in enumerate(steps_data)]
+            _count("locally_fixed", sum(1 for raw, step in zip(steps_data, steps) if raw != step))
+            errors = step_errors(steps)
+            if not errors:
+                _count("plans")
+                _count("valid_first")
+                return _build_plan(raw_input, steps)
+
+            # Fix only the offending steps while most of the plan is usable.
+            for round_ in range(settings.PLAN_REPAIR_ROUNDS if len(errors) < len(steps) else 0):
+                logger.info(f"🩹 Repairing {len(errors)}/{len(steps)} plan steps (round {round_ + 1}): {errors}")
+                steps = await _repair_steps(raw_input, steps, errors, provider, model, encrypted_key)
+                errors = step_errors(steps)
+                if not errors:
+                    _count("plans")
+                    _count("repaired")
+                    return _build_plan(raw_input, steps)
+
+            raise ValueError(f"{len(errors)} invalid steps: {errors}")
 
         except Exception as e:
             logger.warning(f"Planning attempt {attempt + 1}/3 failed: {e}")
             if attempt == 2:
                 logger.error("All planning attempts exhausted")
 
+    _count("plans")
+    _count("failed")
     return TestPlan(intent=raw_input, steps=[])
@@ -229,3 +229,24 @@ Respond ONLY with a valid JSON object matching the schema below.
 }}
 </schema>
 """.strip()
+
+
+PLAN_REPAIR_PROMPT = """
+<identity>Argus QA Plan Repair</identity>
+
+<context>
+INTENT: {intent}
+The plan for this intent is valid except for the steps below, which failed schema validation.
+</context>
+
+<invalid_steps>
+{steps}
+</invalid_steps>
+
+<rules>
+1. Fix ONLY these steps. Keep each step_id and keep what the step was meant to do.
+2. Use ONLY these actions: {actions}.
+3. Every step needs "action" and "description"; "selector" and "value" are strings.
+4. Output ONLY a JSON array with exactly one corrected step per invalid step, in the same order.
+</rules>
+""".strip()
@@ -1,19 +1,30 @@
 import asyncio
-import json
+import importlib
 import logging
-import re
-from typing import Optional
-
-import openai
-import anthropic
-from groq import Groq
-from google import genai
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type, Union
 
+from ai.json_extract import extract_json, find_json
+from ai.usage import SKIPPABLE_SITES, LLMCall, current_ledger, estimate_tokens
 from ai.vault import Vault
 from configs.settings import settings
 
 logger = logging.getLogger("orchestrator.AIProvider")
 
+# (input_tokens, output_tokens) as reported by the provider, or None.
+Usage = Optional[Tuple[int, int]]
+HandlerResult = Union[str, Tuple[str, Usage]]
+
+# Provider SDKs are imported by their handler on first call; together they
+# cost seconds of worker cold start. Used by AIProvider.preload for warm-up.
+SDK_MODULES = {
+    "openai": "openai",
+    "anthropic": "anthropic",
+    "gemini": "google.genai",
+    "groq": "groq",
+    "sonar": "openai",
+}
+
 
 class AIProvider:
     SYSTEM_PROMPT = (
@@ -22,13 +33,38 @@ class AIProvider:
         "No markdown, no commentary."
     )
 
+    # Providers plugged in at runtime (e.g. the offline benchmark stub).
+    # Handlers share the built-in signature: (prompt, api_key, model) -> text
+    # or (text, usage); token counts are estimated when usage is missing.
+    _registered: Dict[str, Callable[[str, Optional[str], Optional[str]], HandlerResult]] = {}
+
+    @staticmethod
+    def register(name: str, handler: Callable[[str, Optional[str], Optional[str]], HandlerResult]):
+        """Route `provider=name` to a custom handler."""
+        AIProvider._registered[name.lower()] = handler
+
+    @staticmethod
+    def preload(providers: Iterable[str]) -> Dict[str, float]:
+        """Import the SDKs of `providers` ahead of their first call; returns seconds per module."""
+        timings: Dict[str, float] = {}
+        for module in {SDK_MODULES[p.lower()] for p in providers if p and p.lower() in SDK_MODULES}:
+            started = time.perf_counter()
+            try:
+                importlib.import_module(module)
+            except ImportError as e:
+                logger.warning(f"SDK preload failed for {module}: {e}")
+                continue
+            timings[module] = round(time.perf_counter() - started, 3)
+        return timings
+
     @staticmethod
     async def generate(
         prompt: str,
         provider: Optional[str] = None,
         model: Optional[str] = None,
         encrypted_key: Optional[str] = None,
-        json_mode: bool = True
+        json_mode: bool = True,
+        site: str = "general"
     ) -> str:
         """
         Generate AI response from configured provider.
@@ -39,6 +75,7 @@ class AIProvider:
             model: Specific model to use
             encrypted_key: Encrypted API key (optional)
             json_mode: Whether to extract/validate JSON from response
+            site: Call site (planner, crawler, healer, reporter) for usage accounting
 
         Returns:
             AI-generated response (JSON string if json_mode=True)
@@ -54,68 +91,69 @@ class AIProvider:
             "sonar": AIProvider._sonar,
         }
 
-        fn = callers.get(provider)
+        fn = callers.get(provider) or AIProvider._registered.get(provider)
         if not fn:
             logger.error(f"Unknown provider: {provider}")
             return ""
 
+        ledger = current_ledger()
+        if ledger and site in SKIPPABLE_SITES and ledger.exhausted:
+            ledger.note_skip(site)
+            logger.warning(f"[{provider}] {site} call skipped: {ledger.exhausted_reason()}")
+            return ""
+
+        started = time.perf_counter()
+        raw, usage = "", None
         try:
-            raw = await asyncio.to_thread(fn, prompt, api_key, model)
+            result = await asyncio.to_thread(fn, prompt, api_key, model)
+            raw, usage = result if isinstance(result, tuple) else (result, None)
 
             if not json_mode:
                 return raw
 
-            extracted = AIProvider._extract_json(raw)
-            if not extracted:
+            match = find_json(raw)
+            if not match:
                 logger.warning(f"[{provider}] Failed to extract valid JSON from response")
 
-            return extracted
+            return match.text if match else ""
 
         except Exception as e:
             logger.exception(f"[{provider}] generation failed: {e}")
             return ""
+        finally:
+            if ledger:
+                ledger.record(LLMCall(
+                    site=site,
+                    provider=provider,
+                    model=model,
+                    input_tokens=usage[0] if usage else estimate_tokens(AIProvider.SYSTEM_PROMPT + prompt),
+                    output_tokens=usage[1] if usage else (estimate_tokens(raw) if raw else 0),
+                    latency_ms=round((time.perf_counter() - started) * 1000, 1),
+                    estimated=usage is None,
+                    ok=bool(raw),
+                ))
 
     @staticmethod
-    def _extract_json(text: str) -> str:
-        """Extract and validate JSON from AI response text."""
-        if not text:
-            return ""
-
-        # Remove thinking tags and markdown code blocks
-        text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL)
-        text = re.sub(r"```(?:json)?\s*([\s\S]*?)\s*```", r"\1", text)
-
-        # Find JSON boundaries
-        obj_start = text.find('{')
-        arr_start = text.find('[')
-
-        # Determine which comes first
-        if obj_start != -1 and (obj_start < arr_start or arr_start == -1):
-            first_idx = obj_start
-            last_idx = text.rfind('}')
-        elif arr_start != -1:
-            first_idx = arr_start
-            last_idx = text.rfind(']')
-        else:
-            logger.warning(f"No JSON structures found in response: {text[:100]}...")
-            return ""
-
-        if first_idx == -1 or last_idx == -1:
-            return ""
-
-        json_str = text[first_idx:last_idx + 1].strip()
-
-        # Validate JSON
-        try:
-            json.loads(json_str)
-            return json_str
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON validation failed: {e} | Snippet: {json_str[:200]}")
-            return ""
+    async def generate_json(
+        prompt: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        encrypted_key: Optional[str] = None,
+        site: str = "general",
+        kind: Optional[Type] = None
+    ) -> Optional[Any]:
+        """generate() for structured answers: the parsed JSON (of `kind` when given), or None."""
+        raw = await AIProvider.generate(prompt, provider, model, encrypted_key, json_mode=False, site=site)
+        value = extract_json(raw, kind)
+        if raw and value is None:
+            logger.warning(f"[{provider or settings.AI_PROVIDER}] Failed to extract valid JSON from response")
+        return value
 
     @staticmethod
-    def _openai(prompt: str, key: Optional[str], model: Optional[str]) -> str:
+    def _openai(prompt: str, key: Optional[str], model: Optional[str]) -> Tuple[str, Usage]:
         """OpenAI API handler."""
+        import openai
+
         client = openai.OpenAI(api_key=key or settings.OPENAI_API_KEY)
         res = client.chat.completions.create(
             model=model or settings.OPENAI_MODEL,
@@ -125,11 +163,13 @@ class AIProvider:
             ],
             temperature=0.1,
         )
-        return res.choices[0].message.content or ""
+        return res.choices[0].message.content or "", AIProvider._chat_usage(res)
 
     @staticmethod
-    def _anthropic(prompt: str, key: Optional[str], model: Optional[str]) -> str:
+    def _anthropic(prompt: str, key: Optional[str], model: Optional[str]) -> Tuple[str, Usage]:
         """Anthropic Claude API handler."""
+        import anthropic
+
         client = anthropic.Anthropic(api_key=key or settings.ANTHROPIC_API_KEY)
         res = client.messages.create(
             model=model or settings.ANTHROPIC_MODEL,
@@ -138,11 +178,13 @@ class AIProvider:
             messages=[{"role": "user", "content": prompt}],
             temperature=0.1,
         )
-        return res.content[0].text
+        usage = (res.usage.input_tokens, res.usage.output_tokens) if res.usage else None
+        return res.content[0].text, usage
 
     @staticmethod
-    def _gemini(prompt: str, key: Optional[str], model: Optional[str]) -> str:
+    def _gemini(prompt: str, key: Optional[str], model: Optional[str]) -> Tuple[str, Usage]:
         """Google Gemini API handler."""
+        from google import genai
         from google.genai import types
 
         client = genai.Client(
@@ -160,21 +202,25 @@ class AIProvider:
                 temperature=0.1,
             ),
         )
-        return res.text or ""
+        meta = res.usage_metadata
+        usage = (meta.prompt_token_count or 0, meta.candidates_token_count or 0) if meta else None
+        return res.text or "", usage
 
     @staticmethod
-    def _groq(prompt: str, key: Optional[str], model: Optional[str]) -> str:
+    def _groq(prompt: str, key: Optional[str], model: Optional[str]) -> Tuple[str, Usage]:
         """Groq API handler."""
         final_key = key if (key and key.strip()) else settings.GROQ_API_KEY
         if not final_key:
             logger.error("Groq API key not provided")
-            return ""
+            return "", None
 
         # Auto-upgrade to latest model
         target_model = model or settings.GROQ_MODEL
         if "llama-3.1-70b" in target_model:
             target_model = "llama-3.3-70b-versatile"
 
+        from groq import Groq
+
         client = Groq(api_key=final_key)
 
         res = client.chat.completions.create(
@@ -186,11 +232,13 @@ class AIProvider:
             temperature=0.0,
             response_format={"type": "json_object"}
         )
-        return res.choices[0].message.content or ""
+        return res.choices[0].message.content or "", AIProvider._chat_usage(res)
 
     @staticmethod
-    def _sonar(prompt: str, key: Optional[str], model: Optional[str]) -> str:
+    def _sonar(prompt: str, key: Optional[str], model: Optional[str]) -> Tuple[str, Usage]:
         """Perplexity Sonar API handler."""
+        import openai
+
         client = openai.OpenAI(
             api_key=key or settings.PERPLEXITY_API_KEY,
             base_url="https://api.perplexity.ai",
@@ -204,4 +252,10 @@ class AIProvider:
             ],
             temperature=0.1,
         )
-        return res.choices[0].message.content or ""
+        return res.choices[0].message.content or "", AIProvider._chat_usage(res)
+
+    @staticmethod
+    def _chat_usage(res) -> Usage:
+        """Usage block of an OpenAI-compatible chat completion (OpenAI, Groq, Sonar)."""
+        usage = getattr(res, "usage", None)
+        return (usage.prompt_tokens or 0, usage.completion_tokens or 0) if usage else None
@@ -0,0 +1,97 @@
+import html
+import logging
+
+from ai.models import AuditReport
+
+logger = logging.getLogger("orchestrator.report_formats")
+
+HTML_STYLE = """
+body{font-family:Helvetica,Arial,sans-serif;color:#1e293b;margin:0;background:#f8fafc}
+header{background:#0f172a;color:#fff;padding:24px 40px;border-bottom:3px solid #6366f1}
+header small{font-family:Courier,monospace;color:#94a3b8;letter-spacing:2px}
+main{max-width:1100px;margin:0 auto;padding:24px 40px}
+h1{margin:8px 0 4px;font-size:28px}
+h2{font-size:15px;letter-spacing:1px;margin-top:32px;border-bottom:2px solid #6366f1;display:inline-block;padding-bottom:4px}
+.grid{display:grid;grid-template-columns:repeat(4,1fr);gap:12px}
+.card{background:#fff;border:1px solid #e2e8f0;padding:16px;text-align:center}
+.card b{display:block;font-size:26px;color:#0f172a}
+.card span{font-size:11px;color:#64748b;font-weight:bold}
+table{width:100%;border-collapse:collapse;font-size:12px;background:#fff}
+th{background:#0f172a;color:#fff;text-align:left;padding:6px}
+td{border:1px solid #e2e8f0;padding:5px;word-break:break-all}
+tr:nth-child(even) td{background:#f8fafc}
+.pass{color:#10b981;font-weight:bold}.fail{color:#ef4444;font-weight:bold}
+.warn{color:#f59e0b;font-weight:bold}.mono{font-family:Courier,monospace}
+.verdict{font-size:18px;font-weight:bold}
+""".strip()
+
+
+def render_json(report: AuditReport) -> bytes:
+    """Serialize the audit for CI gating and the dashboard."""
+    return report.model_dump_json().encode("utf-8")
+
+
+def _risk_class(score: float) -> str:
+    if score > 60:
+        return "fail"
+    if score > 25:
+        return "warn"
+    return "pass"
+
+
+def render_html(report: AuditReport) -> str:
+    """Render a self-contained static HTML version of the audit."""
+    e = html.escape
+    m = report.metrics
+    parts = [
+        "<!DOCTYPE html><html lang='en'><head><meta charset='utf-8'>",
+        f"<title>ARGUS Audit // {e(report.trace_id)}</title>",
+        f"<style>{HTML_STYLE}</style></head><body>",
+        "<header><small>GENERATED_BY_ARGUS_NEURAL_WATCHMAN // ",
+        f"{e(report.trace_id)}</small><h1>TACTICAL AUDIT INTELLIGENCE</h1>",
+        f"<small>Neural_Timestamp: {e(report.generated_at)} // Target_Node: {e(report.target_url)}</small></header>",
+        "<main><h2>SYSTEM METRICS</h2><div class='grid'>",
+        f"<div class='card'><span>NODES SCANNED</span><b>{m.total_pages}</b></div>",
+        f"<div class='card'><span>TEST VECTORS</span><b>{m.total_tests}</b></div>",
+        f"<div class='card'><span>PASS RATE</span><b>{m.pass_rate}%</b></div>",
+        f"<div class='card'><span>STABILITY</span><b class='{_risk_class(100 - m.stability_score)}'>{m.stability_score}/100</b></div>",
+        "</div>",
+        f"<h2>NEURAL INSIGHTS</h2><p>{e(report.summary)}</p>",
+        "<h2>CRITICAL FINDINGS</h2><ul>",
+    ]
+    parts.extend(f"<li>{e(f)}</li>" for f in report.findings)
+    parts.append("</ul>")
+
+    if report.risk:
+        parts.append("<h2>PREDICTIVE STABILITY HEATMAP</h2><table><tr><th>SIGNAL URL</th><th>RISK</th><th>STATUS</th><th>RECOMMENDATION</th></tr>")
+        for item in report.risk:
+            score = float(item.get("riskscore", 0) or 0)
+            parts.append(
+                f"<tr><td class='mono'>{e(str(item.get('url', 'N/A')))}</td>"
+                f"<td class='{_risk_class(score)}'>{score}</td>"
+                f"<td>{e(str(item.get('status', 'UNKNOWN')))}</td>"
+                f"<td>{e(str(item.get('recommendation', '')))}</td></tr>"
+            )
+        parts.append("</table>")
+
+    parts.append(f"<h2>EXECUTION TRACE // {len(report.entries)} NODES</h2>")
+    parts.append("<table><tr><th>TARGET URL</th><th>PAGE TYPE</th><th>TEST VECTOR</th><th>STATUS</th></tr>")
+    for entry in report.entries:
+        passed = entry.test_result.upper() in ("PASS", "TRUE", "OK")
+        parts.append(
+            f"<tr><td class='mono'>{e(entry.url)}</td><td>{e(entry.page_type)}</td>"
+            f"<td>{e(entry.test_executed)}</td>"
+            f"<td class='{'pass' if passed else 'fail'}'>{'✓ PASS' if passed else '✗ FAIL'}</td></tr>"
+        )
+    parts.append("</table>")
+
+    verdict_class = "pass" if report.is_stable else "fail"
+    parts.extend([
+        "<h2>FINAL ASSESSMENT</h2>",
+        f"<p class='verdict {verdict_class}'>{e(report.verdict)}</p>",
+        f"<p><b>Confidence_Level:</b> {e(report.confidence)} | <b>Stability_Score:</b> {m.stability_score}/100 | ",
+        f"<b>Duration:</b> {m.duration_seconds:.2f}s</p>",
+        f"<p>{e(report.recommendation)}</p>",
+        "</main></body></html>",
+    ])
+    return "".join(parts)
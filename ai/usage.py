@@ -0,0 +1,201 @@
+import contextvars
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from configs.settings import settings
+from data.supabase_async import async_db_bridge
+
+logger = logging.getLogger("orchestrator.usage")
+
+# Rough chars-per-token for prompts whose provider reports no usage.
+CHARS_PER_TOKEN = 4
+
+# Share of the remaining token budget a single prompt may take once a budget is set.
+PROMPT_SHARE = 0.25
+MIN_PROMPT_CHARS = 1_000
+
+# Budget used (0-1) at which call sites start shrinking prompts.
+TIGHT_RATIO = 0.8
+
+# Calls a mission can do without once its budget is spent; planning never is.
+SKIPPABLE_SITES = frozenset({"crawler", "healer", "reporter"})
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text or "") // CHARS_PER_TOKEN)
+
+
+@dataclass
+class LLMCall:
+    site: str # planner | crawler | healer | reporter
+    provider: str
+    model: Optional[str]
+    input_tokens: int
+    output_tokens: int
+    latency_ms: float
+    estimated: bool = False # provider returned no usage metadata
+    ok: bool = True
+
+
+@dataclass
+class MissionBudget:
+    max_tokens: int = 0 # 0 = unlimited
+    max_seconds: float = 0 # 0 = unlimited
+
+    @classmethod
+    def resolve(cls, payload: Optional[Dict[str, Any]] = None) -> "MissionBudget":
+        """Settings defaults, overridable per mission via payload['budget']."""
+        options = (payload or {}).get("budget")
+        if not isinstance(options, dict):
+            options = {}
+        return cls(
+            max_tokens=int(_limit(options.get("tokens"), settings.MISSION_TOKEN_BUDGET)),
+            max_seconds=_limit(options.get("seconds"), settings.MISSION_TIME_BUDGET_SECONDS),
+        )
+
+
+def _limit(value: Any, default: float) -> float:
+    """A budget override from the payload; the settings default when missing or malformed."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return float(default)
+
+
+@dataclass
+class UsageLedger:
+    """Token and latency accounting for one mission, with its budget."""
+    run_id: str
+    budget: MissionBudget = field(default_factory=MissionBudget)
+    calls: List[LLMCall] = field(default_factory=list)
+    skipped: Dict[str, int] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict) # call-site outcomes, e.g. plan_repaired
+    started_at: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    halted: Optional[str] = None # mission cancelled or past its deadline
+    _token: Optional[contextvars.Token] = field(default=None, repr=False)
+
+    @property
+    def tokens_used(self) -> int:
+        return sum(c.input_tokens + c.output_tokens for c in self.calls)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def record(self, call: LLMCall):
+        with self._lock:
+            self.calls.append(call)
+
+    def note_skip(self, site: str):
+        with self._lock:
+            self.skipped[site] = self.skipped.get(site, 0) + 1
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def used_ratio(self) -> float:
+        """Largest share used of either budget (0 when unlimited)."""
+        ratios = [0.0]
+        if self.budget.max_tokens:
+            ratios.append(self.tokens_used / self.budget.max_tokens)
+        if self.budget.max_seconds:
+            ratios.append(self.elapsed / self.budget.max_seconds)
+        return max(ratios)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.halted is not None or self.used_ratio() >= 1.0
+
+    def halt(self, reason: str):
+        """Treat the budget as spent, so wrap-up work skips optional model calls."""
+        self.halted = reason
+
+    def exhausted_reason(self) -> str:
+        if self.halted:
+            return f"mission {self.halted}"
+        if self.budget.max_tokens and self.tokens_used >= self.budget.max_tokens:
+            return f"token budget of {self.budget.max_tokens} reached"
+        return f"time budget of {self.budget.max_seconds:.0f}s reached"
+
+    def char_allowance(self, default: int) -> int:
+        """
+        Prompt size a call site may send. Unchanged while the budget is
+        comfortable; once tight, capped to a share of the remaining tokens.
+        """
+        if not self.budget.max_tokens or self.used_ratio() < TIGHT_RATIO:
+            return default
+        remaining = max(0, self.budget.max_tokens - self.tokens_used)
+        return max(MIN_PROMPT_CHARS, min(default, int(remaining * CHARS_PER_TOKEN * PROMPT_SHARE)))
+
+    def summary(self) -> Dict[str, Any]:
+        sites: Dict[str, Dict[str, Any]] = {}
+        for call in self.calls:
+            s = sites.setdefault(call.site, {"calls": 0, "input_tokens": 0, "output_tokens": 0, "latency_ms": 0.0, "failed": 0})
+            s["calls"] += 1
+            s["input_tokens"] += call.input_tokens
+            s["output_tokens"] += call.output_tokens
+            s["latency_ms"] = round(s["latency_ms"] + call.latency_ms, 1)
+            s["failed"] += 0 if call.ok else 1
+        return {
+            "calls": len(self.calls),
+            "input_tokens": sum(c.input_tokens for c in self.calls),
+            "output_tokens": sum(c.output_tokens for c in self.calls),
+            "latency_ms": round(sum(c.latency_ms for c in self.calls), 1),
+            "estimated": any(c.estimated for c in self.calls),
+            "by_site": sites,
+            "skipped": dict(self.skipped),
+            "counts": dict(self.counts),
+            "budget": asdict(self.budget),
+            "exhausted": self.exhausted,
+        }
+
+    def describe(self) -> str:
+        s = self.summary()
+        text = (
+            f"💰 LLM usage: {s['input_tokens'] + s['output_tokens']:,} tokens "
+            f"({s['input_tokens']:,} in / {s['output_tokens']:,} out) over {s['calls']} calls, "
+            f"{s['latency_ms'] / 1000:.1f}s model time"
+        )
+        if self.skipped:
+            text += f"; budget skipped {', '.join(f'{n} {k}' for k, n in self.skipped.items())}"
+        return text
+
+
+# The mission's ledger; tasks spawned inside a mission inherit it.
+_current: contextvars.ContextVar[Optional[UsageLedger]] = contextvars.ContextVar("usage_ledger", default=None)
+
+
+def current_ledger() -> Optional[UsageLedger]:
+    return _current.get()
+
+
+def begin_mission(run_id: str, payload: Optional[Dict[str, Any]] = None) -> UsageLedger:
+    """Start accounting for the mission running in this task."""
+    ledger = UsageLedger(run_id, MissionBudget.resolve(payload))
+    ledger._token = _current.set(ledger)
+    return ledger
+
+
+async def end_mission(ledger: UsageLedger):
+    """Persist the mission's usage with the run and stop accounting."""
+    if ledger._token is not None:
+        try:
+            _current.reset(ledger._token)
+        except ValueError:
+            _current.set(None) # ended from another context
+        ledger._token = None
+    if not ledger.calls and not ledger.skipped:
+        return
+    logger.info(ledger.describe())
+    await async_db_bridge.save_run_usage(ledger.run_id, ledger.summary())
+    await async_db_bridge.log_step(ledger.run_id, 998, "system", "usage", "INFO", ledger.describe())
+
+
+def char_allowance(default: int) -> int:
+    ledger = _current.get()
+    return ledger.char_allowance(default) if ledger else default
@@ -1,5 +1,6 @@
 import logging
 import hashlib
+import os
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.backends import default_backend
@@ -8,13 +9,30 @@ from configs.settings import settings
 logger = logging.getLogger("orchestrator.vault")
 
 class Vault:
+    @staticmethod
+    def _master_key() -> bytes:
+        raw_key = settings.VAULT_MASTER_KEY.strip().replace('"', '').replace("'", "")
+        return hashlib.sha256(raw_key.encode('utf-8')).digest()
+
+    @staticmethod
+    def encrypt_key(plain_text: str) -> str:
+        """Mirror of the dashboard's encrypt(): AES-256-CBC as 'iv_hex:data_hex'."""
+        iv = os.urandom(16)
+        padder = padding.PKCS7(128).padder()
+        padded_data = padder.update(plain_text.encode('utf-8')) + padder.finalize()
+
+        cipher = Cipher(algorithms.AES(Vault._master_key()), modes.CBC(iv), backend=default_backend())
+        encryptor = cipher.encryptor()
+        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+
+        return f"{iv.hex()}:{encrypted_data.hex()}"
+
     @staticmethod
     def decrypt_key(encrypted_text: str) -> str:
         if not encrypted_text or ":" not in encrypted_text:
             return ""
         try:
-            raw_key = settings.VAULT_MASTER_KEY.strip().replace('"', '').replace("'", "")
-            master_key = hashlib.sha256(raw_key.encode('utf-8')).digest()
+            master_key = Vault._master_key()
 
             iv_hex, encrypted_hex = encrypted_text.split(":")
             iv = bytes.fromhex(iv_hex)
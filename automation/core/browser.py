@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import Optional, Tuple
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+logger = logging.getLogger("orchestrator.browser")
+
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+]
+
+
+async def launch_chromium(headless: bool = True) -> Tuple[Playwright, Browser]:
+    """Start a Playwright driver and Chromium with stealth configuration."""
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=headless, args=LAUNCH_ARGS)
+    except BaseException:
+        await playwright.stop()
+        raise
+    return playwright, browser
+
+
+class BrowserLauncher:
+    """
+    Keeps one headless Chromium launched ahead of the next mission. The
+    mission that takes it owns it (and closes it as before); a replacement
+    is launched in the background. Standbys are bound to the event loop that
+    launched them, so only the worker's own loop - inline missions - enables
+    this; mission processes launch on demand.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._standby: Optional[asyncio.Task] = None
+        self.warm_hits = 0
+        self.cold_launches = 0
+
+    def prelaunch(self):
+        """Start launching a standby browser in the running loop."""
+        self.enabled = True
+        if self._standby is None:
+            self._standby = asyncio.get_running_loop().create_task(launch_chromium(headless=True))
+
+    async def ready(self) -> bool:
+        """Wait for the standby launch; False if it failed."""
+        if self._standby is None:
+            return False
+        try:
+            await asyncio.shield(self._standby)
+            return True
+        except Exception as e:
+            logger.warning(f"🌐 Browser pre-launch failed: {e}")
+            self._standby = None
+            return False
+
+    def _take(self, headless: bool) -> Optional[asyncio.Task]:
+        standby = self._standby
+        if not self.enabled or not headless or standby is None or standby.get_loop() is not asyncio.get_running_loop():
+            return None
+        self._standby = None
+        return standby
+
+    async def acquire(self, headless: bool = True) -> Tuple[Playwright, Browser]:
+        """A launched (driver, browser) pair, from the standby when one is ready or launching."""
+        standby = self._take(headless)
+        if standby is not None:
+            self.prelaunch()
+            try:
+                playwright, browser = await standby
+                if browser.is_connected():
+                    self.warm_hits += 1
+                    return playwright, browser
+                await playwright.stop()
+            except Exception as e:
+                logger.warning(f"🌐 Standby browser unusable, launching fresh: {e}")
+        self.cold_launches += 1
+        return await launch_chromium(headless)
+
+    async def close(self):
+        """Release the standby browser (worker shutdown)."""
+        self.enabled = False
+        standby, self._standby = self._standby, None
+        if standby is None:
+            return
+        try:
+            playwright, browser = await standby
+            await browser.close()
+            await playwright.stop()
+        except Exception as e:
+            logger.debug(f"Standby browser teardown: {e}")
+
+
+browser_launcher = BrowserLauncher()
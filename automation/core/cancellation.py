@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import signal
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from configs.settings import settings
+from data.supabase_async import async_db_bridge
+
+logger = logging.getLogger("orchestrator.cancellation")
+
+CANCELLED = "cancelled"
+DEADLINE = "deadline"
+ABANDONED = "abandoned" # lease lost: another worker owns the run, so nothing is written for it
+
+# Run status and log line written for each stop reason.
+STOP_OUTCOMES = {
+    CANCELLED: ("CANCELLED", "🛑 MISSION_CANCELLED"),
+    DEADLINE: ("FAILED", "⏰ DEADLINE_EXCEEDED"),
+}
+
+# Sent by the parent worker to a mission process holding a cancelled run.
+CANCEL_SIGNAL = signal.SIGUSR1
+
+
+def resolve_deadline(payload: Optional[Dict[str, Any]] = None) -> float:
+    """Wall-clock limit in seconds (0 = none): settings default, payload 'deadline_seconds' overrides."""
+    value = (payload or {}).get("deadline_seconds", settings.MISSION_DEADLINE_SECONDS)
+    try:
+        return max(0.0, float(value or 0))
+    except (TypeError, ValueError):
+        return float(settings.MISSION_DEADLINE_SECONDS)
+
+
+@dataclass
+class MissionScope:
+    """One running mission: its task, deadline timer and why it was stopped."""
+    run_id: str
+    task: asyncio.Task
+    loop: asyncio.AbstractEventLoop
+    deadline: float = 0.0
+    reason: Optional[str] = None
+    _timer: Optional[asyncio.TimerHandle] = field(default=None, repr=False)
+
+    def stop(self, reason: str):
+        """Cancel the mission task once; later requests are ignored so cleanup is not interrupted."""
+        if self.reason or self.task.done():
+            return
+        self.reason = reason
+        logger.warning(f"🛑 Stopping mission {self.run_id} ({reason})")
+        self.task.cancel(msg=f"mission {reason}")
+
+    @property
+    def stopped(self) -> bool:
+        return self.reason is not None
+
+    @property
+    def records_outcome(self) -> bool:
+        """Stopped for a reason this worker reports (not abandoned to another worker)."""
+        return self.reason in STOP_OUTCOMES
+
+
+class MissionRegistry:
+    """
+    Missions running in this process, addressable by run_id.
+
+    Cancellation is cooperative: the mission task is cancelled, so whatever
+    it awaits - a Playwright wait, a crawl step, a provider call - raises
+    CancelledError, and the mission's own handlers close browsers and write
+    the final status. Cancel requests that cross processes leave a marker
+    file and signal the mission process (see MissionExecutor.cancel).
+    """
+
+    def __init__(self, marker_dir: Path):
+        self.marker_dir = Path(marker_dir)
+        self._scopes: Dict[str, MissionScope] = {}
+        self._lock = threading.Lock()
+
+    def _marker(self, run_id: str) -> Path:
+        return self.marker_dir / f"{run_id}.cancel"
+
+    def enter(self, run_id: str, deadline: float = 0.0) -> MissionScope:
+        """Register the current task as `run_id`'s mission and arm its deadline."""
+        loop = asyncio.get_running_loop()
+        scope = MissionScope(run_id, asyncio.current_task(), loop, deadline)
+        with self._lock:
+            self._scopes[run_id] = scope
+        if deadline:
+            scope._timer = loop.call_later(deadline, scope.stop, DEADLINE)
+        reason = self.take_marker(run_id)
+        if reason:
+            scope.stop(reason) # stopped while it was still queued
+        return scope
+
+    def exit(self, scope: MissionScope):
+        if scope._timer:
+            scope._timer.cancel()
+        with self._lock:
+            if self._scopes.get(scope.run_id) is scope:
+                del self._scopes[scope.run_id]
+        self.take_marker(scope.run_id) # a request that arrived as the mission ended
+
+    def cancel(self, run_id: str, reason: str = CANCELLED) -> bool:
+        """Stop a mission running in this process; safe to call from any thread."""
+        with self._lock:
+            scope = self._scopes.get(run_id)
+        if not scope:
+            return False
+        scope.loop.call_soon_threadsafe(scope.stop, reason)
+        return True
+
+    def mark(self, run_id: str, reason: str = CANCELLED):
+        """Leave a stop request for a mission in another process."""
+        self.marker_dir.mkdir(parents=True, exist_ok=True)
+        self._marker(run_id).write_text(reason)
+
+    def take_marker(self, run_id: str) -> Optional[str]:
+        """Consume a stop request; its reason, or None."""
+        marker = self._marker(run_id)
+        try:
+            reason = marker.read_text().strip() or CANCELLED
+            marker.unlink()
+            return reason
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Cancel marker for {run_id} unreadable: {e}")
+            return None
+
+    def cancel_marked(self, *_):
+        """Cancel-signal callback in mission processes (runs on the mission loop): stop every local mission that has a marker."""
+        with self._lock:
+            run_ids = list(self._scopes)
+        for run_id in run_ids:
+            reason = self.take_marker(run_id)
+            if reason:
+                self.cancel(run_id, reason)
+
+    def active(self) -> Dict[str, Optional[str]]:
+        with self._lock:
+            return {run_id: scope.reason for run_id, scope in self._scopes.items()}
+
+
+async def record_stopped_run(run_id: str, reason: Optional[str], detail: str = ""):
+    """Write the final status and log line of a cancelled or timed-out run."""
+    status, headline = STOP_OUTCOMES.get(reason, STOP_OUTCOMES[CANCELLED])
+    message = f"{headline}: {detail}" if detail else headline
+    logger.warning(f"{message} [{run_id}]")
+    await async_db_bridge.log_step(run_id, 999, "system", "cancel", status, message)
+    await async_db_bridge.update_run_status(run_id, status)
+
+
+async def record_stop(scope: MissionScope, detail: str = ""):
+    """Final status of a stopped mission. Call after absorb_stop()."""
+    if scope.reason == DEADLINE:
+        detail = f"limit of {scope.deadline:.0f}s reached" + (f"; {detail}" if detail else "")
+    await record_stopped_run(scope.run_id, scope.reason, detail)
+
+
+def absorb_stop():
+    """Clear the task's pending cancellation so partial results can still be awaited."""
+    task = asyncio.current_task()
+    if task is not None and task.cancelling():
+        task.uncancel()
+
+
+mission_registry = MissionRegistry(Path(settings.CHECKPOINTS_DIR) / "cancel")
@@ -0,0 +1,241 @@
+import asyncio
+import io
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from playwright.async_api import Page
+
+from automation.core.tracing import TraceRecorder
+from data.supabase_async import async_db_bridge
+
+if TYPE_CHECKING:
+    from PIL import Image # imported by the first frame encoded
+
+logger = logging.getLogger("orchestrator.capture")
+
+# Typical 1280x720 PNG viewport frame, used to estimate frames never taken.
+ESTIMATED_PNG_BYTES = 250_000
+
+# 16x16 dHash (256 bits); 8x8 is too coarse to notice an inline error message.
+HASH_SIZE = 16
+
+# Frames that document a failure are kept under every policy.
+FAILURE_REASONS = frozenset({"error"})
+
+# Frames the trace policy links (lazily, from the mission trace) instead of dropping.
+TRACE_REASONS = frozenset({"error", "healed", "final"})
+
+CAPTURE_POLICIES = ("always", "on-change", "failure-only", "trace")
+
+IMAGE_FORMATS: Dict[str, Tuple[str, str, str]] = {
+    # name: (Pillow format, file extension, content type)
+    "png": ("PNG", "png", "image/png"),
+    "jpeg": ("JPEG", "jpg", "image/jpeg"),
+    "webp": ("WEBP", "webp", "image/webp"),
+}
+
+
+@dataclass(frozen=True)
+class CapturePolicy:
+    """When to keep a frame and how to encode it."""
+    name: str = "always" # always | on-change | failure-only | trace
+    image_format: str = "png"
+    quality: int = 75
+    thumbnail_width: int = 0 # 0 = no thumbnail
+    hash_distance: int = 1 # max dHash bit difference treated as "unchanged"
+
+    def wants(self, reason: str) -> bool:
+        return self.name != "failure-only" or reason in FAILURE_REASONS
+
+
+def resolve_capture_policy(name: Optional[str], image_format: str = "png", quality: int = 75,
+                           thumbnail_width: int = 0, hash_distance: int = 1) -> CapturePolicy:
+    """Build a policy from settings/payload values, falling back to 'always'."""
+    key = (name or "always").strip().lower()
+    if key not in CAPTURE_POLICIES:
+        logger.warning(f"Unknown capture policy '{name}', using 'always'")
+        key = "always"
+
+    fmt = (image_format or "png").strip().lower().replace("jpg", "jpeg")
+    if fmt not in IMAGE_FORMATS:
+        logger.warning(f"Unknown capture format '{image_format}', using 'png'")
+        fmt = "png"
+
+    return CapturePolicy(key, fmt, max(1, min(quality, 100)), max(0, thumbnail_width), max(0, hash_distance))
+
+
+def dhash(image: "Image.Image", size: int = HASH_SIZE) -> int:
+    """size*size-bit difference hash: robust to re-encoding, sensitive to layout change."""
+    from PIL import Image
+
+    gray = image.convert("L").resize((size + 1, size), Image.Resampling.BILINEAR)
+    pixels = list(gray.getdata())
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (left > right)
+    return bits
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class CaptureStats:
+    requested: int = 0
+    uploaded: int = 0
+    skipped_policy: int = 0
+    skipped_duplicate: int = 0
+    baseline_bytes: int = 0 # what uncompressed-policy PNG uploads would have cost
+    uploaded_bytes: int = 0
+    measured_png_bytes: int = 0
+    measured_frames: int = 0
+
+    @property
+    def uploads_avoided(self) -> int:
+        return self.skipped_policy + self.skipped_duplicate
+
+    @property
+    def bytes_avoided(self) -> int:
+        return max(0, self.baseline_bytes - self.uploaded_bytes)
+
+    def estimate_png(self) -> int:
+        if self.measured_frames:
+            return self.measured_png_bytes // self.measured_frames
+        return ESTIMATED_PNG_BYTES
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "requested": self.requested,
+            "uploaded": self.uploaded,
+            "skipped_policy": self.skipped_policy,
+            "skipped_duplicate": self.skipped_duplicate,
+            "uploads_avoided": self.uploads_avoided,
+            "baseline_bytes": self.baseline_bytes,
+            "uploaded_bytes": self.uploaded_bytes,
+            "bytes_avoided": self.bytes_avoided,
+        }
+
+
+def _encode(png_bytes: bytes, policy: CapturePolicy) -> Tuple[int, str, bytes, Optional[bytes]]:
+    """Hash, re-encode and thumbnail one frame (CPU-bound; runs off the loop)."""
+    from PIL import Image
+
+    fmt = policy.image_format
+    pil_format = IMAGE_FORMATS[fmt][0]
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        frame_hash = dhash(image)
+
+        encoded = png_bytes
+        if fmt != "png":
+            buffer = io.BytesIO()
+            image.convert("RGB").save(buffer, pil_format, quality=policy.quality)
+            encoded = buffer.getvalue()
+            # Flat UI frames sometimes compress better losslessly.
+            if len(encoded) >= len(png_bytes):
+                fmt, encoded = "png", png_bytes
+
+        thumbnail = None
+        if policy.thumbnail_width and image.width > policy.thumbnail_width:
+            thumb = image.convert("RGB")
+            thumb.thumbnail((policy.thumbnail_width, policy.thumbnail_width * image.height // image.width))
+            buffer = io.BytesIO()
+            # Stored next to the frame under the same extension, so match its format.
+            thumb_format = IMAGE_FORMATS[fmt][0]
+            thumb.save(buffer, thumb_format, **({} if thumb_format == "PNG" else {"quality": policy.quality}))
+            thumbnail = buffer.getvalue()
+
+    return frame_hash, fmt, encoded, thumbnail
+
+
+class ScreenshotCapturer:
+    """
+    Applies a CapturePolicy to every evidence frame of a mission.
+
+    'on-change' compares each frame's perceptual hash with the last uploaded
+    frame and reuses that URL for near-duplicates, so every log row still
+    points at an accurate picture. 'trace' takes no frames at all: the
+    mission trace records them, and failure/healed frames become lazy links.
+    """
+
+    def __init__(self, run_id: str, policy: CapturePolicy, stats: Optional[CaptureStats] = None,
+                 trace: Optional[TraceRecorder] = None):
+        self.run_id = run_id
+        self.policy = policy
+        self.stats = stats or CaptureStats()
+        self.trace = trace if policy.name == "trace" else None
+        self._last_hash: Optional[int] = None
+        self._last_url: Optional[str] = None
+        self.last_png: Optional[bytes] = None # raw frame of the latest capture, for visual diffing
+
+    def fork(self) -> "ScreenshotCapturer":
+        """
+        Capturer for another page of the same mission; stats are shared.
+        Only the mission's own context is traced, so forks keep failure frames.
+        """
+        policy = self.policy
+        if policy.name == "trace":
+            policy = CapturePolicy("failure-only", policy.image_format, policy.quality, policy.thumbnail_width, policy.hash_distance)
+        return ScreenshotCapturer(self.run_id, policy, self.stats)
+
+    async def capture(self, page: Optional[Page], reason: str = "step") -> Optional[str]:
+        if not page:
+            return None
+
+        self.stats.requested += 1
+        self.last_png = None
+        if self.trace and self.trace.active:
+            self.stats.skipped_policy += 1
+            self.stats.baseline_bytes += self.stats.estimate_png()
+            return self.trace.frame_url() if reason in TRACE_REASONS else None
+        if not self.policy.wants(reason):
+            self.stats.skipped_policy += 1
+            self.stats.baseline_bytes += self.stats.estimate_png()
+            return None
+
+        try:
+            png_bytes = await page.screenshot(type="png", full_page=False)
+        except Exception as e:
+            logger.warning(f"Screenshot capture failed: {e}")
+            return None
+
+        self.last_png = png_bytes
+        self.stats.baseline_bytes += len(png_bytes)
+        self.stats.measured_png_bytes += len(png_bytes)
+        self.stats.measured_frames += 1
+
+        try:
+            frame_hash, fmt, encoded, thumbnail = await asyncio.to_thread(_encode, png_bytes, self.policy)
+        except Exception as e:
+            logger.warning(f"Screenshot encoding failed, keeping PNG: {e}")
+            frame_hash, fmt, encoded, thumbnail = None, "png", png_bytes, None
+
+        if (
+            self.policy.name == "on-change"
+            and frame_hash is not None
+            and self._last_hash is not None
+            and self._last_url
+            and hamming(frame_hash, self._last_hash) <= self.policy.hash_distance
+        ):
+            self.stats.skipped_duplicate += 1
+            return self._last_url
+
+        _, ext, content_type = IMAGE_FORMATS[fmt]
+        url = await async_db_bridge.upload_screenshot(encoded, self.run_id, content_type, ext, thumbnail)
+        if url:
+            self.stats.uploaded += 1
+            self.stats.uploaded_bytes += len(encoded) + len(thumbnail or b"")
+            self._last_hash, self._last_url = frame_hash, url
+        return url
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"📸 Capture policy '{self.policy.name}' ({self.policy.image_format}): "
+            f"{s.uploaded}/{s.requested} frames uploaded, {s.uploads_avoided} uploads and "
+            f"{s.bytes_avoided / 1_048_576:.1f} MB avoided"
+        )
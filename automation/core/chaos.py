@@ -0,0 +1,235 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ai.models import ActionType, TestPlan, TestStep
+from automation.core.runner import AutomationRunner
+from data.checkpoint import checkpoint_store
+from data.supabase_async import async_db_bridge
+
+logger = logging.getLogger("orchestrator.chaos")
+
+
+@dataclass
+class AttackVector:
+    """One independent attack: setup navigation plus its inputs, submit and verify."""
+    index: int
+    setup: List[TestStep]
+    steps: List[TestStep]
+
+    @property
+    def label(self) -> str:
+        for step in self.steps:
+            if step.action == ActionType.INPUT:
+                return step.description
+        return self.steps[0].description if self.steps else f"Vector {self.index}"
+
+
+@dataclass
+class VectorResult:
+    index: int
+    label: str
+    status: str = "PASSED"
+    failed_step: Optional[int] = None
+    error: Optional[str] = None
+    healed: int = 0
+    seconds: float = 0.0
+    healing_audit: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def split_attack_vectors(plan: TestPlan) -> List[AttackVector]:
+    """
+    Group a chaos plan into vectors that can run in isolation.
+
+    Navigation steps become the setup of every vector that follows them.
+    A vector closes after its verify_text, or when a new input starts after
+    a submit click without an intervening verify. The plan's closing
+    verify_text confirms page state for every vector that lacks its own.
+    """
+    vectors: List[AttackVector] = []
+    setup: List[TestStep] = []
+    current: List[TestStep] = []
+
+    def close():
+        if any(s.action != ActionType.WAIT for s in current):
+            vectors.append(AttackVector(len(vectors) + 1, list(setup), list(current)))
+        current.clear()
+
+    for step in plan.steps:
+        if step.action in (ActionType.NAVIGATE, ActionType.RELOAD):
+            close()
+            setup = [step]
+            continue
+
+        submitted = any(s.action == ActionType.CLICK for s in current)
+        if step.action == ActionType.INPUT and submitted:
+            close()
+
+        current.append(step)
+        if step.action == ActionType.VERIFY_TEXT:
+            close()
+
+    close()
+
+    final = plan.steps[-1] if plan.steps else None
+    if final and final.action == ActionType.VERIFY_TEXT:
+        for vector in vectors:
+            if not any(s.action == ActionType.VERIFY_TEXT for s in vector.steps):
+                vector.steps.append(final)
+    return vectors
+
+
+class ChaosExecutor:
+    """
+    Runs Chaos Protocol vectors concurrently, each in its own browser context,
+    so one payload that corrupts page state cannot poison the others.
+    """
+
+    def __init__(self, runner: AutomationRunner, concurrency: int = 4, vector_timeout: float = 120):
+        self.runner = runner
+        self.concurrency = max(1, concurrency)
+        self.vector_timeout = vector_timeout
+        self.results: Dict[int, VectorResult] = {}
+
+    def _checkpoint(self, plan: TestPlan):
+        checkpoint_store.save(self.runner.run_id, {
+            "mode": "chaos",
+            "phase": "chaos",
+            "plan": plan.model_dump(mode="json"),
+            "vector_results": [r.as_dict() for r in self.results.values()],
+        })
+
+    async def _run_vector(self, vector: AttackVector) -> VectorResult:
+        result = VectorResult(index=vector.index, label=vector.label)
+        started = time.perf_counter()
+
+        worker = AutomationRunner(
+            run_id=self.runner.run_id,
+            user_id=self.runner.user_id,
+            provider=self.runner.provider,
+            model=self.runner.model,
+            api_key=self.runner.api_key,
+            base_url=self.runner.base_url,
+        )
+        worker.blocker = self.runner.blocker
+        worker.capture = self.runner.capture.fork()
+        context = None
+        current: Optional[TestStep] = None
+
+        try:
+            # One budget for the whole vector, so a slow one frees its slot on time.
+            async with asyncio.timeout(self.vector_timeout or None):
+                context, worker.page = await self.runner.new_isolated_page()
+                if not vector.setup and self.runner.base_url:
+                    await worker.page.goto(self.runner.base_url, wait_until="networkidle", timeout=30000)
+                for step in vector.setup + vector.steps:
+                    current = step
+                    tagged = step.model_copy(update={"description": f"[V{vector.index}] {step.description}"})
+                    try:
+                        await worker.execute_step(tagged)
+                    except Exception as e:
+                        result.status = "FAILED"
+                        result.failed_step = step.step_id
+                        result.error = str(e) or type(e).__name__
+                        break
+        except TimeoutError:
+            result.status = "FAILED"
+            result.failed_step = current.step_id if current else None
+            result.error = f"Vector exceeded {self.vector_timeout:.0f}s"
+        except Exception as e:
+            result.status = "FAILED"
+            result.error = f"Context setup failed: {e}"
+        finally:
+            if context:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+        result.healed = len(worker.healing_audit)
+        result.healing_audit = worker.healing_audit
+        if result.status == "PASSED" and result.healed:
+            result.status = "HEALED"
+        result.seconds = round(time.perf_counter() - started, 2)
+        return result
+
+    async def execute(self, plan: TestPlan, checkpoint: Optional[Dict[str, Any]] = None):
+        """Fan the plan out across vectors, then aggregate into the run."""
+        if not self.runner.browser:
+            await self.runner.start_browser(headless=True, open_page=False)
+
+        run_id = self.runner.run_id
+        vectors = split_attack_vectors(plan)
+
+        for raw in (checkpoint or {}).get("vector_results") or []:
+            self.results[raw["index"]] = VectorResult(**raw)
+        pending = [v for v in vectors if v.index not in self.results]
+
+        await async_db_bridge.log_step(
+            run_id, 0, "system", "chaos", "RUNNING",
+            f"🔥 Chaos fan-out: {len(vectors)} vectors, {len(pending)} pending, {self.concurrency} concurrent"
+        )
+
+        gate = asyncio.Semaphore(self.concurrency)
+        lock = asyncio.Lock()
+
+        async def guarded(vector: AttackVector):
+            async with gate:
+                result = await self._run_vector(vector)
+            async with lock:
+                self.results[vector.index] = result
+                await asyncio.to_thread(self._checkpoint, plan)
+            await async_db_bridge.log_step(
+                run_id=run_id,
+                role="attacker",
+                action="chaos_vector",
+                status=result.status,
+                message=f"[V{vector.index}] {result.label}: {result.status}" + (f" - {result.error}" if result.error else ""),
+                details=json.dumps(result.as_dict())
+            )
+
+        try:
+            await asyncio.gather(*(guarded(v) for v in pending))
+
+            ordered = [self.results[k] for k in sorted(self.results)]
+            failed = [r for r in ordered if r.status == "FAILED"]
+            healed = sum(r.healed for r in ordered)
+
+            summary = f"🔥 Chaos complete: {len(ordered) - len(failed)}/{len(ordered)} vectors held."
+            if failed:
+                summary += f" Breaking points: {', '.join(f'V{r.index}' for r in failed)}."
+            if healed:
+                summary += f" Self-healing resolved {healed} UI discrepancies."
+
+            await async_db_bridge.log_step(
+                run_id=run_id,
+                role="system",
+                action="chaos_summary",
+                status="FAILED" if failed else "COMPLETED",
+                message=summary,
+                details=json.dumps({
+                    "vectors": len(ordered),
+                    "failed": len(failed),
+                    "healed": healed,
+                    "concurrency": self.concurrency,
+                    "results": [r.as_dict() for r in ordered],
+                })
+            )
+            await async_db_bridge.update_run_status(run_id, "FAILED" if failed else "COMPLETED")
+            await asyncio.to_thread(checkpoint_store.clear, run_id)
+
+        except Exception as e:
+            await self.runner._handle_final_crash(e)
+            await async_db_bridge.update_run_status(run_id, "FAILED")
+            await asyncio.to_thread(checkpoint_store.clear, run_id)
+        finally:
+            await self.runner.log_network_savings()
+            await self.runner.log_capture_savings()
+            await self.runner.finish_trace()
+            await self.runner.stop_browser()
@@ -0,0 +1,525 @@
+import asyncio
+import importlib
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import resource
+import signal
+import threading
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Any, Awaitable, Dict, List, Optional
+
+from automation.core.cancellation import (
+    ABANDONED, CANCEL_SIGNAL, CANCELLED, DEADLINE, mission_registry, record_stopped_run, resolve_deadline,
+)
+from configs.settings import bootstrap_system, settings
+from data.settings_cache import user_settings_cache
+from data.supabase_async import async_db_bridge
+
+logger = logging.getLogger("orchestrator.executor")
+
+# Mission entry points ("module:coroutine function") by mode, imported in the mission process.
+MISSION_MODES = {
+    "scout": "main:run_scout_mode",
+    "sniper": "main:run_sniper_mode",
+}
+
+# Set inside mission processes by _init_mission_process.
+_event_channel: Optional["_EventChannel"] = None
+
+
+class _EventChannel:
+    """Child end of a mission process's pipe: thread-safe, and a valid QueueHandler target."""
+
+    def __init__(self, conn: Connection):
+        self._conn = conn
+        self._lock = threading.Lock()
+
+    def put_nowait(self, item: Any):
+        with self._lock:
+            self._conn.send(item)
+
+
+def _emit(event: Dict[str, Any]):
+    if _event_channel is None:
+        return
+    try:
+        _event_channel.put_nowait({**event, "pid": os.getpid(), "ts": time.time()})
+    except Exception:
+        pass
+
+
+def _init_mission_process(channel: _EventChannel, log_level: int):
+    """
+    Runs once per spawned mission process. Log records are forwarded to the
+    parent over the process's pipe so the worker keeps a single log stream.
+    """
+    global _event_channel
+    _event_channel = channel
+
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(channel)]
+    root.setLevel(log_level)
+
+    # Handled on the mission's loop while one runs (_cancellable); a signal
+    # between missions is dropped, its marker is picked up when the run starts.
+    signal.signal(CANCEL_SIGNAL, signal.SIG_IGN)
+
+    bootstrap_system()
+
+    # A mission process runs one mission at a time; rendering inline avoids
+    # nesting a process pool per mission process.
+    settings.REPORT_RENDER_WORKERS = 0
+
+
+def _warm_mission_process(providers: List[str]) -> int:
+    """Import the mission stack (and provider SDKs) in a fresh process ahead of its first mission."""
+    import main # noqa: F401
+    from ai.provider import AIProvider
+
+    AIProvider.preload(providers)
+    return os.getpid()
+
+
+async def _cancellable(mission: Awaitable[Any]):
+    """
+    Await a mission with the cancel signal routed onto its event loop. The
+    parent leaves a cancel marker, then signals; the handler runs as a loop
+    callback rather than inside a signal frame, so it cannot interrupt (and
+    deadlock on) a registry lock held by the mission.
+    """
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(CANCEL_SIGNAL, mission_registry.cancel_marked)
+    try:
+        await mission
+    finally:
+        loop.remove_signal_handler(CANCEL_SIGNAL)
+        signal.signal(CANCEL_SIGNAL, signal.SIG_IGN)
+
+
+def _run_mission_process(mode: str, entrypoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Runs one mission inside its mission process."""
+    run_id = payload.get("run_id")
+    started = time.perf_counter()
+    _emit({"type": "started", "run_id": run_id, "mode": mode})
+
+    try:
+        module, _, name = entrypoint.partition(":")
+        mission = getattr(importlib.import_module(module), name)
+        asyncio.run(_cancellable(mission(payload)))
+        outcome = "finished"
+    except BaseException as e:
+        _emit({"type": "exception", "run_id": run_id, "error": str(e)})
+        outcome = "failed"
+
+    result = {
+        "type": outcome,
+        "run_id": run_id,
+        "seconds": round(time.perf_counter() - started, 2),
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+    _emit(result)
+    return result
+
+
+def _receive(conn: Connection, tasks: "queue.Queue"):
+    """
+    Inbox thread of a mission process: cache invalidations apply at once,
+    even mid-mission; tasks are queued for the main thread.
+    """
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            message = None # the parent went away
+        if message is not None and message[0] == "invalidate":
+            user_settings_cache.invalidate(message[1])
+            continue
+        tasks.put(message)
+        if message is None:
+            return
+
+
+def _mission_process_main(conn: Connection, log_level: int):
+    """Mission process loop: run what the parent sends, one task at a time, until told to exit."""
+    _init_mission_process(_EventChannel(conn), log_level)
+    tasks: "queue.Queue" = queue.Queue()
+    threading.Thread(target=_receive, args=(conn, tasks), name="mission-inbox", daemon=True).start()
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        kind, *args = task
+        if kind == "warm":
+            try:
+                _warm_mission_process(*args)
+            except Exception as e:
+                _emit({"type": "exception", "run_id": None, "error": f"warm-up: {e}"})
+            _emit({"type": "warmed", "run_id": None})
+        else:
+            _run_mission_process(*args)
+
+
+class _MissionProcess:
+    """Parent-side handle of one spawned mission process and its pipe."""
+
+    def __init__(self, ctx, log_level: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_mission_process_main, args=(child_conn, log_level), name="mission", daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.pid: int = self.process.pid
+        self.missions = 0
+        self.run_id: Optional[str] = None
+        self.exited = False # set on the loop once the drain thread saw it exit
+        self.eof = False # set by the drain thread
+
+    def send(self, task: Any) -> bool:
+        try:
+            self.conn.send(task)
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def retire(self):
+        """Let the process exit after its current task."""
+        self.send(None)
+
+    def signal(self, signum: int):
+        try:
+            os.kill(self.pid, signum)
+        except ProcessLookupError:
+            pass
+
+
+class MissionExecutor:
+    """
+    Runs Sniper/Scout missions in spawned worker processes, one mission per
+    process at a time.
+
+    Each process owns its own event loop and Playwright driver, so a CPU-heavy
+    or misbehaving mission only stalls its own core, and a process that dies
+    (e.g. Chromium OOM-killed) only fails the mission it was running: that
+    mission is re-submitted once to a fresh process, where its checkpoint
+    lets it resume. Idle processes are reused and recycled after
+    MISSIONS_PER_PROCESS missions to cap leaked memory.
+
+    Cancelled missions get MISSION_CANCEL_GRACE_SECONDS to publish partial
+    results and close their browser before the process is killed; the same
+    reaper backs up mission deadlines.
+    """
+
+    MAX_ATTEMPTS = 2
+
+    def __init__(self, processes: int = 0, missions_per_process: int = 20, modes: Optional[Dict[str, str]] = None):
+        self.processes = processes or os.cpu_count() or 1
+        self.missions_per_process = max(1, missions_per_process)
+        self.modes = modes or MISSION_MODES
+        self._ctx = multiprocessing.get_context("spawn")
+        self._log_level = logging.getLogger().level or logging.INFO
+        self._slots = asyncio.Semaphore(self.processes)
+        self._procs: Dict[int, _MissionProcess] = {} # every live process, shared with the drain thread
+        self._procs_lock = threading.Lock()
+        self._idle: List[_MissionProcess] = []
+        self._waiters: Dict[int, asyncio.Future] = {} # pid -> outcome of the task it is running
+        self._drain_thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.active: Dict[str, Dict[str, Any]] = {}
+        self.completed = 0
+        self.crashed = 0
+
+    def start(self):
+        if self._drain_thread and self._drain_thread.is_alive():
+            return
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        self._stopping.clear()
+        self._drain_thread = threading.Thread(target=self._drain_events, name="mission-events", daemon=True)
+        self._drain_thread.start()
+        logger.info(f"⚙️ Mission executor online: {self.processes} processes, recycle every {self.missions_per_process} missions")
+
+    async def warm(self, providers: List[str]) -> int:
+        """Spawn the executor's processes and load the mission stack in each; returns processes warmed."""
+        self._loop = asyncio.get_running_loop()
+        self.start()
+        pids = await asyncio.gather(*(self._warm_one(providers) for _ in range(self.processes)))
+        return sum(1 for pid in pids if pid)
+
+    async def _warm_one(self, providers: List[str]) -> Optional[int]:
+        async with self._slots:
+            proc = self._checkout()
+            outcome = await self._call(proc, ("warm", providers))
+            if outcome["type"] == "exited":
+                return None
+            self._idle.append(proc)
+            return proc.pid
+
+    def broadcast(self, message: Any) -> int:
+        """Send a control message (e.g. ("invalidate", user_id)) to every live mission process."""
+        with self._procs_lock:
+            procs = list(self._procs.values())
+        return sum(proc.send(message) for proc in procs)
+
+    def shutdown(self):
+        """Stop every mission process; leased runs in flight are resumed elsewhere."""
+        self._stopping.set()
+        with self._procs_lock:
+            procs = list(self._procs.values())
+        for proc in procs:
+            proc.retire()
+            if proc.run_id:
+                proc.process.terminate()
+        self._idle.clear()
+
+    # --- process bookkeeping (event loop) ---
+
+    def _spawn(self) -> _MissionProcess:
+        proc = _MissionProcess(self._ctx, self._log_level)
+        with self._procs_lock:
+            self._procs[proc.pid] = proc
+        return proc
+
+    def _checkout(self) -> _MissionProcess:
+        """An idle live process, or a new one. Call while holding a slot."""
+        while self._idle:
+            proc = self._idle.pop()
+            if not proc.exited and proc.process.is_alive():
+                return proc
+        return self._spawn()
+
+    def _checkin(self, proc: _MissionProcess):
+        proc.run_id = None
+        if proc.missions >= self.missions_per_process:
+            proc.retire()
+        else:
+            self._idle.append(proc)
+
+    async def _call(self, proc: _MissionProcess, task: Any) -> Dict[str, Any]:
+        """Hand `task` to the process and wait for its outcome event, or its exit."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[proc.pid] = future
+        if proc.exited or not proc.send(task):
+            self._waiters.pop(proc.pid, None)
+            return {"type": "exited", "exitcode": proc.process.exitcode}
+        try:
+            return await future
+        finally:
+            self._waiters.pop(proc.pid, None)
+
+    def _resolve(self, proc: _MissionProcess, event: Dict[str, Any]):
+        if event["type"] == "exited":
+            proc.exited = True
+            if proc in self._idle:
+                self._idle.remove(proc)
+            if proc.run_id:
+                logger.error(f"💥 Mission process {proc.pid} died (exit {event.get('exitcode')}) running {proc.run_id}")
+        future = self._waiters.get(proc.pid)
+        if future is not None and not future.done():
+            future.set_result(event)
+
+    # --- drain thread ---
+
+    def _drain_events(self):
+        """Replay child log records and apply lifecycle events in the parent."""
+        while not self._stopping.is_set():
+            with self._procs_lock:
+                procs = list(self._procs.values())
+            if not procs:
+                self._stopping.wait(0.5)
+                continue
+
+            handles = [p.process.sentinel for p in procs] + [p.conn for p in procs if not p.eof]
+            try:
+                ready = wait(handles, timeout=0.5)
+            except OSError:
+                continue
+            for proc in procs:
+                if proc.conn in ready:
+                    self._read(proc)
+                if proc.process.sentinel in ready:
+                    self._read(proc) # whatever it sent before exiting
+                    self._exited(proc)
+
+    def _read(self, proc: _MissionProcess):
+        while not proc.eof:
+            try:
+                if not proc.conn.poll():
+                    return
+                item = proc.conn.recv()
+            except Exception:
+                # EOF, or a message cut short by a killed process: only this pipe is affected.
+                proc.eof = True
+                return
+            self._handle(proc, item)
+
+    def _exited(self, proc: _MissionProcess):
+        with self._procs_lock:
+            self._procs.pop(proc.pid, None)
+        proc.process.join(timeout=1) # already exited; collects the exit code
+        proc.conn.close()
+        self._on_loop(self._resolve, proc, {"type": "exited", "exitcode": proc.process.exitcode})
+
+    def _on_loop(self, fn, *args):
+        """Schedule fn on the worker loop from the drain thread (a no-op once the loop is gone)."""
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            pass # loop closed during shutdown
+
+    def _handle(self, proc: _MissionProcess, item: Any):
+        if isinstance(item, logging.LogRecord):
+            logging.getLogger(item.name).handle(item)
+            return
+
+        run_id = item.get("run_id")
+        kind = item.get("type")
+        if kind == "started" and run_id in self.active:
+            entry = self.active[run_id]
+            entry["started_at"] = item.get("ts")
+            if entry.get("deadline"):
+                # Backstop for a mission too wedged to honour its own deadline.
+                delay = entry["deadline"] + 2 * settings.MISSION_CANCEL_GRACE_SECONDS
+                self._on_loop(self._arm_reaper, run_id, proc.pid, delay, DEADLINE)
+        elif kind == "exception":
+            logger.error(f"💥 Mission {run_id} raised in pid {proc.pid}: {item.get('error')}")
+        elif kind in ("finished", "failed"):
+            logger.info(
+                f"🏁 Mission {run_id} done in pid {proc.pid} "
+                f"({item.get('seconds')}s, peak RSS {item.get('max_rss_kb', 0) // 1024} MB)"
+            )
+        if kind in ("finished", "failed", "warmed"):
+            self._on_loop(self._resolve, proc, item)
+
+    # --- missions ---
+
+    async def submit(self, mode: str, payload: Dict[str, Any]) -> asyncio.Task:
+        """Queue a mission; returns its supervising task without waiting on it."""
+        self._loop = asyncio.get_running_loop()
+        self.start()
+
+        run_id = payload.get("run_id")
+        entry = self.active[run_id] = {
+            "mode": mode, "state": "queued", "queued_at": time.time(), "attempts": 0,
+            "deadline": resolve_deadline(payload),
+        }
+        entry["task"] = asyncio.create_task(self._supervise(mode, payload))
+        return entry["task"]
+
+    async def cancel(self, run_id: str, reason: str = CANCELLED) -> bool:
+        """
+        Stop a mission of this executor; False if it is not queued or running
+        here. Its supervising task finishes once the mission process has
+        stopped the mission, or has been killed after the grace period.
+        """
+        entry = self.active.get(run_id)
+        if not entry:
+            return False
+        entry["cancelled"] = reason
+        if entry["state"] == "queued":
+            entry["task"].cancel() # never reached a process; the supervisor records it
+            return True
+
+        mission_registry.mark(run_id, reason) # read by the process on signal, or when the mission starts
+        proc = self._owner(run_id, entry.get("pid"))
+        if proc:
+            proc.signal(CANCEL_SIGNAL)
+        self._arm_reaper(run_id, entry.get("pid"), 2 * settings.MISSION_CANCEL_GRACE_SECONDS, reason)
+        return True
+
+    def _arm_reaper(self, run_id: str, pid: Optional[int], delay: float, reason: str):
+        asyncio.get_running_loop().call_later(delay, self._reap, run_id, pid, reason)
+
+    def _owner(self, run_id: str, pid: Optional[int]) -> Optional[_MissionProcess]:
+        """The live process running `run_id` as `pid`; None once it finished, died or moved."""
+        with self._procs_lock:
+            proc = self._procs.get(pid) if pid else None
+        return proc if proc is not None and proc.run_id == run_id else None
+
+    def _reap(self, run_id: str, pid: Optional[int], reason: str):
+        """Kill the mission's own process once it outlived its cancel grace period."""
+        entry = self.active.get(run_id)
+        if not entry or entry.get("state") != "running":
+            return
+        proc = self._owner(run_id, pid or entry.get("pid"))
+        if proc is None or proc.pid != entry.get("pid"):
+            return # the run moved to another process since the reaper was armed
+        entry.setdefault("cancelled", reason)
+        logger.error(f"🔪 Mission {run_id} ignored its {reason} - killing pid {proc.pid}")
+        proc.signal(signal.SIGKILL)
+
+    async def _supervise(self, mode: str, payload: Dict[str, Any]):
+        run_id = payload.get("run_id")
+        entry = self.active[run_id]
+        entrypoint = self.modes.get(mode) or self.modes["sniper"]
+        try:
+            while True:
+                async with self._slots:
+                    proc = self._checkout()
+                    proc.run_id = run_id
+                    proc.missions += 1
+                    entry.update({"state": "running", "pid": proc.pid, "attempts": entry["attempts"] + 1})
+                    try:
+                        outcome = await self._call(proc, ("run", mode, entrypoint, payload))
+                    except asyncio.CancelledError:
+                        # Nobody is left to supervise the mission: it must not keep running unseen.
+                        proc.process.kill()
+                        raise
+                    if outcome["type"] != "exited":
+                        self._checkin(proc)
+                        self.completed += 1
+                        return
+
+                # The process died under this mission; no other mission was affected.
+                self.crashed += 1
+                stopped = entry.get("cancelled")
+                if stopped == ABANDONED:
+                    return # the run belongs to another worker now
+                if stopped:
+                    # Killed by the reaper: the mission did not get to write its own status.
+                    await record_stopped_run(run_id, stopped, "mission process killed after the grace period")
+                    return
+                if entry["attempts"] >= self.MAX_ATTEMPTS:
+                    logger.error(f"💥 Mission {run_id} lost its process twice - marking FAILED")
+                    await async_db_bridge.log_step(
+                        run_id, 999, "system", "crash", "FAILED",
+                        "CRITICAL_FAILURE: Mission process terminated unexpectedly."
+                    )
+                    await async_db_bridge.update_run_status(run_id, "FAILED")
+                    return
+                logger.warning(f"♻️ Mission {run_id} lost its process - resubmitting from checkpoint")
+                entry.update({"state": "queued", "pid": None})
+        except asyncio.CancelledError:
+            if entry["state"] != "queued" or not entry.get("cancelled"):
+                raise
+            if entry["cancelled"] != ABANDONED:
+                await record_stopped_run(run_id, CANCELLED, "cancelled while queued")
+        finally:
+            self.active.pop(run_id, None)
+
+    def status(self) -> Dict[str, Any]:
+        running = sum(1 for m in self.active.values() if m.get("state") == "running")
+        return {
+            "executor": "process",
+            "processes": self.processes,
+            "alive": len(self._procs),
+            "running": running,
+            "queued": len(self.active) - running,
+            "completed": self.completed,
+            "crashed": self.crashed,
+        }
+
+
+mission_executor: Optional[MissionExecutor] = (
+    MissionExecutor(settings.MISSION_PROCESSES, settings.MISSIONS_PER_PROCESS)
+    if settings.MISSION_EXECUTOR == "process" else None
+)
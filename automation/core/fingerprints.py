@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from playwright.async_api import Page
+
+from ai.models import ElementFingerprint
+from automation.core.resolver import CANONICAL_SELECTOR_JS
+from data.supabase_async import async_db_bridge
+
+logger = logging.getLogger("orchestrator.fingerprints")
+
+# Pages (user, url) whose last capture is remembered for diffing.
+MAX_TRACKED_PAGES = 2_000
+
+INTERACTIVE_QUERY = ", ".join([
+    "a[href]", "button", "input:not([type=hidden])", "select", "textarea", "summary",
+    "[role=button]", "[role=link]", "[role=tab]", "[role=menuitem]", "[role=checkbox]",
+    "[role=switch]", "[contenteditable='']", "[contenteditable=true]", "[onclick]", "[data-testid]",
+])
+
+# Walks every visible interactive element once and derives its canonical
+# selector, XPath and attributes in the page, so a capture costs one round trip.
+CAPTURE_SCRIPT = r"""
+([query, limit]) => {
+  const ATTRS = ["id", "name", "type", "role", "href", "placeholder", "aria-label", "title",
+                 "data-testid", "data-test", "data-qa", "class", "value"];
+""" + CANONICAL_SELECTOR_JS + r"""
+  // Only button-like inputs show their value as a label; anywhere else it
+  // may be what a step or login just typed, so it never leaves the page.
+  const labelValue = (el) => el.tagName === "INPUT" && ["button", "submit", "reset"].includes(el.type);
+  const xpathFor = (el) => {
+    const steps = [];
+    for (let node = el; node && node.nodeType === 1; node = node.parentElement) {
+      let index = 1;
+      for (let sib = node.previousElementSibling; sib; sib = sib.previousElementSibling) {
+        if (sib.tagName === node.tagName) index++;
+      }
+      steps.unshift(`${node.tagName.toLowerCase()}[${index}]`);
+    }
+    return "/" + steps.join("/");
+  };
+
+  const out = [];
+  for (const el of document.querySelectorAll(query)) {
+    if (out.length >= limit) break;
+    const rect = el.getBoundingClientRect();
+    if (!rect.width || !rect.height) continue;
+    const style = getComputedStyle(el);
+    if (style.visibility === "hidden" || style.display === "none") continue;
+
+    const attributes = {};
+    for (const name of ATTRS) {
+      const v = el.getAttribute(name);
+      if (v !== null && v !== "") attributes[name] = name === "value" && !labelValue(el) ? "" : v.slice(0, 200);
+    }
+    const text = labelValue(el) ? el.value : (el.innerText || el.placeholder || "");
+    out.push({
+      selector: selectorFor(el),
+      tag: el.tagName.toLowerCase(),
+      text: (text || "").trim().slice(0, 120),
+      attributes,
+      xpath: xpathFor(el),
+      location: { x: Math.round(rect.x + window.scrollX), y: Math.round(rect.y + window.scrollY) },
+    });
+  }
+  return out;
+}
+"""
+
+
+def fingerprint_digest(fp: ElementFingerprint) -> str:
+    """Identity of an element's DNA; layout position is left out so reflow is not a change."""
+    material = json.dumps([fp.tag_name, fp.inner_text, fp.attributes, fp.xpath], sort_keys=True)
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class FingerprintIndex:
+    """Digests of the last capture per (user, url), bounded LRU; shared by the process's missions."""
+
+    def __init__(self, max_pages: int = MAX_TRACKED_PAGES):
+        self.max_pages = max_pages
+        self._pages: "OrderedDict[Tuple[str, str], Dict[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def swap(self, key: Tuple[str, str], digests: Dict[str, str]) -> Dict[str, str]:
+        """Store this capture's digests and return the previous capture's."""
+        with self._lock:
+            previous = self._pages.pop(key, {})
+            self._pages[key] = digests
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+            return previous
+
+    def forget(self, key: Tuple[str, str]):
+        with self._lock:
+            self._pages.pop(key, None)
+
+
+fingerprint_index = FingerprintIndex()
+
+
+@dataclass
+class FingerprintStats:
+    pages: int = 0
+    captured: int = 0
+    changed: int = 0
+    persisted: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"pages": self.pages, "captured": self.captured, "changed": self.changed, "persisted": self.persisted}
+
+
+class FingerprintCapturer:
+    """
+    Records the DNA of every interactive element on a page in one
+    `page.evaluate`, and bulk-upserts only the elements whose DNA changed
+    since the last capture of that URL.
+    """
+
+    def __init__(self, user_id: Optional[str], max_elements: int = 300, enabled: bool = True):
+        self.user_id = user_id
+        self.max_elements = max_elements
+        self.enabled = enabled and bool(user_id)
+        self.stats = FingerprintStats()
+        self._last_url: Optional[str] = None
+
+    @staticmethod
+    def page_key(url: str) -> str:
+        return url.split("#", 1)[0]
+
+    async def collect(self, page: Page) -> Dict[str, ElementFingerprint]:
+        """Selector -> fingerprint for the visible interactive elements of the page."""
+        raw = await page.evaluate(CAPTURE_SCRIPT, [INTERACTIVE_QUERY, self.max_elements])
+        return {item["selector"]: ElementFingerprint(**item) for item in raw if item.get("selector")}
+
+    async def capture(self, page: Optional[Page], force: bool = False) -> int:
+        """Capture the page once per URL visit; returns the number of fingerprints stored."""
+        if not self.enabled or not page:
+            return 0
+        url = self.page_key(page.url)
+        if not force and url == self._last_url:
+            return 0
+        self._last_url = url
+
+        try:
+            fingerprints = await self.collect(page)
+        except Exception as e:
+            logger.warning(f"Fingerprint capture failed on {url}: {e}")
+            return 0
+
+        key = (self.user_id, url)
+        digests = {selector: fingerprint_digest(fp) for selector, fp in fingerprints.items()}
+        previous = fingerprint_index.swap(key, digests)
+        changed: List[Tuple[str, ElementFingerprint]] = [
+            (selector, fp) for selector, fp in fingerprints.items() if previous.get(selector) != digests[selector]
+        ]
+
+        self.stats.pages += 1
+        self.stats.captured += len(fingerprints)
+        self.stats.changed += len(changed)
+        if not changed:
+            return 0
+
+        stored = await async_db_bridge.save_fingerprints(self.user_id, url, [
+            {"selector": selector, **fp.model_dump(by_alias=True)} for selector, fp in changed
+        ])
+        if stored < 0:
+            fingerprint_index.forget(key) # retry everything on the next visit
+            return 0
+        self.stats.persisted += stored
+        return stored
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"🧬 Element DNA: {s.captured} fingerprints over {s.pages} pages, "
+            f"{s.changed} changed, {s.persisted} stored"
+        )
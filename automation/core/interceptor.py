@@ -0,0 +1,170 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Route
+
+logger = logging.getLogger("orchestrator.interceptor")
+
+# Hosts that never contribute to DOM analysis (ads, analytics, session replay).
+# An entry matches the host and its subdomains; "host/path" also requires the path prefix.
+TRACKER_HOSTS: Tuple[str, ...] = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "fullstory.com",
+    "clarity.ms",
+    "intercom.io",
+    "adservice.google.com",
+    "ads-twitter.com",
+    "tiktok.com/i18n/pixel",
+)
+
+# Typical transfer sizes (bytes) used to estimate savings for aborted requests.
+ESTIMATED_BYTES: Dict[str, int] = {
+    "image": 45_000,
+    "media": 750_000,
+    "font": 35_000,
+    "stylesheet": 25_000,
+    "script": 60_000,
+    "xhr": 4_000,
+    "fetch": 4_000,
+    "other": 8_000,
+}
+
+# Conservative effective bandwidth used to convert saved bytes into saved time.
+ESTIMATED_BYTES_PER_SECOND = 1_500_000
+
+
+@dataclass(frozen=True)
+class RoutingProfile:
+    """Declarative request filter applied to every page of a mission."""
+    name: str
+    blocked_types: FrozenSet[str] = frozenset()
+    blocked_hosts: Tuple[str, ...] = ()
+
+    @property
+    def is_passthrough(self) -> bool:
+        return not self.blocked_types and not self.blocked_hosts
+
+
+ROUTING_PROFILES: Dict[str, RoutingProfile] = {
+    "full": RoutingProfile(name="full"),
+    "no-media": RoutingProfile(
+        name="no-media",
+        blocked_types=frozenset({"image", "media", "font"}),
+        blocked_hosts=TRACKER_HOSTS,
+    ),
+    "dom-only": RoutingProfile(
+        name="dom-only",
+        blocked_types=frozenset({"image", "media", "font", "stylesheet", "manifest", "texttrack", "eventsource", "websocket"}),
+        blocked_hosts=TRACKER_HOSTS,
+    ),
+}
+
+
+def resolve_profile(name: Optional[str]) -> RoutingProfile:
+    """Look up a routing profile by name, falling back to passthrough."""
+    key = (name or "full").strip().lower()
+    profile = ROUTING_PROFILES.get(key)
+    if not profile:
+        logger.warning(f"Unknown routing profile '{name}' - using 'full'")
+        return ROUTING_PROFILES["full"]
+    return profile
+
+
+@dataclass
+class BlockStats:
+    """Running counters for a single mission's request filter."""
+    allowed: int = 0
+    blocked: int = 0
+    estimated_bytes: int = 0
+    by_type: Dict[str, int] = field(default_factory=dict)
+    by_host: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def estimated_seconds_saved(self) -> float:
+        return round(self.estimated_bytes / ESTIMATED_BYTES_PER_SECOND, 2)
+
+    def as_dict(self) -> Dict:
+        return {
+            "allowed": self.allowed,
+            "blocked": self.blocked,
+            "estimated_bytes_saved": self.estimated_bytes,
+            "estimated_seconds_saved": self.estimated_seconds_saved,
+            "by_type": dict(self.by_type),
+            "by_host": dict(sorted(self.by_host.items(), key=lambda kv: kv[1], reverse=True)[:10]),
+        }
+
+
+class ResourceBlocker:
+    """
+    Request interceptor that aborts resources a mission does not need.
+    Installed once per browser context so every page inherits the profile.
+    """
+
+    def __init__(self, profile: RoutingProfile):
+        self.profile = profile
+        self.stats = BlockStats()
+        self._started_at = time.perf_counter()
+
+    async def install(self, context: BrowserContext):
+        """Attach the route handler to a context (no-op for passthrough)."""
+        if self.profile.is_passthrough:
+            return
+        await context.route("**/*", self._handle)
+        logger.info(f"🛡️ Routing profile '{self.profile.name}' active")
+
+    def _match_host(self, url: str) -> Optional[str]:
+        if not self.profile.blocked_hosts:
+            return None
+        parsed = urlparse(url)
+        hostname = parsed.hostname or ""
+        for entry in self.profile.blocked_hosts:
+            host, _, path = entry.partition("/")
+            if hostname != host and not hostname.endswith("." + host):
+                continue
+            if not path or parsed.path.startswith("/" + path):
+                return entry
+        return None
+
+    async def _handle(self, route: Route):
+        request = route.request
+        resource_type = request.resource_type
+        blocked_host = self._match_host(request.url)
+
+        if resource_type in self.profile.blocked_types or blocked_host:
+            self.stats.blocked += 1
+            self.stats.estimated_bytes += ESTIMATED_BYTES.get(resource_type, ESTIMATED_BYTES["other"])
+            self.stats.by_type[resource_type] = self.stats.by_type.get(resource_type, 0) + 1
+            if blocked_host:
+                self.stats.by_host[blocked_host] = self.stats.by_host.get(blocked_host, 0) + 1
+            try:
+                await route.abort("blockedbyclient")
+            except Exception as e:
+                logger.debug(f"Route abort failed for {request.url}: {e}")
+            return
+
+        self.stats.allowed += 1
+        try:
+            await route.continue_()
+        except Exception as e:
+            logger.debug(f"Route continue failed for {request.url}: {e}")
+
+    def summary(self) -> str:
+        """Human-readable savings line for the mission log."""
+        s = self.stats
+        return (
+            f"🛡️ ROUTING[{self.profile.name}]: blocked {s.blocked}/{s.blocked + s.allowed} requests "
+            f"(~{s.estimated_bytes / 1024:.0f} KB, ~{s.estimated_seconds_saved:.1f}s saved)"
+        )
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import random
+from typing import Any, Dict, Optional
+
+from automation.core.cancellation import ABANDONED
+from automation.core.executor import mission_executor
+from configs.settings import settings
+from data.job_queue import JobQueue
+
+logger = logging.getLogger("orchestrator.poller")
+
+
+class JobPoller:
+    """
+    Claims missions from test_runs while this worker has free slots and keeps
+    each lease alive with a heartbeat until the mission finishes.
+    """
+
+    def __init__(self, queue: JobQueue, concurrency: int = 1, interval: float = 2.0):
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self.interval = interval
+        self.inflight: Dict[str, asyncio.Task] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if not self._loop_task:
+            self._loop_task = asyncio.create_task(self._poll())
+            logger.info(f"📥 Job poller online: {self.queue.worker_id}, {self.concurrency} slots, lease {self.queue.lease_seconds}s")
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
+        # In-flight leases are left to expire so another worker resumes them.
+
+    async def _poll(self):
+        while True:
+            if len(self.inflight) >= self.concurrency:
+                await asyncio.sleep(self.interval)
+                continue
+
+            row = await asyncio.to_thread(self.queue.claim)
+            if row:
+                self.adopt(row, JobQueue.payload_for(row))
+                continue
+
+            # Jitter keeps a fleet of idle workers from polling in lockstep.
+            await asyncio.sleep(self.interval * random.uniform(0.75, 1.25))
+
+    def adopt(self, row: Dict[str, Any], payload: Dict[str, Any]):
+        """Run a leased mission under heartbeat (used by both pull and push paths)."""
+        run_id = str(row["id"])
+        self.inflight[run_id] = asyncio.create_task(self._run_leased(run_id, payload))
+
+    async def _launch(self, payload: Dict[str, Any]) -> asyncio.Task:
+        from main import run_scout_mode, run_sniper_mode
+
+        mode = payload.get("mode", "sniper")
+        if mission_executor:
+            return await mission_executor.submit(mode, payload)
+        if mode == "scout":
+            return asyncio.create_task(run_scout_mode(payload))
+        return asyncio.create_task(run_sniper_mode(payload))
+
+    async def _run_leased(self, run_id: str, payload: Dict[str, Any]):
+        mission = await self._launch(payload)
+        heartbeat = asyncio.create_task(self._heartbeat(run_id, mission))
+        try:
+            await mission
+        except asyncio.CancelledError:
+            logger.warning(f"🛑 Mission {run_id} cancelled on {self.queue.worker_id}")
+        except Exception as e:
+            logger.error(f"❌ Leased mission {run_id} crashed: {e}")
+        finally:
+            heartbeat.cancel()
+            await asyncio.to_thread(self.queue.release, run_id)
+            self.inflight.pop(run_id, None)
+
+    async def _heartbeat(self, run_id: str, mission: asyncio.Task):
+        beat = max(1.0, self.queue.lease_seconds / 3)
+        while not mission.done():
+            await asyncio.sleep(beat)
+            if not await asyncio.to_thread(self.queue.renew, run_id):
+                # We stalled past the lease and someone else owns the run now.
+                logger.error(f"⛔ Lease on {run_id} lost - abandoning local execution")
+                await self._abandon(run_id, mission)
+                return
+
+    @staticmethod
+    async def _abandon(run_id: str, mission: asyncio.Task):
+        """
+        Stop the local copy of a run another worker owns, writing nothing for
+        it. In process mode the mission task (and so the lease release) only
+        finishes once the mission process has stopped or been killed.
+        """
+        if mission_executor and await mission_executor.cancel(run_id, ABANDONED):
+            return
+        mission.cancel()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.queue.worker_id,
+            "slots": self.concurrency,
+            "leased": sorted(self.inflight),
+        }
+
+
+def build_poller(queue: Optional[JobQueue]) -> Optional[JobPoller]:
+    if not queue:
+        return None
+    concurrency = settings.JOB_CONCURRENCY or (mission_executor.processes if mission_executor else 1)
+    return JobPoller(queue, concurrency, settings.JOB_POLL_INTERVAL_SECONDS)
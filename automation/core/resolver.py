@@ -0,0 +1,176 @@
+import logging
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from playwright.async_api import Page
+
+logger = logging.getLogger("orchestrator.resolver")
+
+_TOKEN = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+# Shared with fingerprint capture, so stored DNA and executed steps agree on
+# an element's selector: unique id, then test ids, name and aria-label, then
+# an nth-of-type path anchored at the nearest unique id. Queries pierce open
+# shadow roots the way Playwright's CSS engine does, so uniqueness holds for
+# Playwright too; elements inside a shadow root get no path (null).
+CANONICAL_SELECTOR_JS = r"""
+  let roots = null;
+  const shadowRoots = () => {
+    if (roots) return roots;
+    roots = [document];
+    for (let i = 0; i < roots.length; i++) {
+      for (const el of roots[i].querySelectorAll("*")) if (el.shadowRoot) roots.push(el.shadowRoot);
+    }
+    return roots;
+  };
+  const queryAll = (sel) => {
+    const found = [];
+    for (const root of shadowRoots()) found.push(...root.querySelectorAll(sel));
+    return found;
+  };
+  const unique = (sel) => { try { return queryAll(sel).length === 1; } catch (e) { return false; } };
+  const quote = (v) => v.replace(/\\/g, "\\\\").replace(/"/g, '\\"');
+  const selectorFor = (el) => {
+    const tag = el.tagName.toLowerCase();
+    if (el.id && unique("#" + CSS.escape(el.id))) return "#" + CSS.escape(el.id);
+    for (const attr of ["data-testid", "data-test", "data-qa", "name", "aria-label"]) {
+      const v = el.getAttribute(attr);
+      if (v) {
+        const sel = `${tag}[${attr}="${quote(v)}"]`;
+        if (unique(sel)) return sel;
+      }
+    }
+    if (el.getRootNode() !== document) return null;
+    const parts = [];
+    for (let node = el; node && node.nodeType === 1 && node !== document.documentElement; node = node.parentElement) {
+      if (node.id && unique("#" + CSS.escape(node.id))) { parts.unshift("#" + CSS.escape(node.id)); break; }
+      let part = node.tagName.toLowerCase();
+      const parent = node.parentElement;
+      if (parent) {
+        const same = Array.from(parent.children).filter((c) => c.tagName === node.tagName);
+        if (same.length > 1) part += `:nth-of-type(${same.indexOf(node) + 1})`;
+      }
+      parts.unshift(part);
+    }
+    return parts.join(" > ");
+  };
+"""
+
+# Tries strategies in stability order and returns the first visible (or,
+# for reads, attached) match with its canonical selector. Falsy until found,
+# so page.wait_for_function polls it in the page instead of over the wire.
+# CSS that matches nothing on a page with shadow roots may combine across a
+# shadow boundary ("my-widget button"), which only Playwright's engine
+# resolves: it is handed back unchanged.
+RESOLVE_SCRIPT = r"""
+({ token, css, visible }) => {
+""" + CANONICAL_SELECTOR_JS + r"""
+  const usable = (el) => {
+    if (!visible) return true;
+    const rect = el.getBoundingClientRect();
+    if (!rect.width || !rect.height) return false;
+    const style = getComputedStyle(el);
+    return style.visibility !== "hidden" && style.display !== "none";
+  };
+  let strategies = [["css", css]];
+  if (token) {
+    const t = quote(token);
+    strategies = [
+      ["id", "#" + CSS.escape(token)],
+      ["data-testid", `[data-testid="${t}"]`],
+      ["data-test", `[data-test="${t}"]`],
+      ["data-qa", `[data-qa="${t}"]`],
+      ["name", `[name="${t}"]`],
+      ["aria-label", `[aria-label="${t}" i]`],
+      ["placeholder", `[placeholder="${t}" i]`],
+      ["aria-label*", `[aria-label*="${t}" i]`],
+      ["placeholder*", `[placeholder*="${t}" i]`],
+    ];
+  }
+  let parsed = 0;
+  for (const [strategy, sel] of strategies) {
+    let found;
+    try { found = queryAll(sel); } catch (e) { continue; }
+    parsed++;
+    for (const el of found) {
+      if (usable(el)) return { selector: selectorFor(el) || sel, strategy, matches: found.length };
+    }
+  }
+  // Engine-specific syntax (text=, :has-text) is left to Playwright.
+  if (!parsed) return { unsupported: true };
+  return css && shadowRoots().length > 1 ? { unsupported: true } : null;
+}
+"""
+
+
+class SelectorResolver:
+    """
+    Resolves step selectors in the page: bare tokens are tried as id, test
+    id, name, aria-label and placeholder (in that order) instead of one
+    comma-joined union, and every hit is rewritten to the element's
+    canonical selector. Resolutions are cached per page URL and reused by
+    later steps until the page navigates or an action on them fails.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, str, bool], str]" = OrderedDict()
+        self.hits = 0
+        self.resolved = 0
+        self.passthrough = 0
+        self.strategies: Dict[str, int] = {}
+
+    @staticmethod
+    def is_token(selector: str) -> bool:
+        return bool(_TOKEN.match(selector or ""))
+
+    @staticmethod
+    def _key(page: Page, selector: str, visible: bool) -> Tuple[str, str, bool]:
+        return (page.url, selector, visible)
+
+    async def resolve(self, page: Page, selector: str, timeout: float, visible: bool = True) -> str:
+        """Canonical selector of the element `selector` points at; waits up to `timeout` ms for it."""
+        key = self._key(page, selector, visible)
+        cached = self._cache.get(key)
+        if cached:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        token = self.is_token(selector)
+        handle = await page.wait_for_function(
+            RESOLVE_SCRIPT,
+            arg={"token": selector if token else None, "css": None if token else selector, "visible": visible},
+            timeout=timeout,
+            polling="raf",
+        )
+        result: Dict[str, Any] = await handle.json_value()
+        await handle.dispose()
+
+        if result.get("unsupported"):
+            self.passthrough += 1
+            return selector
+
+        canonical = result["selector"]
+        self.resolved += 1
+        self.strategies[result["strategy"]] = self.strategies.get(result["strategy"], 0) + 1
+        if canonical != selector:
+            logger.info(f"🎯 Resolved '{selector}' -> '{canonical}' via {result['strategy']} ({result['matches']} matches)")
+
+        self._cache[key] = canonical
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return canonical
+
+    def invalidate(self, page: Page, selector: Optional[str] = None):
+        """Forget resolutions on the page's current URL (all, or one selector's)."""
+        for key in [k for k in self._cache if k[0] == page.url and (selector is None or k[1] == selector)]:
+            self._cache.pop(key, None)
+
+    def summary(self) -> str:
+        used = ", ".join(f"{n} {s}" for s, n in sorted(self.strategies.items(), key=lambda kv: -kv[1]))
+        return (
+            f"🎯 Selector resolver: {self.resolved} resolved ({used or 'none'}), "
+            f"{self.hits} cache hits, {self.passthrough} passed through"
+        )
@@ -2,15 +2,29 @@ import asyncio
 import logging
 import json
 import re
-from typing import Optional, List, Any, Dict
-from playwright.async_api import async_playwright, Page, BrowserContext, expect
+import time
+from typing import Optional, List, Any, Dict, Tuple
+from playwright.async_api import Browser, Page, BrowserContext, expect
 
 from ai.models import TestPlan, TestStep, ActionType
 from ai.healer import heal_selector
-from data.supabase_client import db_bridge
+from ai.json_extract import extract_json, strip_fences
+from automation.core.interceptor import ResourceBlocker, resolve_profile
+from automation.core.browser import browser_launcher
+from automation.core.capture import ScreenshotCapturer, resolve_capture_policy
+from automation.core.fingerprints import FingerprintCapturer
+from automation.core.resolver import SelectorResolver
+from automation.core.tracing import TraceRecorder
+from automation.core.visual import VisualRegression
+from configs.settings import settings
+from data.supabase_async import async_db_bridge
+from data.checkpoint import checkpoint_store
 
 logger = logging.getLogger("orchestrator.runner")
 
+# Last resort for selector objects too malformed to parse: {'selector': '...'}
+_SELECTOR_FIELD = re.compile(r"""["']selector["']\s*:\s*["']([^"']+)["']""")
+
 
 class AutomationRunner:
     """
@@ -26,6 +40,8 @@ class AutomationRunner:
         api_key: Optional[str] = None,
         user_id: Optional[str] = None,
         base_url: Optional[str] = None,
+        routing_profile: Optional[str] = None,
+        capture_policy: Optional[str] = None,
     ):
         self.run_id = run_id
         self.user_id = user_id
@@ -33,117 +49,224 @@ class AutomationRunner:
         self.model = model
         self.api_key = api_key
         self.base_url = base_url
+        self.browser: Optional[Browser] = None
+        self.storage_state: Optional[Dict[str, Any]] = None
         self.browser_context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self._playwright = None
         self.healing_audit: List[str] = []
-
-    async def start_browser(self, headless: bool = True):
-        """Launch Chromium with stealth configuration."""
-        self._playwright = await async_playwright().start()
-        browser = await self._playwright.chromium.launch(
-            headless=headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-            ],
+        self.healed_selectors: Dict[int, str] = {}
+        self.blocker = ResourceBlocker(resolve_profile(routing_profile or settings.DEFAULT_ROUTING_PROFILE))
+        self.visual: Optional[VisualRegression] = None
+        policy = resolve_capture_policy(
+            capture_policy or settings.CAPTURE_POLICY,
+            image_format=settings.CAPTURE_FORMAT,
+            quality=settings.CAPTURE_QUALITY,
+            thumbnail_width=settings.CAPTURE_THUMBNAIL_WIDTH,
+            hash_distance=settings.CAPTURE_HASH_DISTANCE,
         )
-        self.browser_context = await browser.new_context(
+        self.trace = TraceRecorder(run_id, settings.TRACE_COMPRESS) if policy.name == "trace" else None
+        self.capture = ScreenshotCapturer(run_id, policy, trace=self.trace)
+        self.fingerprints = FingerprintCapturer(user_id, settings.FINGERPRINT_MAX_ELEMENTS, settings.FINGERPRINT_CAPTURE)
+        self.resolver = SelectorResolver()
+        self.last_selector: Optional[str] = None # canonical selector of the last action, for the log
+        self.completed_steps = 0
+
+    async def start_browser(self, headless: bool = True, storage_state: Optional[Dict[str, Any]] = None, open_page: bool = True):
+        """
+        Launch Chromium with stealth configuration. open_page=False skips the
+        runner's own context and page, for callers that open isolated ones
+        (Chaos fan-out).
+        """
+        self.storage_state = storage_state
+        self._playwright, self.browser = await browser_launcher.acquire(headless)
+        if not open_page:
+            return
+        self.browser_context, self.page = await self.new_isolated_page()
+        if self.trace:
+            await self.trace.start(self.browser_context)
+
+    async def new_isolated_page(self) -> Tuple[BrowserContext, Page]:
+        """
+        Open a fresh context (own cookies/storage) on the shared browser,
+        pre-authenticated when a cached session was supplied.
+        """
+        context = await self.browser.new_context(
             viewport={"width": 1280, "height": 720},
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+            storage_state=self.storage_state,
         )
-        self.page = await self.browser_context.new_page()
-        self.page.on("dialog", lambda dialog: asyncio.create_task(dialog.dismiss()))
+        await self.blocker.install(context)
+        page = await context.new_page()
+        page.on("dialog", lambda dialog: asyncio.create_task(dialog.dismiss()))
+        return context, page
+
+    async def log_capture_savings(self):
+        """Report frames and bytes the capture policy kept out of storage."""
+        if not self.capture.stats.requested:
+            return
+
+        logger.info(self.capture.summary())
+        await async_db_bridge.log_step(
+            run_id=self.run_id,
+            role="system",
+            action="capture",
+            status="INFO",
+            message=self.capture.summary(),
+            details=json.dumps(self.capture.stats.as_dict())
+        )
+
+    async def log_network_savings(self):
+        """Report request-blocking savings to the mission log."""
+        if self.blocker.profile.is_passthrough:
+            return
+
+        logger.info(self.blocker.summary())
+        await async_db_bridge.log_step(
+            run_id=self.run_id,
+            role="system",
+            action="network",
+            status="INFO",
+            message=self.blocker.summary(),
+            details=json.dumps(self.blocker.stats.as_dict())
+        )
+
+    async def finish_trace(self):
+        """Store the mission trace while its context is still open."""
+        if self.trace:
+            await self.trace.finish(self.browser_context)
 
     async def stop_browser(self):
         """Clean browser shutdown."""
         try:
             if self.browser_context:
                 await self.browser_context.close()
+            if self.browser:
+                await self.browser.close()
             if self._playwright:
                 await self._playwright.stop()
         except Exception as e:
             logger.error(f"Browser teardown error: {e}")
+        finally:
+            self.browser_context = self.browser = self._playwright = None
 
     def _extract_selector_string(self, selector: Any) -> str:
         """
         Normalize selector from various AI response formats.
-        Handles JSON objects, plain strings, and shorthand IDs.
+        Handles JSON objects and plain strings; shorthand IDs stay bare for the resolver.
         """
         if not selector:
             return ""
 
-        s = str(selector).strip()
-        s = re.sub(r'```(?:json)?\s*|\s*```', '', s).strip()
+        s = strip_fences(str(selector))
 
         if s.startswith("{"):
-            try:
-                data = json.loads(s.replace("'", '"'))
+            data = extract_json(s, dict) or extract_json(s.replace("'", '"'), dict)
+            if data is not None:
                 s = str(data.get("selector", s))
-            except json.JSONDecodeError:
-                match = re.search(r'["\']selector["\']\s*:\s*["\']([^"\']+)["\']', s)
+            else:
+                match = _SELECTOR_FIELD.search(s)
                 if match:
                     s = match.group(1)
 
-        if re.match(r"^[a-zA-Z0-9_-]+$", s):
-            return f"#{s}, [name='{s}'], [placeholder*='{s}' i], [aria-label*='{s}' i]"
-
         return s.strip("'\"")
 
-    async def execute_plan(self, plan: TestPlan):
+    def _checkpoint(self, plan: TestPlan, step_index: int):
+        """Snapshot progress so a restarted mission skips finished steps."""
+        checkpoint_store.save(self.run_id, {
+            "mode": "sniper",
+            "phase": "executing",
+            "plan": plan.model_dump(mode="json"),
+            "step_index": step_index,
+            "healed_selectors": {str(k): v for k, v in self.healed_selectors.items()},
+            "healing_audit": list(self.healing_audit),
+            "last_url": self.page.url if self.page else self.base_url,
+        })
+
+    async def _resume_from(self, checkpoint: Dict[str, Any]) -> int:
+        """Restore healing state and the last page; returns the next step index."""
+        self.healed_selectors = {int(k): v for k, v in (checkpoint.get("healed_selectors") or {}).items()}
+        self.healing_audit = list(checkpoint.get("healing_audit") or [])
+        start_index = int(checkpoint.get("step_index", 0))
+
+        last_url = checkpoint.get("last_url")
+        if start_index > 0 and last_url and self.page:
+            logger.info(f"♻️ Resuming at step {start_index + 1} on {last_url}")
+            await self.page.goto(last_url, wait_until="networkidle", timeout=30000)
+        return start_index
+
+    async def execute_plan(self, plan: TestPlan, checkpoint: Optional[Dict[str, Any]] = None):
         """Execute full test plan with self-healing capabilities."""
         if not self.page:
             await self.start_browser(headless=True)
 
         try:
-            for step in plan.steps:
+            start_index = await self._resume_from(checkpoint) if checkpoint else 0
+
+            for idx, step in enumerate(plan.steps):
+                if idx < start_index:
+                    continue
+                if step.step_id in self.healed_selectors:
+                    step = step.model_copy(update={"selector": self.healed_selectors[step.step_id]})
                 await self.execute_step(step)
+                self.completed_steps = idx + 1
+                await asyncio.to_thread(self._checkpoint, plan, idx + 1)
 
-            final_proof = await self._capture_screenshot()
+            final_proof = await self._capture_screenshot("final")
 
             summary = "✅ Mission Successful."
             if self.healing_audit:
                 summary += f" Self-healing resolved {len(self.healing_audit)} UI discrepancies."
 
-            db_bridge.log_step(
+            final_status = "COMPLETED"
+            if self.visual:
+                summary += f" {self.visual.summary()}."
+                if self.visual.failures:
+                    final_status = "FAILED"
+
+            await async_db_bridge.log_step(
                 run_id=self.run_id,
                 role="system",
                 action="summary",
-                status="COMPLETED",
+                status=final_status,
                 message=summary,
                 screenshot_url=final_proof
             )
-            db_bridge.update_run_status(self.run_id, "COMPLETED")
+            # The healed plan is what a Golden Path promotion should replay.
+            healed_plan = plan.model_copy(update={"steps": [
+                s.model_copy(update={"selector": self.healed_selectors[s.step_id]}) if s.step_id in self.healed_selectors else s
+                for s in plan.steps
+            ]})
+            await async_db_bridge.save_run_plan(self.run_id, healed_plan.model_dump(mode="json"))
+            await async_db_bridge.update_run_status(self.run_id, final_status)
+            await asyncio.to_thread(checkpoint_store.clear, self.run_id)
 
         except Exception as e:
-            self._handle_final_crash(e)
-            db_bridge.update_run_status(self.run_id, "FAILED")
+            await self._handle_final_crash(e)
+            await async_db_bridge.update_run_status(self.run_id, "FAILED")
+            await asyncio.to_thread(checkpoint_store.clear, self.run_id)
         finally:
+            await self.log_network_savings()
+            await self.log_capture_savings()
+            if self.fingerprints.stats.pages:
+                logger.info(self.fingerprints.summary())
+            if self.resolver.resolved:
+                logger.info(self.resolver.summary())
+            await self.finish_trace()
             await self.stop_browser()
 
-    async def _capture_screenshot(self) -> Optional[str]:
-        """Capture current page state and upload to storage."""
-        if not self.page:
-            return None
-
-        try:
-            screenshot_bytes = await self.page.screenshot(type="png", full_page=False)
-            return db_bridge.upload_screenshot(screenshot_bytes, self.run_id)
-        except Exception as e:
-            logger.warning(f"Screenshot capture failed: {e}")
-            return None
+    async def _capture_screenshot(self, reason: str = "step") -> Optional[str]:
+        """Capture current page state under the mission's capture policy."""
+        return await self.capture.capture(self.page, reason)
 
     async def execute_step(self, step: TestStep):
         """Execute single test step with screenshot capture and self-healing."""
         role = step.role.value
         action_val = step.action.value
 
-        screenshot_url = await self._capture_screenshot()
+        screenshot_url = await self._capture_screenshot("before")
 
-        db_bridge.log_step(
+        await async_db_bridge.log_step(
             run_id=self.run_id,
             role=role,
             action=action_val,
@@ -156,18 +279,20 @@ class AutomationRunner:
         )
 
         try:
+            self.last_selector = None
             await self._perform_action(step.action, step.selector, step.value)
 
-            final_screenshot = await self._capture_screenshot()
+            final_screenshot = await self._capture_screenshot("after")
+            await self.fingerprints.capture(self.page)
 
-            db_bridge.log_step(
+            await async_db_bridge.log_step(
                 run_id=self.run_id,
                 role=role,
                 action=action_val,
                 status="PASSED",
                 message="Step completed successfully",
                 url=self.page.url if self.page else None,
-                selector=step.selector,
+                selector=self.last_selector or step.selector,
                 value=step.value,
                 screenshot_url=final_screenshot
             )
@@ -175,7 +300,7 @@ class AutomationRunner:
         except Exception as e:
             logger.warning(f"Step failed: {e}. Initiating self-healing...")
 
-            error_screenshot = await self._capture_screenshot()
+            error_screenshot = await self._capture_screenshot("error")
 
             heal_result = await self._try_healing(step, e)
 
@@ -183,24 +308,26 @@ class AutomationRunner:
                 target_selector = self._extract_selector_string(heal_result.get("selector"))
                 reasoning = heal_result.get("reasoning", "UI Optimized.")
                 self.healing_audit.append(reasoning)
+                self.healed_selectors[step.step_id] = target_selector
 
                 await self._perform_action(step.action, target_selector, step.value)
 
-                healed_screenshot = await self._capture_screenshot()
+                healed_screenshot = await self._capture_screenshot("healed")
+                await self.fingerprints.capture(self.page)
 
-                db_bridge.log_step(
+                await async_db_bridge.log_step(
                     run_id=self.run_id,
                     role=role,
                     action=action_val,
                     status="PASSED",
                     message=f"🩹 HEAL_SUCCESS: {reasoning}",
                     url=self.page.url if self.page else None,
-                    selector=target_selector,
+                    selector=self.last_selector or target_selector,
                     value=step.value,
                     screenshot_url=healed_screenshot
                 )
             else:
-                db_bridge.log_step(
+                await async_db_bridge.log_step(
                     run_id=self.run_id,
                     role=role,
                     action=action_val,
@@ -211,6 +338,16 @@ class AutomationRunner:
                 )
                 raise e
 
+        if self.visual:
+            await self._visual_check(step)
+
+    async def _visual_check(self, step: TestStep):
+        """Diff the post-step frame against the Golden Path baseline; never fails the step itself."""
+        try:
+            await self.visual.check(self.page, step.step_id, png_bytes=self.capture.last_png)
+        except Exception as e:
+            logger.warning(f"Visual diff skipped for step {step.step_id}: {e}")
+
     async def _try_healing(
         self, step: TestStep, original_error: Exception
     ) -> Optional[Dict[str, str]]:
@@ -229,6 +366,19 @@ class AutomationRunner:
             logger.error(f"Healing failed: {he}")
             return None
 
+    async def _resolve(self, selector: str, timeout: float, visible: bool = True) -> Tuple[str, float]:
+        """
+        Wait for the step's element in-page and switch to its canonical
+        selector. Returns it with the milliseconds left of `timeout` for the
+        action itself, so resolving and acting share one step budget.
+        """
+        if not selector:
+            raise ValueError("Action requires a selector")
+        started = time.monotonic()
+        self.last_selector = await self.resolver.resolve(self.page, selector, timeout, visible=visible)
+        # Playwright treats 0 as "no timeout"; keep at least 1 ms.
+        return self.last_selector, max(1.0, timeout - (time.monotonic() - started) * 1000)
+
     async def _perform_action(
         self, action: ActionType, raw_selector: Any, value: Optional[str]
     ):
@@ -250,8 +400,12 @@ class AutomationRunner:
             await self.page.goto(target, wait_until="networkidle", timeout=30000)
 
         elif action == ActionType.CLICK:
-            await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-            await self.page.click(selector, timeout=timeout)
+            target, remaining = await self._resolve(selector, timeout)
+            try:
+                await self.page.click(target, timeout=remaining)
+            except Exception:
+                self.resolver.invalidate(self.page, selector)
+                raise
             await self.page.wait_for_load_state("networkidle")
 
         elif action == ActionType.INPUT:
@@ -259,8 +413,12 @@ class AutomationRunner:
                 logger.warning("INPUT action called with empty value")
                 return
 
-            await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-            await self.page.fill(selector, value, timeout=timeout)
+            target, remaining = await self._resolve(selector, timeout)
+            try:
+                await self.page.fill(target, value, timeout=remaining)
+            except Exception:
+                self.resolver.invalidate(self.page, selector)
+                raise
 
         elif action == ActionType.WAIT:
             wait_time = int(value) if value and value.isdigit() else 2000
@@ -293,11 +451,11 @@ class AutomationRunner:
                 )
 
         elif action == ActionType.EXTRACT_TEXT:
-            await self.page.wait_for_selector(selector, state="attached", timeout=timeout)
-            content = await self.page.inner_text(selector, timeout=timeout)
+            target, remaining = await self._resolve(selector, timeout, visible=False)
+            content = await self.page.inner_text(target, timeout=remaining)
             logger.info(f"📋 Extracted: {content}")
 
-    def _handle_final_crash(self, e: Exception):
+    async def _handle_final_crash(self, e: Exception):
         """Log final crash report with diagnostic information."""
         err_msg = str(e).lower()
 
@@ -308,7 +466,7 @@ class AutomationRunner:
         else:
             diagnosis = str(e)
 
-        db_bridge.log_step(
+        await async_db_bridge.log_step(
             run_id=self.run_id,
             role="system",
             action="crash_report",
@@ -0,0 +1,83 @@
+import asyncio
+import datetime
+import logging
+from typing import Dict, Optional
+
+from automation.core.executor import mission_executor
+from configs.settings import settings
+from data.settings_cache import user_settings_cache
+from data.supabase_async import async_db_bridge
+
+logger = logging.getLogger("orchestrator.settings_sync")
+
+
+class SettingsSync:
+    """
+    Keeps every privacy-settings cache of this worker in step with
+    user_settings: the worker's own, and those of its mission processes.
+
+    The dashboard notifies one worker directly (invalidate); every worker
+    also polls rows whose updated_at moved, so a change reaches the whole
+    fleet within USER_SETTINGS_SYNC_SECONDS whichever worker was notified.
+    """
+
+    # The cursor trails the newest change seen by this much: updated_at is the
+    # writer's transaction start, so a row can commit after a poll with an
+    # earlier timestamp (and the first poll covers a worker clock running ahead).
+    CLOCK_SKEW = datetime.timedelta(seconds=30)
+    BATCH = 500
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._cursor: Optional[datetime.datetime] = None
+        self._seen: Dict[str, str] = {} # user_id -> updated_at already invalidated inside the window
+        self._task: Optional[asyncio.Task] = None
+
+    def invalidate(self, user_id: Optional[str] = None) -> int:
+        """Drop a user's cached settings here and in every mission process."""
+        removed = user_settings_cache.invalidate(user_id)
+        if mission_executor:
+            mission_executor.broadcast(("invalidate", user_id))
+        return removed
+
+    def start(self):
+        if self._task or not self.interval or not async_db_bridge.online:
+            return
+        self._cursor = datetime.datetime.now(datetime.timezone.utc) - self.CLOCK_SKEW
+        self._task = asyncio.create_task(self._watch())
+        logger.info(f"♻️ User settings sync every {self.interval}s")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                rows = await async_db_bridge.changed_user_settings(self._cursor.isoformat(), self.BATCH)
+            except Exception as e:
+                logger.warning(f"User settings sync failed: {e}")
+                continue
+            self._advance(rows)
+
+    def _advance(self, rows):
+        """Invalidate rows not handled yet and move the cursor, CLOCK_SKEW behind the newest one."""
+        seen = {}
+        for row in rows:
+            user_id, stamp = row["user_id"], row["updated_at"]
+            if self._seen.get(user_id) != stamp:
+                self.invalidate(user_id)
+            seen[user_id] = stamp
+        self._seen = seen
+        if not rows:
+            return
+        newest = datetime.datetime.fromisoformat(rows[-1]["updated_at"])
+        cursor = max(self._cursor, newest - self.CLOCK_SKEW)
+        if cursor == self._cursor and len(rows) >= self.BATCH:
+            cursor = newest # a full batch inside the window: step past it rather than re-read it
+        self._cursor = cursor
+
+
+settings_sync = SettingsSync(settings.USER_SETTINGS_SYNC_SECONDS)
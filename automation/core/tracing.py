@@ -0,0 +1,230 @@
+import asyncio
+import io
+import json
+import logging
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from playwright.async_api import BrowserContext
+
+from configs.settings import settings
+from data.supabase_async import async_db_bridge
+
+logger = logging.getLogger("orchestrator.tracing")
+
+TRACE_BUCKET = "traces"
+FRAME_BUCKET = "screenshots"
+
+# Frames logged this long after the event they document still count as "at" it.
+FRAME_SLACK_MS = 250
+
+_frame_locks: Dict[str, asyncio.Lock] = {}
+
+
+def trace_name(run_id: str) -> str:
+    return f"{run_id}.zip"
+
+
+def local_trace_path(run_id: str) -> Path:
+    return Path(settings.VIDEOS_DIR) / trace_name(run_id)
+
+
+def lazy_frame_url(run_id: str, wall_ms: int) -> Optional[str]:
+    """Dashboard link that extracts the frame from the mission trace on first view."""
+    if not settings.WORKER_PUBLIC_URL:
+        return None
+    return f"{settings.WORKER_PUBLIC_URL.rstrip('/')}/traces/{run_id}/frames/{wall_ms}.jpeg"
+
+
+def _recompress(data: bytes) -> bytes:
+    """Repack a trace with maximum deflate; Playwright writes it for speed, not size."""
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as src, zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as dst:
+        for info in src.infolist():
+            dst.writestr(info.filename, src.read(info))
+    packed = out.getvalue()
+    return packed if len(packed) < len(data) else data
+
+
+def extract_frame(trace: bytes, wall_ms: float) -> Optional[bytes]:
+    """
+    The screencast frame showing the page at `wall_ms` (epoch milliseconds):
+    the last frame swapped in before that moment, or the first one if the
+    moment precedes them all.
+    """
+    with zipfile.ZipFile(io.BytesIO(trace)) as archive:
+        offset: Optional[float] = None # wall clock minus trace monotonic clock
+        best: Optional[Tuple[float, str]] = None
+        first: Optional[Tuple[float, str]] = None
+
+        for name in archive.namelist():
+            if not name.endswith(".trace"):
+                continue
+            for line in archive.read(name).splitlines():
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                kind = event.get("type")
+                if kind == "context-options" and "wallTime" in event and "monotonicTime" in event:
+                    offset = event["wallTime"] - event["monotonicTime"]
+                    continue
+                if kind != "screencast-frame" or not event.get("sha1"):
+                    continue
+
+                at = event.get("frameSwapWallTime")
+                if at is None:
+                    if offset is None:
+                        continue
+                    at = event.get("timestamp", 0) + offset
+                if first is None or at < first[0]:
+                    first = (at, event["sha1"])
+                if at <= wall_ms + FRAME_SLACK_MS and (best is None or at > best[0]):
+                    best = (at, event["sha1"])
+
+        chosen = best or first
+        if not chosen:
+            return None
+        try:
+            return archive.read(f"resources/{chosen[1]}")
+        except KeyError:
+            return None
+
+
+@dataclass
+class TraceStats:
+    bytes_raw: int = 0
+    bytes_stored: int = 0
+    lazy_frames: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"bytes_raw": self.bytes_raw, "bytes_stored": self.bytes_stored, "lazy_frames": self.lazy_frames}
+
+
+class TraceRecorder:
+    """
+    One Playwright trace (DOM snapshots, network, screencast) per mission
+    instead of per-step screenshot uploads. The trace is written to
+    VIDEOS_DIR and stored once when the mission ends; evidence frames for
+    failed and healed steps are lazy links cut from it on first view.
+    """
+
+    def __init__(self, run_id: str, compress: bool = True):
+        self.run_id = run_id
+        self.compress = compress
+        self.stats = TraceStats()
+        self.active = False
+
+    async def start(self, context: Optional[BrowserContext]):
+        if not context or self.active:
+            return
+        if not settings.WORKER_PUBLIC_URL:
+            logger.warning("🎞️ Trace capture without WORKER_PUBLIC_URL: step frames will not be linkable")
+        await context.tracing.start(screenshots=True, snapshots=True, sources=False, title=self.run_id)
+        self.active = True
+
+    def frame_url(self) -> Optional[str]:
+        """Lazy frame link for this moment of the mission."""
+        if not self.active:
+            return None
+        self.stats.lazy_frames += 1
+        return lazy_frame_url(self.run_id, int(time.time() * 1000))
+
+    async def finish(self, context: Optional[BrowserContext]) -> Optional[str]:
+        """Stop recording and store the trace; returns its URL."""
+        if not self.active or not context:
+            return None
+        self.active = False
+
+        path = local_trace_path(self.run_id)
+        try:
+            await context.tracing.stop(path=str(path))
+            data = await asyncio.to_thread(path.read_bytes)
+            self.stats.bytes_raw = len(data)
+            if self.compress:
+                data = await asyncio.to_thread(_recompress, data)
+                await asyncio.to_thread(path.write_bytes, data)
+            self.stats.bytes_stored = len(data)
+        except Exception as e:
+            logger.error(f"Trace capture failed for {self.run_id}: {e}")
+            return None
+
+        url = None
+        if async_db_bridge.storage.available:
+            try:
+                url = await async_db_bridge.storage.put(TRACE_BUCKET, trace_name(self.run_id), data, "application/zip", upsert=True)
+            except Exception as e:
+                logger.error(f"Trace upload failed for {self.run_id}, kept at {path}: {e}")
+
+        message = f"🎞️ Mission trace: {self.stats.bytes_stored / 1_048_576:.1f} MB, {self.stats.lazy_frames} lazy evidence frames"
+        logger.info(message)
+        await async_db_bridge.log_step(
+            run_id=self.run_id,
+            role="system",
+            action="trace",
+            status="INFO",
+            message=message,
+            details=json.dumps({"url": url, **self.stats.as_dict()})
+        )
+        return url
+
+
+def prune_traces(max_age_seconds: float) -> int:
+    """Drop local mission traces older than max_age_seconds; stored copies are kept."""
+    removed = 0
+    cutoff = time.time() - max_age_seconds
+    for path in Path(settings.VIDEOS_DIR).glob("*.zip"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+async def _load_trace(run_id: str) -> Optional[bytes]:
+    path = local_trace_path(run_id)
+    if path.exists():
+        return await asyncio.to_thread(path.read_bytes)
+    if not async_db_bridge.storage.available:
+        return None
+    data = await async_db_bridge.storage.get(TRACE_BUCKET, trace_name(run_id))
+    if data is not None:
+        await asyncio.to_thread(path.write_bytes, data) # later frames of this run read it locally
+    return data
+
+
+async def frame_on_demand(run_id: str, wall_ms: int) -> Optional[str]:
+    """
+    Cut one evidence frame out of the mission trace and store it.
+    Concurrent requests for the same frame share one extraction.
+    """
+    storage = async_db_bridge.storage
+    if not storage.available:
+        return None
+
+    name = f"{run_id}/trace_frame_{wall_ms}.jpeg"
+    lock = _frame_locks.setdefault(name, asyncio.Lock())
+    try:
+        async with lock:
+            url = await storage.url_for(FRAME_BUCKET, name)
+            if url:
+                return url
+
+            trace = await _load_trace(run_id)
+            if trace is None:
+                return None
+            frame = await asyncio.to_thread(extract_frame, trace, wall_ms)
+            if frame is None:
+                return None
+            return await storage.put(FRAME_BUCKET, name, frame, "image/jpeg", upsert=True)
+    except Exception as e:
+        logger.error(f"Trace frame extraction failed for {run_id}@{wall_ms}: {e}")
+        return None
+    finally:
+        if not lock.locked():
+            _frame_locks.pop(name, None)
@@ -0,0 +1,322 @@
+import asyncio
+import io
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from playwright.async_api import Page
+
+from configs.settings import settings
+from data.supabase_async import async_db_bridge
+from data.supabase_client import db_bridge
+
+# numpy and Pillow load with the first comparison, not with the worker.
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger("orchestrator.visual")
+
+Region = Tuple[int, int, int, int] # x, y, width, height in CSS pixels
+
+
+@dataclass(frozen=True)
+class DiffConfig:
+    pixel_threshold: int = 24 # per-channel delta (0-255) below which a pixel is "unchanged"
+    block_size: int = 16
+    block_threshold: float = 0.05 # share of changed pixels that marks a block as changed
+    tolerance: float = 0.005 # share of changed blocks a step may drift before failing
+
+
+@dataclass
+class DiffResult:
+    step_id: int
+    changed_ratio: float
+    changed_blocks: int
+    total_blocks: int
+    max_delta: int
+    passed: bool
+    elapsed_ms: float
+    baseline_created: bool = False
+    heatmap_url: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def decode_frame(png_bytes: bytes) -> "np.ndarray":
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def ignore_mask(shape: Tuple[int, int], regions: Sequence[Region]) -> "np.ndarray":
+    import numpy as np
+
+    mask = np.zeros(shape, dtype=bool)
+    height, width = shape
+    for x, y, w, h in regions:
+        x0, y0 = max(0, int(x)), max(0, int(y))
+        x1, y1 = min(width, int(x + w)), min(height, int(y + h))
+        if x1 > x0 and y1 > y0:
+            mask[y0:y1, x0:x1] = True
+    return mask
+
+
+def diff_frames(baseline: "np.ndarray", current: "np.ndarray", config: DiffConfig,
+                regions: Sequence[Region] = ()) -> Tuple["np.ndarray", int]:
+    """
+    Vectorized block diff. Returns the per-block changed-pixel share
+    (rows x cols) and the largest channel delta outside ignored regions.
+    """
+    import numpy as np
+
+    b = config.block_size
+    height, width = baseline.shape[:2]
+    rows, cols = -(-height // b), -(-width // b)
+
+    if baseline.shape != current.shape:
+        return np.ones((rows, cols), dtype=np.float32), 255
+    if not regions and np.array_equal(baseline, current):
+        return np.zeros((rows, cols), dtype=np.float32), 0
+
+    # uint8 |a - b| without widening to int16, then the max over RGB.
+    spread = np.maximum(baseline, current)
+    spread -= np.minimum(baseline, current)
+    delta = np.maximum(np.maximum(spread[..., 0], spread[..., 1]), spread[..., 2])
+    if regions:
+        delta[ignore_mask(delta.shape, regions)] = 0
+
+    changed = (delta > config.pixel_threshold).view(np.uint8)
+
+    # Pad to a whole number of blocks (a no-op for 1280x720 with 16px blocks).
+    if rows * b != height or cols * b != width:
+        padded = np.zeros((rows * b, cols * b), dtype=np.uint8)
+        padded[:height, :width] = changed
+        changed = padded
+    counts = changed.reshape(rows, b, cols, b).sum(axis=(1, 3), dtype=np.int32)
+    return counts.astype(np.float32) / (b * b), int(delta.max())
+
+
+def render_heatmap(current: "np.ndarray", blocks: "np.ndarray", config: DiffConfig,
+                   regions: Sequence[Region] = (), scale: int = 2) -> bytes:
+    """Dimmed frame with changed blocks in red (by intensity) and ignored regions in blue."""
+    import numpy as np
+    from PIL import Image
+
+    frame = current[::scale, ::scale].astype(np.float32)
+    gray = frame.mean(axis=2, keepdims=True) * 0.45 + 40
+    out = np.repeat(gray, 3, axis=2)
+
+    b = config.block_size
+    heat = blocks.repeat(b, axis=0).repeat(b, axis=1)[:current.shape[0]:scale, :current.shape[1]:scale]
+    alpha = np.where(heat > config.block_threshold, 0.35 + 0.65 * heat, 0.0)[..., None]
+    out = out * (1 - alpha) + np.array([239, 68, 68], dtype=np.float32) * alpha
+
+    if regions:
+        mask = ignore_mask((current.shape[0], current.shape[1]), regions)[::scale, ::scale]
+        out[mask] = out[mask] * 0.5 + np.array([99, 102, 241], dtype=np.float32) * 0.5
+
+    buffer = io.BytesIO()
+    Image.fromarray(out.clip(0, 255).astype(np.uint8)).save(buffer, "WEBP", quality=70)
+    return buffer.getvalue()
+
+
+class BaselineStore:
+    """
+    Golden frames per saved test and step. Kept in the private 'baselines'
+    bucket so any worker can compare, with a local disk cache in front.
+    """
+
+    BUCKET = "baselines"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _key(self, user_id: str, test_id: str, step_id: int) -> str:
+        return f"{user_id}/{test_id}/step_{step_id}.png"
+
+    def load(self, user_id: str, test_id: str, step_id: int) -> Optional[bytes]:
+        key = self._key(user_id, test_id, step_id)
+        cached = self.root / key
+        if cached.exists():
+            return cached.read_bytes()
+
+        if not db_bridge.client:
+            return None
+        try:
+            data = db_bridge.client.storage.from_(self.BUCKET).download(key)
+        except Exception:
+            return None # no baseline yet
+        self._cache(cached, data)
+        return data
+
+    def save(self, user_id: str, test_id: str, step_id: int, png_bytes: bytes):
+        key = self._key(user_id, test_id, step_id)
+        self._cache(self.root / key, png_bytes)
+        if not db_bridge.client:
+            return
+        try:
+            db_bridge.client.storage.from_(self.BUCKET).upload(
+                path=key,
+                file=png_bytes,
+                file_options={"content-type": "image/png", "upsert": "true"}
+            )
+        except Exception as e:
+            logger.warning(f"[Visual] Baseline upload failed for {key}: {e}")
+
+    @staticmethod
+    def _cache(path: Path, data: bytes):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        except OSError as e:
+            logger.warning(f"[Visual] Baseline cache write failed: {e}")
+
+
+class VisualRegression:
+    """
+    Inline visual gate for Golden Path replays. Each step's post-action frame
+    is diffed against the stored baseline; the first replay records them.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        user_id: str,
+        test_id: str,
+        config: DiffConfig,
+        ignore_regions: Sequence[Region] = (),
+        ignore_selectors: Sequence[str] = (),
+        rebaseline: bool = False,
+        store: Optional[BaselineStore] = None,
+    ):
+        self.run_id = run_id
+        self.user_id = user_id
+        self.test_id = str(test_id)
+        self.config = config
+        self.ignore_regions = list(ignore_regions)
+        self.ignore_selectors = list(ignore_selectors)
+        self.rebaseline = rebaseline
+        self.store = store or BaselineStore(settings.BASELINES_DIR)
+        self.results: List[DiffResult] = []
+
+    @property
+    def failures(self) -> List[DiffResult]:
+        return [r for r in self.results if not r.passed]
+
+    async def _regions(self, page: Page) -> List[Region]:
+        """Static regions plus the live boxes of selector-matched dynamic content."""
+        regions = list(self.ignore_regions)
+        for selector in self.ignore_selectors:
+            try:
+                for handle in await page.locator(selector).all():
+                    box = await handle.bounding_box()
+                    if box:
+                        regions.append((box["x"], box["y"], box["width"], box["height"]))
+            except Exception as e:
+                logger.debug(f"[Visual] Ignore selector '{selector}' skipped: {e}")
+        return regions
+
+    def _compare(self, step_id: int, baseline_png: bytes, current_png: bytes,
+                 regions: Sequence[Region]) -> Tuple[DiffResult, Optional[bytes]]:
+        started = time.perf_counter()
+        current = decode_frame(current_png)
+        baseline = decode_frame(baseline_png)
+        baseline_shape = baseline.shape
+        blocks, max_delta = diff_frames(baseline, current, self.config, regions)
+        changed = int((blocks > self.config.block_threshold).sum())
+        ratio = changed / blocks.size
+        result = DiffResult(
+            step_id=step_id,
+            changed_ratio=round(ratio, 5),
+            changed_blocks=changed,
+            total_blocks=int(blocks.size),
+            max_delta=max_delta,
+            passed=ratio <= self.config.tolerance,
+            elapsed_ms=0.0,
+        )
+        comparable = baseline_shape == current.shape
+        heatmap = render_heatmap(current, blocks, self.config, regions) if changed and comparable else None
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        return result, heatmap
+
+    async def check(self, page: Page, step_id: int, png_bytes: Optional[bytes] = None) -> Optional[DiffResult]:
+        if not page:
+            return None
+        if png_bytes is None:
+            png_bytes = await page.screenshot(type="png", full_page=False)
+
+        baseline = None if self.rebaseline else await asyncio.to_thread(
+            self.store.load, self.user_id, self.test_id, step_id
+        )
+        if baseline is None:
+            await asyncio.to_thread(self.store.save, self.user_id, self.test_id, step_id, png_bytes)
+            result = DiffResult(step_id, 0.0, 0, 0, 0, True, 0.0, baseline_created=True)
+            self.results.append(result)
+            await async_db_bridge.log_step(
+                run_id=self.run_id, step_id=step_id, role="system", action="visual_diff", status="INFO",
+                message=f"👁️ Baseline recorded for step {step_id}", details=json.dumps(result.as_dict())
+            )
+            return result
+
+        regions = await self._regions(page)
+        result, heatmap = await asyncio.to_thread(self._compare, step_id, baseline, png_bytes, regions)
+        if heatmap:
+            result.heatmap_url = await async_db_bridge.upload_screenshot(heatmap, self.run_id, "image/webp", "webp")
+        self.results.append(result)
+
+        await async_db_bridge.log_step(
+            run_id=self.run_id,
+            step_id=step_id,
+            role="system",
+            action="visual_diff",
+            status="PASSED" if result.passed else "FAILED",
+            message=(
+                f"👁️ Visual drift {result.changed_ratio:.2%} of blocks "
+                f"(tolerance {self.config.tolerance:.2%}, {result.elapsed_ms:.0f} ms)"
+            ),
+            screenshot_url=result.heatmap_url,
+            details=json.dumps(result.as_dict())
+        )
+        return result
+
+    def summary(self) -> str:
+        compared = [r for r in self.results if not r.baseline_created]
+        recorded = len(self.results) - len(compared)
+        text = f"👁️ Visual regression: {len(compared) - len(self.failures)}/{len(compared)} steps within tolerance"
+        if recorded:
+            text += f", {recorded} baselines recorded"
+        return text
+
+
+def build_visual_regression(run_id: str, user_id: str, payload: Dict[str, Any]) -> Optional[VisualRegression]:
+    """Visual gate for a replay payload; None when there is no saved test to anchor baselines."""
+    test_id = payload.get("test_id")
+    if not test_id or not settings.VISUAL_REGRESSION:
+        return None
+
+    options = payload.get("visual") or {}
+    config = DiffConfig(
+        pixel_threshold=int(options.get("pixel_threshold", settings.VISUAL_PIXEL_THRESHOLD)),
+        block_size=int(options.get("block_size", settings.VISUAL_BLOCK_SIZE)),
+        block_threshold=float(options.get("block_threshold", settings.VISUAL_BLOCK_THRESHOLD)),
+        tolerance=float(options.get("tolerance", settings.VISUAL_TOLERANCE)),
+    )
+    regions = [
+        (r["x"], r["y"], r["width"], r["height"])
+        for r in options.get("ignore_regions", []) if all(k in r for k in ("x", "y", "width", "height"))
+    ]
+    selectors = options.get("ignore_selectors") or [
+        s.strip() for s in settings.VISUAL_IGNORE_SELECTORS.split(",") if s.strip()
+    ]
+    return VisualRegression(
+        run_id, user_id, test_id, config,
+        ignore_regions=regions,
+        ignore_selectors=selectors,
+        rebaseline=bool(options.get("rebaseline")),
+    )
@@ -0,0 +1,112 @@
+import asyncio
+import importlib
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ai.provider import AIProvider
+from automation.core.browser import browser_launcher
+from automation.core.executor import mission_executor
+from automation.core.tracing import prune_traces
+from configs.settings import bootstrap_system, settings
+from data.checkpoint import checkpoint_store
+from data.supabase_async import async_db_bridge
+from data.supabase_client import db_bridge
+
+logger = logging.getLogger("orchestrator.warmup")
+
+
+def warmup_providers() -> List[str]:
+    extra = [p.strip() for p in settings.WARMUP_PROVIDERS.split(",") if p.strip()]
+    return list(dict.fromkeys([settings.AI_PROVIDER, *extra]))
+
+
+class WorkerWarmup:
+    """
+    Brings a freshly started worker up to speed in the background while it
+    already answers health checks: storage directories, pooled database
+    connections, provider SDKs and reportlab, and either the mission process
+    pool or a pre-launched browser. Failed steps are logged and skipped; the
+    worker is ready once every step has run.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.seconds: Optional[float] = None
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def _step(self, name: str, fn: Callable[[], Awaitable[Any]]):
+        started = time.perf_counter()
+        try:
+            detail, ok = await fn(), True
+        except Exception as e:
+            detail, ok = str(e), False
+            logger.warning(f"🔥 Warm-up step '{name}' failed: {e}")
+        self.steps[name] = {"ok": ok, "seconds": round(time.perf_counter() - started, 3), "detail": detail}
+
+    @staticmethod
+    async def _storage() -> Dict[str, int]:
+        await asyncio.to_thread(bootstrap_system)
+        checkpoints = await asyncio.to_thread(checkpoint_store.prune, settings.CHECKPOINT_MAX_AGE_HOURS * 3600)
+        traces = await asyncio.to_thread(prune_traces, settings.TRACE_MAX_AGE_HOURS * 3600)
+        if checkpoints:
+            logger.info(f"🧹 Pruned {checkpoints} stale mission checkpoints")
+        if traces:
+            logger.info(f"🧹 Pruned {traces} local mission traces")
+        return {"pruned_checkpoints": checkpoints, "pruned_traces": traces}
+
+    @staticmethod
+    async def _database() -> Dict[str, bool]:
+        pooled = await async_db_bridge.warm()
+        client = await asyncio.to_thread(lambda: db_bridge.client is not None)
+        return {"pooled": pooled, "client": client}
+
+    @staticmethod
+    async def _libraries() -> Dict[str, float]:
+        timings = await asyncio.to_thread(AIProvider.preload, warmup_providers())
+        started = time.perf_counter()
+        await asyncio.to_thread(importlib.import_module, "ai.pdf_renderer")
+        timings["reportlab"] = round(time.perf_counter() - started, 3)
+        return timings
+
+    @staticmethod
+    async def _missions() -> Dict[str, Any]:
+        if mission_executor:
+            return {"processes": await mission_executor.warm(warmup_providers())}
+        if not settings.BROWSER_PRELAUNCH:
+            return {"browser": "on demand"}
+        browser_launcher.prelaunch()
+        return {"browser": "standby" if await browser_launcher.ready() else "on demand"}
+
+    async def run(self, on_ready: Optional[Callable[[], None]] = None):
+        started = time.perf_counter()
+        await self._step("storage", self._storage)
+        await asyncio.gather(
+            self._step("database", self._database),
+            self._step("libraries", self._libraries),
+            self._step("missions", self._missions),
+        )
+        self.seconds = round(time.perf_counter() - started, 2)
+        self.ready = True
+        logger.info(f"🔥 Worker warm in {self.seconds}s")
+        if on_ready:
+            on_ready()
+
+    def start(self, on_ready: Optional[Callable[[], None]] = None) -> asyncio.Task:
+        self._task = asyncio.create_task(self.run(on_ready))
+        return self._task
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> Dict[str, Any]:
+        return {"status": "ready" if self.ready else "warming", "seconds": self.seconds, "steps": self.steps}
+
+
+worker_warmup = WorkerWarmup()
@@ -0,0 +1,9 @@
+"""
+Offline benchmark suite for the orchestrator's hot paths.
+
+Runs against a generated fixture site on 127.0.0.1 with a deterministic
+stub model, so numbers are comparable between versions:
+
+    python -m benchmarks [--only extract_json,report] [--fail-on-regression]
+    python -m benchmarks.load --rates 0.2,0.5,1
+"""
@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+from benchmarks.suite import (
+    BENCHMARKS, BenchOptions, compare, load_previous, run_suite, save_results,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Offline orchestrator benchmarks")
+    parser.add_argument("--only", default=",".join(BENCHMARKS), help=f"comma-separated subset of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--missions", type=int, default=6)
+    parser.add_argument("--concurrency", type=int, default=2)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--heals", type=int, default=10)
+    parser.add_argument("--plans", type=int, default=20)
+    parser.add_argument("--report-sizes", default="50,1000")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated model round trip")
+    parser.add_argument("--min-seconds", type=float, default=1.0)
+    parser.add_argument("--baseline", type=Path, help="results file to compare against (default: latest stored)")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change counted as a regression")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+    if not args.verbose:
+        # The runner and crawler log every step; keep the benchmark output readable.
+        logging.getLogger("orchestrator").setLevel(logging.ERROR)
+        logging.getLogger("orchestrator.bench").setLevel(logging.WARNING)
+
+    options = BenchOptions(
+        only=[b.strip() for b in args.only.split(",") if b.strip()],
+        missions=args.missions,
+        concurrency=args.concurrency,
+        pages=args.pages,
+        heals=args.heals,
+        plans=args.plans,
+        report_sizes=[int(s) for s in args.report_sizes.split(",") if s.strip()],
+        latency_ms=args.latency_ms,
+        min_seconds=args.min_seconds,
+    )
+
+    results = asyncio.run(run_suite(options))
+    saved = None if args.no_save else save_results(results)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else load_previous(exclude=saved)
+
+    print(f"\nBenchmarks @ {results['commit']} ({results['python']})")
+    for name, metric in results["metrics"].items():
+        print(f"  {name:<32} {metric['value']:>12} {metric['unit']}")
+    for name, reason in results["skipped"].items():
+        print(f"  {name:<32} {'skipped':>12} {reason}")
+
+    regressions = []
+    if baseline:
+        rows = compare(results, baseline, args.threshold)
+        regressions = [r for r in rows if r["regression"]]
+        print(f"\nAgainst {baseline['commit']} ({baseline['created_at']}), threshold {args.threshold:.0%}:")
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else ""
+            print(f"  {row['metric']:<32} {row['baseline']:>12} -> {row['current']:<12} {row['change']:+.1%} {flag}")
+    if saved:
+        print(f"\nSaved {saved}")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
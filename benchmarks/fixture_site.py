@@ -0,0 +1,144 @@
+import html
+import logging
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger("orchestrator.bench.fixture")
+
+# Stable hooks the stub planner and healer rely on.
+LOGIN_PATH = "/account/login"
+DASHBOARD_PATH = "/account/dashboard"
+WELCOME_TEXT = "Welcome back"
+
+
+class FixtureSite:
+    """
+    Generated storefront served from memory on 127.0.0.1.
+
+    Every page shares the same header, navigation and footer so it looks
+    like a real site to the crawler, and the layout is seeded so runs on
+    different versions see byte-identical pages.
+    """
+
+    def __init__(self, products: int = 18, seed: int = 7):
+        self.products = products
+        self.seed = seed
+        self.pages: Dict[str, bytes] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.base_url = ""
+        self._generate()
+
+    # --- Generation ---
+
+    @staticmethod
+    def _layout(title: str, body: str) -> bytes:
+        nav = "".join(
+            f"<li><a href='{href}'>{label}</a></li>"
+            for href, label in (
+                ("/", "Home"), ("/products", "Catalog"), ("/search", "Search"),
+                ("/about", "About"), ("/contact", "Contact"), (LOGIN_PATH, "Sign in"),
+            )
+        )
+        return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{html.escape(title)} | Fixture Store</title>
+<style>body{{font-family:sans-serif;margin:0}}header,footer{{background:#0f172a;color:#fff;padding:12px 24px}}
+main{{padding:24px}}nav ul{{display:flex;gap:16px;list-style:none;margin:0;padding:0}}nav a{{color:#c7d2fe}}
+table{{border-collapse:collapse}}td,th{{border:1px solid #cbd5e1;padding:4px 8px}}</style></head>
+<body><header><strong>Fixture Store</strong><nav><ul>{nav}</ul></nav></header>
+<div id="cookie-banner" role="dialog">We use cookies to improve your experience. <button>Accept</button></div>
+<main><h1>{html.escape(title)}</h1>{body}</main>
+<footer><p>&copy; Fixture Store. All rights reserved.</p>
+<p><a href="/about">Company</a> &middot; <a href="/contact">Support</a> &middot; <a href="/search?q=returns">Returns</a></p></footer>
+</body></html>""".encode("utf-8")
+
+    def _generate(self):
+        rng = random.Random(self.seed)
+        adjectives = ["Quantum", "Stealth", "Carbon", "Aurora", "Vector", "Nimbus", "Titan", "Echo"]
+        nouns = ["Keyboard", "Drone", "Backpack", "Lamp", "Headset", "Router", "Monitor", "Kettle"]
+        names = [f"{rng.choice(adjectives)} {rng.choice(nouns)} {i}" for i in range(self.products)]
+        prices = [rng.randint(9, 499) for _ in range(self.products)]
+
+        rows = "".join(
+            f"<tr><td><a href='/products/{i}'>{html.escape(n)}</a></td><td>${p}</td></tr>"
+            for i, (n, p) in enumerate(zip(names, prices))
+        )
+        self.pages["/"] = self._layout("Home", (
+            "<p>Hand-picked gear for testing teams.</p>"
+            + "".join(f"<a href='/products/{i}'>{html.escape(names[i])}</a> " for i in range(min(6, self.products)))
+        ))
+        self.pages["/products"] = self._layout("Catalog", f"<table><tr><th>Item</th><th>Price</th></tr>{rows}</table>")
+        self.pages["/search"] = self._layout("Search", (
+            "<form action='/search'><input id='q' name='q' aria-label='Search'>"
+            "<button data-testid='search-submit'>Search</button></form>"
+            f"<table>{rows[: len(rows) // 2]}</table>"
+        ))
+        self.pages["/about"] = self._layout("About", "<p>Since 2019 we ship deterministic fixtures worldwide.</p>")
+        self.pages["/contact"] = self._layout("Contact", (
+            "<form action='/contact'><input name='name' placeholder='Name'>"
+            "<textarea name='message'></textarea><button data-testid='contact-submit'>Send</button></form>"
+        ))
+        self.pages[LOGIN_PATH] = self._layout("Sign in", (
+            f"<form action='{DASHBOARD_PATH}' method='get'>"
+            "<label for='email'>Email</label><input id='email' name='email' type='email'>"
+            "<label for='password'>Password</label><input id='password' name='password' type='password'>"
+            "<button type='submit' data-testid='login-submit' class='btn btn-primary'>Sign in</button></form>"
+        ))
+        self.pages[DASHBOARD_PATH] = self._layout("Dashboard", (
+            f"<p>{WELCOME_TEXT}, bench user.</p><a href='/cart'>Open cart</a>"
+        ))
+        self.pages["/cart"] = self._layout("Cart", "<p>Cart: 1 item reserved.</p><a href='/products'>Keep shopping</a>")
+
+        for i, (name, price) in enumerate(zip(names, prices)):
+            related: List[int] = rng.sample(range(self.products), k=min(3, self.products))
+            links = "".join(f"<li><a href='/products/{j}'>{html.escape(names[j])}</a></li>" for j in related if j != i)
+            self.pages[f"/products/{i}"] = self._layout(name, (
+                f"<p class='price'>${price}</p><p>{html.escape(name)} ships in 2-3 days.</p>"
+                f"<a href='/cart?added={i}' data-testid='add-to-cart' role='button'>Add to cart</a>"
+                f"<h2>Related</h2><ul>{links}</ul>"
+            ))
+
+    # --- Serving ---
+
+    def _handler(self):
+        pages = self.pages
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = pages.get(urlparse(self.path).path)
+                self.send_response(200 if body else 404)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                payload = body or b"<h1>Not Found</h1>"
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-site", daemon=True)
+        self._thread.start()
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        logger.info(f"🧪 Fixture site serving {len(self.pages)} pages at {self.base_url}")
+        return self.base_url
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FixtureSite":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
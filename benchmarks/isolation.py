@@ -0,0 +1,78 @@
+"""
+Crash isolation check for the process executor.
+
+    python -m benchmarks.isolation [--hold 3]
+
+Runs two idle missions side by side on a two-process MissionExecutor,
+SIGKILLs the process of one of them and checks that the other finishes in
+its original process on its first attempt, with only one crash counted.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import sys
+import time
+from typing import Any, Dict
+
+from automation.core.executor import MissionExecutor
+
+IDLE_MODES = {"idle": "benchmarks.isolation:idle_mission"}
+
+
+async def idle_mission(payload: Dict[str, Any]):
+    """Mission stand-in: holds its process for payload['seconds']."""
+    await asyncio.sleep(payload.get("seconds", 1))
+
+
+async def _running(executor: MissionExecutor, run_id: str, timeout: float) -> Dict[str, Any]:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        entry = executor.active.get(run_id)
+        if entry and entry.get("started_at"):
+            return entry
+        await asyncio.sleep(0.05)
+    raise TimeoutError(f"{run_id} did not start within {timeout}s")
+
+
+async def crash_isolation(hold: float = 3.0, timeout: float = 60.0) -> Dict[str, Any]:
+    executor = MissionExecutor(processes=2, missions_per_process=5, modes=IDLE_MODES)
+    executor.start()
+    try:
+        victim = await executor.submit("idle", {"run_id": "isolation-victim", "seconds": hold})
+        survivor = await executor.submit("idle", {"run_id": "isolation-survivor", "seconds": hold})
+        victim_entry = await _running(executor, "isolation-victim", timeout)
+        survivor_entry = await _running(executor, "isolation-survivor", timeout)
+        survivor_pid = survivor_entry["pid"]
+
+        os.kill(victim_entry["pid"], signal.SIGKILL)
+        await asyncio.wait_for(asyncio.gather(victim, survivor), timeout)
+    finally:
+        executor.shutdown()
+
+    isolated = survivor_entry["pid"] == survivor_pid and survivor_entry["attempts"] == 1 and executor.crashed == 1
+    return {
+        "isolated": isolated,
+        "survivor_attempts": survivor_entry["attempts"],
+        "victim_attempts": victim_entry["attempts"],
+        "crashed": executor.crashed,
+        "completed": executor.completed,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.isolation", description="Mission process crash isolation")
+    parser.add_argument("--hold", type=float, default=3.0, help="seconds each idle mission runs")
+    args = parser.parse_args()
+
+    result = asyncio.run(crash_isolation(args.hold))
+    print(
+        f"crash isolation: {'ok' if result['isolated'] else 'FAILED'} "
+        f"(survivor attempts {result['survivor_attempts']}, victim attempts {result['victim_attempts']}, "
+        f"crashed {result['crashed']}, completed {result['completed']})"
+    )
+    return 0 if result["isolated"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""
+Load generator for worker_api /mission.
+
+    python -m benchmarks.load --rates 0.2,0.5,1 --stage-seconds 30
+
+Serves the fixture site, starts an instrumented worker (benchmarks.load_worker)
+as a subprocess and posts base64 mission payloads at each arrival rate in
+turn. Reports dispatch latency, queueing delay, mission latency
+percentiles, error rate and the worker's RSS (including Chromium) over time.
+"""
+import argparse
+import asyncio
+import base64
+import datetime
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.fixture_site import FixtureSite
+from benchmarks.stub_provider import STUB_PROVIDER
+from benchmarks.suite import RESULTS_DIR, _git_commit, _percentile
+from configs.settings import BASE_DIR
+
+logger = logging.getLogger("orchestrator.bench.load")
+
+LOAD_RESULTS_DIR = RESULTS_DIR / "load"
+TERMINAL_STATUSES = frozenset({"COMPLETED", "FAILED"})
+
+
+def build_mission_payload(run_id: str, base_url: str, user_id: str = "load-test",
+                          mode: str = "sniper", provider: str = STUB_PROVIDER) -> Dict[str, List[str]]:
+    """Request body in the dashboard's dispatch format: {"data": [base64(json)]}."""
+    payload = {
+        "user_id": user_id,
+        "run_id": run_id,
+        "api_key": None,
+        "provider": provider,
+        "model": "stub",
+        "mode": mode,
+        "url": base_url,
+        "intent": "Load test mission",
+        "instructions": f"Sign in to {base_url} and add a product to the cart",
+        "context": {"baseUrl": base_url, "testData": {}},
+        "telemetry_enabled": False,
+    }
+    return {"data": [base64.b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")]}
+
+
+def process_tree_rss_mb(pid: int) -> Optional[float]:
+    """RSS of a process and all its descendants (Chromium runs as children). Linux only."""
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+
+    children: Dict[int, List[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            ppid = int(stat.rsplit(")", 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry.name))
+        except (OSError, ValueError, IndexError):
+            continue
+
+    total_kb, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            for line in (proc / str(current) / "status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kb += int(line.split()[1])
+                    break
+        except OSError:
+            continue
+    return round(total_kb / 1024, 1)
+
+
+@dataclass
+class Dispatch:
+    run_id: str
+    stage: float
+    sent_at: float
+    latency_ms: float = 0.0
+    http_status: Optional[int] = None
+    worker_status: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class LoadOptions:
+    rates: List[float] = field(default_factory=lambda: [0.2, 0.5, 1.0])
+    stage_seconds: float = 30.0
+    arrival: str = "poisson" # poisson | constant
+    drain_timeout: float = 180.0
+    sample_interval: float = 0.5
+    latency_ms: float = 0.0
+    seed: int = 7
+
+
+class LoadHarness:
+    def __init__(self, options: LoadOptions):
+        self.options = options
+        self.dispatches: List[Dispatch] = []
+        self.rss_samples: List[List[float]] = []
+        self._worker: Optional[subprocess.Popen] = None
+        self._started = 0.0
+
+    @staticmethod
+    def _free_port() -> int:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def _spawn_worker(self, port: int, fixture_url: str, log_path: Path):
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._worker = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.load_worker", "--port", str(port),
+             "--fixture-url", fixture_url, "--latency-ms", str(self.options.latency_ms)],
+            cwd=BASE_DIR,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            stdout=log_path.open("wb"),
+            stderr=subprocess.STDOUT,
+        )
+
+    async def _wait_ready(self, client: httpx.AsyncClient, timeout: float = 60.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._worker.poll() is not None:
+                raise RuntimeError(f"Worker exited with code {self._worker.returncode} during startup")
+            try:
+                if (await client.get("/")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.25)
+        raise TimeoutError("Worker did not become ready")
+
+    async def _sample_rss(self):
+        while True:
+            rss = process_tree_rss_mb(self._worker.pid)
+            if rss is not None:
+                self.rss_samples.append([round(time.monotonic() - self._started, 2), rss])
+            await asyncio.sleep(self.options.sample_interval)
+
+    async def _dispatch(self, client: httpx.AsyncClient, rate: float, base_url: str):
+        run_id = str(uuid.uuid4())
+        record = Dispatch(run_id=run_id, stage=rate, sent_at=time.time())
+        self.dispatches.append(record)
+        started = time.perf_counter()
+        try:
+            response = await client.post("/mission", json=build_mission_payload(run_id, base_url))
+            record.http_status = response.status_code
+            record.worker_status = response.json().get("status")
+        except Exception as e:
+            record.error = str(e) or type(e).__name__
+        record.latency_ms = (time.perf_counter() - started) * 1000
+
+    async def _stage(self, client: httpx.AsyncClient, rate: float, base_url: str, rng: random.Random):
+        logger.warning(f"📈 Stage {rate}/s for {self.options.stage_seconds:.0f}s")
+        tasks = []
+        deadline = time.monotonic() + self.options.stage_seconds
+        while time.monotonic() < deadline:
+            tasks.append(asyncio.create_task(self._dispatch(client, rate, base_url)))
+            gap = rng.expovariate(rate) if self.options.arrival == "poisson" else 1 / rate
+            await asyncio.sleep(gap)
+        await asyncio.gather(*tasks)
+
+    async def _drain(self, client: httpx.AsyncClient) -> Dict[str, Dict[str, Any]]:
+        """Wait until every accepted mission reached a terminal status (or time out)."""
+        accepted = {d.run_id for d in self.dispatches if d.worker_status == "queued"}
+        deadline = time.monotonic() + self.options.drain_timeout
+        ledger: Dict[str, Dict[str, Any]] = {}
+        while time.monotonic() < deadline:
+            ledger = (await client.get("/bench/ledger")).json()
+            if all(ledger.get(r, {}).get("status") in TERMINAL_STATUSES for r in accepted):
+                break
+            await asyncio.sleep(1)
+        return ledger
+
+    def _summarize(self, ledger: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        stages = []
+        for rate in self.options.rates:
+            batch = [d for d in self.dispatches if d.stage == rate]
+            runs = [ledger.get(d.run_id, {}) for d in batch]
+            queueing = [(r["started"] - r["received"]) * 1000 for r in runs if "started" in r and "received" in r]
+            latency = [r["finished"] - r["received"] for r in runs if "finished" in r and "received" in r]
+            errors = sum(
+                1 for d, r in zip(batch, runs)
+                if d.error or d.http_status != 200 or d.worker_status != "queued" or r.get("status") != "COMPLETED"
+            )
+
+            def pct(samples: List[float], p: float) -> Optional[float]:
+                return round(_percentile(samples, p), 3) if samples else None
+
+            stages.append({
+                "rate_per_s": rate,
+                "sent": len(batch),
+                "completed": sum(1 for r in runs if r.get("status") == "COMPLETED"),
+                "unfinished": sum(1 for r in runs if "finished" not in r),
+                "error_rate": round(errors / len(batch), 3) if batch else None,
+                "dispatch_ms": {p: pct([d.latency_ms for d in batch], int(p[1:])) for p in ("p50", "p95", "p99")},
+                "queueing_ms": {p: pct(queueing, int(p[1:])) for p in ("p50", "p95", "p99")},
+                "mission_s": {p: pct(latency, int(p[1:])) for p in ("p50", "p95", "p99")},
+            })
+
+        return {
+            "commit": _git_commit(),
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "options": self.options.__dict__,
+            "stages": stages,
+            "rss_mb": {
+                "peak": max((s[1] for s in self.rss_samples), default=None),
+                "timeline": self.rss_samples,
+            },
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        port = self._free_port()
+        rng = random.Random(self.options.seed)
+        log_path = LOAD_RESULTS_DIR / "worker.log"
+
+        with FixtureSite() as site:
+            self._spawn_worker(port, site.base_url, log_path)
+            sampler = None
+            try:
+                async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=60) as client:
+                    await self._wait_ready(client)
+                    self._started = time.monotonic()
+                    sampler = asyncio.create_task(self._sample_rss())
+
+                    for rate in self.options.rates:
+                        await self._stage(client, rate, site.base_url, rng)
+                    ledger = await self._drain(client)
+            finally:
+                if sampler:
+                    sampler.cancel()
+                self._worker.terminate()
+                try:
+                    self._worker.wait(timeout=15)
+                except subprocess.TimeoutExpired:
+                    self._worker.kill()
+
+        return self._summarize(ledger)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description="Load test worker_api /mission")
+    parser.add_argument("--rates", default="0.2,0.5,1", help="arrival rates in missions/s, one stage each")
+    parser.add_argument("--stage-seconds", type=float, default=30.0)
+    parser.add_argument("--arrival", choices=("poisson", "constant"), default="poisson")
+    parser.add_argument("--drain-timeout", type=float, default=180.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated model round trip")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+    options = LoadOptions(
+        rates=[float(r) for r in args.rates.split(",") if r.strip()],
+        stage_seconds=args.stage_seconds,
+        arrival=args.arrival,
+        drain_timeout=args.drain_timeout,
+        latency_ms=args.latency_ms,
+        seed=args.seed,
+    )
+    results = asyncio.run(LoadHarness(options).run())
+
+    print(f"\nLoad test @ {results['commit']} (peak worker RSS {results['rss_mb']['peak']} MB)")
+    for s in results["stages"]:
+        print(
+            f"  {s['rate_per_s']:>5}/s  sent {s['sent']:>4}  done {s['completed']:>4}  errors {s['error_rate']:.1%}  "
+            f"dispatch p95 {s['dispatch_ms']['p95']} ms  queue p95 {s['queueing_ms']['p95']} ms  "
+            f"mission p50/p95/p99 {s['mission_s']['p50']}/{s['mission_s']['p95']}/{s['mission_s']['p99']} s"
+        )
+
+    if not args.no_save:
+        LOAD_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = results["created_at"].replace(":", "").replace("-", "").split("+")[0]
+        path = LOAD_RESULTS_DIR / f"{stamp}_{results['commit']}.json"
+        path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nSaved {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
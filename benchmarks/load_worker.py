@@ -0,0 +1,90 @@
+"""
+worker_api under load-test instrumentation.
+
+Started by benchmarks.load as a subprocess: model calls go to the stub
+provider, the database is offline, and a MissionLedger records each run's
+lifecycle where the dashboard would otherwise read it from test_runs.
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+# Missions must run in this process for the ledger to see them; settings
+# are read at import, so pin them before anything imports configs.settings.
+os.environ["MISSION_EXECUTOR"] = "inline"
+os.environ["JOB_POLLING"] = "false"
+
+import uvicorn  # noqa: E402
+
+from benchmarks.load import TERMINAL_STATUSES  # noqa: E402
+from benchmarks.stub_provider import StubLLM  # noqa: E402
+from data.storage import LocalContentStore  # noqa: E402
+from data.supabase_async import async_db_bridge  # noqa: E402
+from data.supabase_client import db_bridge  # noqa: E402
+
+
+class MissionLedger:
+    """Receive/start/finish timestamps per run, captured at the async_db_bridge seam."""
+
+    def __init__(self):
+        self.runs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _touch(self, run_id: str, **fields):
+        with self._lock:
+            self.runs.setdefault(run_id, {}).update(fields)
+
+    def install(self):
+        db_bridge.client = None
+        async_db_bridge.url = ""
+        self._artifacts = tempfile.TemporaryDirectory(prefix="argus-load-") # removed when the worker exits
+        async_db_bridge.storage = LocalContentStore(Path(self._artifacts.name))
+
+        async def init_run(run_id, user_id, url, mode, intent) -> bool:
+            self._touch(run_id, received=time.time())
+            return True
+
+        async def start_run(run_id, mode) -> bool:
+            self._touch(run_id, started=time.time())
+            return True
+
+        async def update_run_status(run_id, status) -> bool:
+            if status in TERMINAL_STATUSES:
+                self._touch(run_id, finished=time.time(), status=status)
+            return True
+
+        async_db_bridge.init_run = init_run
+        async_db_bridge.start_run = start_run
+        async_db_bridge.update_run_status = update_run_status
+        return self
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {k: dict(v) for k, v in self.runs.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_worker")
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--fixture-url", required=True)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    StubLLM(args.fixture_url, latency_ms=args.latency_ms).install()
+    ledger = MissionLedger().install()
+
+    from worker_api import app
+
+    @app.get("/bench/ledger")
+    async def read_ledger():
+        return ledger.snapshot()
+
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Import-time profile of the worker.
+
+    python -m benchmarks.startup [--module worker_api] [--top 25] [--runs 3]
+
+Imports the module in fresh interpreters with `-X importtime` and reports
+the total import time (median over runs) and the slowest modules by
+cumulative time, so an eager SDK import creeping back into the startup
+path shows up by name.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List
+
+from configs.settings import BASE_DIR
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        records.append(ImportRecord(
+            module=name.strip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=(len(name) - len(name.lstrip(" ")) - 1) // 2,
+        ))
+    return records
+
+
+def profile_imports(module: str = "worker_api") -> List[ImportRecord]:
+    """One cold import of `module` in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BASE_DIR, capture_output=True, text=True, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed: {proc.stderr.strip().splitlines()[-1:]}")
+    return parse_importtime(proc.stderr)
+
+
+def startup_profile(module: str = "worker_api", runs: int = 3, top: int = 25) -> Dict[str, object]:
+    samples = [profile_imports(module) for _ in range(max(1, runs))]
+    totals = [next(r.cumulative_us for r in records if r.module == module) for records in samples]
+    median_run = samples[totals.index(sorted(totals)[len(totals) // 2])]
+    slowest = sorted((r for r in median_run if r.module != module), key=lambda r: -r.cumulative_us)
+    return {
+        "module": module,
+        "import_ms": round(statistics.median(totals) / 1000, 1),
+        "modules": len(median_run),
+        "slowest": [
+            {"module": r.module, "cumulative_ms": round(r.cumulative_us / 1000, 1), "self_ms": round(r.self_us / 1000, 1)}
+            for r in slowest if r.depth <= 2
+        ][:top],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description="Worker import-time profile")
+    parser.add_argument("--module", default="worker_api")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    profile = startup_profile(args.module, args.runs, args.top)
+    print(f"import {profile['module']}: {profile['import_ms']} ms, {profile['modules']} modules (median of {args.runs})")
+    print(f"  {'module':<48} {'cumulative':>12} {'self':>10}")
+    for row in profile["slowest"]:
+        print(f"  {row['module']:<48} {row['cumulative_ms']:>10} ms {row['self_ms']:>7} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
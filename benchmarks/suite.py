@@ -0,0 +1,429 @@
+import asyncio
+import datetime
+import json
+import logging
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ai.crawler import AutonomousCrawler
+from ai.healer import heal_selector
+from ai.pdf_renderer import render_report_pdf
+from ai.planner import generate_test_plan, planning_stats
+from ai.json_extract import extract_json
+from ai.report_formats import render_html, render_json
+from ai.reporter import QA_Reporter
+from automation.core.runner import AutomationRunner
+from benchmarks.fixture_site import LOGIN_PATH, FixtureSite
+from benchmarks.isolation import crash_isolation
+from benchmarks.startup import startup_profile
+from benchmarks.stub_provider import STUB_PROVIDER, StubLLM
+from configs.settings import BASE_DIR
+from data.checkpoint import checkpoint_store
+from data.supabase_async import async_db_bridge
+from data.storage import LocalContentStore
+from data.supabase_client import db_bridge
+
+logger = logging.getLogger("orchestrator.bench")
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+BENCHMARKS = ("startup", "isolation", "extract_json", "planner", "report", "healer", "crawler", "missions")
+BROWSER_BENCHMARKS = frozenset({"healer", "crawler", "missions"})
+
+
+@dataclass
+class Metric:
+    value: float
+    unit: str
+    higher_is_better: bool = True
+
+
+@dataclass
+class BenchOptions:
+    only: List[str] = field(default_factory=lambda: list(BENCHMARKS))
+    missions: int = 6
+    concurrency: int = 2
+    pages: int = 20
+    heals: int = 10
+    plans: int = 20
+    report_sizes: List[int] = field(default_factory=lambda: [50, 1000])
+    latency_ms: float = 0.0
+    min_seconds: float = 1.0 # minimum wall time per micro-benchmark
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _traced_peak_mb(fn: Callable[[], Any]) -> float:
+    """Python heap high-water mark for one untimed call."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True, timeout=5
+        ).stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+async def _browser_unavailable() -> Optional[str]:
+    """Reason the browser benchmarks cannot run here, or None."""
+    try:
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            await browser.close()
+        return None
+    except Exception as e:
+        return str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+
+
+# --- CPU-bound hot paths ---
+
+def bench_startup() -> Dict[str, Metric]:
+    """Cold import of worker_api in fresh interpreters (see python -m benchmarks.startup)."""
+    profile = startup_profile("worker_api", runs=3, top=5)
+    logger.warning("🐢 Slowest imports: " + ", ".join(f"{r['module']} {r['cumulative_ms']}ms" for r in profile["slowest"]))
+    return {
+        "worker_import_ms": Metric(profile["import_ms"], "ms", False),
+        "worker_import_modules": Metric(profile["modules"], "modules", False),
+    }
+
+
+async def bench_isolation() -> Dict[str, Metric]:
+    """One of two concurrent missions loses its process (see python -m benchmarks.isolation)."""
+    result = await crash_isolation(hold=2.0)
+    return {
+        "executor_crash_isolated": Metric(float(result["isolated"]), "ratio"),
+        "executor_survivor_attempts": Metric(result["survivor_attempts"], "attempts", False),
+    }
+
+
+def _adversarial_responses() -> List[Tuple[str, str, Any]]:
+    """(name, response, expected value) shapes that make backtracking extractors crawl."""
+    answer = {"page_type": "general", "status": "OK"}
+    doc = json.dumps(answer)
+    return [
+        ("unclosed_think", "<think>" * 20_000 + doc, answer),
+        ("fence_storm", "```" * 20_000 + "\n" + doc, answer),
+        ("open_brackets", "[" * 50_000 + " " + doc, answer),
+        ("prose_braces", "use {placeholders} like {this} " * 5_000 + doc, answer),
+        ("braces_in_strings", json.dumps({"html": "{[<div>]}" * 20_000, "status": "OK"}), {"html": "{[<div>]}" * 20_000, "status": "OK"}),
+        ("whitespace_run", "{" + " " * 200_000 + "x", None),
+        ("truncated_plan", json.dumps([{"step_id": i, "action": "click"} for i in range(5_000)])[:-2], {"step_id": 0, "action": "click"}),
+    ]
+
+
+def bench_extract_json(stub: StubLLM, min_seconds: float) -> Dict[str, Metric]:
+    """Throughput of the shared JSON extractor over realistic and adversarial model responses."""
+    big_plan = [
+        {"step_id": i, "action": "click", "selector": f"[data-testid='item-{i}']", "description": f"Step {i} " + "x" * 40}
+        for i in range(300)
+    ]
+    corpus = [
+        stub(prompt, None, None) for prompt in (
+            "INTENT: sign in",
+            "Autonomous QA DOM Analyst\nURL: http://127.0.0.1/products",
+            "Resolve a broken UI selector\n- Action: Submit sign-in\n<button data-testid='login-submit'>",
+        )
+    ] + [
+        "Sure! Here you go:\n```json\n" + json.dumps(big_plan) + "\n```\nLet me know if you need more.",
+        "<think>" + "reasoning " * 2000 + "</think>" + json.dumps({"page_type": "general", "status": "OK"}),
+    ]
+    corpus_bytes = sum(len(t.encode("utf-8")) for t in corpus)
+
+    ops, started = 0, time.perf_counter()
+    while True:
+        for text in corpus:
+            extract_json(text)
+        ops += len(corpus)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            break
+
+    # Worst case over inputs built to trigger quadratic scans; each must also parse correctly.
+    worst_ms, correct = 0.0, 0
+    adversarial = _adversarial_responses()
+    for name, text, expected in adversarial:
+        started = time.perf_counter()
+        value = extract_json(text)
+        took = (time.perf_counter() - started) * 1000
+        worst_ms = max(worst_ms, took)
+        correct += value == expected
+        if value != expected:
+            logger.warning(f"⚠️ extract_json adversarial case '{name}' parsed incorrectly")
+
+    peak = _traced_peak_mb(lambda: [extract_json(t) for t in corpus])
+    return {
+        "extract_json_ops_per_s": Metric(round(ops / elapsed, 1), "ops/s"),
+        "extract_json_mb_per_s": Metric(round(ops / len(corpus) * corpus_bytes / elapsed / 1_048_576, 2), "MB/s"),
+        "extract_json_peak_mb": Metric(round(peak, 3), "MB", higher_is_better=False),
+        "extract_json_adversarial_max_ms": Metric(round(worst_ms, 2), "ms", False),
+        "extract_json_adversarial_correct": Metric(round(correct / len(adversarial), 3), "ratio"),
+    }
+
+
+async def bench_planner(stub: StubLLM, plans: int) -> Dict[str, Metric]:
+    """Model calls per plan when responses use aliases and carry one unknown action."""
+    stub.faulty_plans = True
+    calls_before = stub.calls["planner"] + stub.calls["plan_repair"]
+    repaired_before, replans_before = planning_stats.repaired, planning_stats.replans
+    valid, started = 0, time.perf_counter()
+    try:
+        for _ in range(plans):
+            plan = await generate_test_plan("Sign in and add a product to the cart", provider=STUB_PROVIDER)
+            valid += bool(plan.steps)
+    finally:
+        stub.faulty_plans = False
+    elapsed = time.perf_counter() - started
+    calls = stub.calls["planner"] + stub.calls["plan_repair"] - calls_before
+    return {
+        "planner_calls_per_plan": Metric(round(calls / plans, 2), "calls", False),
+        "planner_ms_per_plan": Metric(round(elapsed / plans * 1000, 2), "ms", False),
+        "planner_valid_rate": Metric(round(valid / plans, 3), "ratio"),
+        "planner_repaired_rate": Metric(round((planning_stats.repaired - repaired_before) / plans, 3), "ratio"),
+        "planner_replans": Metric(planning_stats.replans - replans_before, "calls", False),
+    }
+
+
+def _crawl_data(size: int, base_url: str) -> List[Dict[str, Any]]:
+    return [
+        {
+            "url": f"{base_url}/products/{i}",
+            "page_type": ("login", "table", "general")[i % 3],
+            "test_executed": "Stability Audit",
+            "test_result": "PASS" if i % 7 else "FAIL",
+            "actions": ["Add to cart", "Open related", "Return to catalog"],
+        }
+        for i in range(size)
+    ]
+
+
+async def bench_report(sizes: List[int], base_url: str) -> Dict[str, Metric]:
+    """Build the audit model, then render PDF, HTML and JSON in-process."""
+    metrics: Dict[str, Metric] = {}
+    for size in sizes:
+        crawl = _crawl_data(size, base_url)
+
+        started = time.perf_counter()
+        report = await QA_Reporter.build_report(crawl, 12.0, provider=STUB_PROVIDER, run_id=f"bench-report-{size}")
+        metrics[f"report_build_ms_{size}"] = Metric(round((time.perf_counter() - started) * 1000, 2), "ms", False)
+
+        payload = report.model_dump()
+        started = time.perf_counter()
+        pdf = render_report_pdf(payload)
+        metrics[f"report_pdf_ms_{size}"] = Metric(round((time.perf_counter() - started) * 1000, 2), "ms", False)
+        metrics[f"report_pdf_kb_{size}"] = Metric(round(len(pdf) / 1024, 1), "KB", False)
+
+        started = time.perf_counter()
+        render_html(report)
+        render_json(report)
+        metrics[f"report_html_json_ms_{size}"] = Metric(round((time.perf_counter() - started) * 1000, 2), "ms", False)
+
+    largest = max(sizes)
+    payload = (await QA_Reporter.build_report(_crawl_data(largest, base_url), 12.0, provider=STUB_PROVIDER)).model_dump()
+    metrics[f"report_pdf_peak_mb_{largest}"] = Metric(
+        round(_traced_peak_mb(lambda: render_report_pdf(payload)), 2), "MB", False
+    )
+    return metrics
+
+
+# --- Browser-bound paths ---
+
+async def bench_healer(base_url: str, heals: int) -> Dict[str, Metric]:
+    """DOM snapshot, prompt, stub round trip and selector validation per heal."""
+    runner = AutomationRunner(run_id="bench-healer", provider=STUB_PROVIDER, base_url=base_url)
+    samples: List[float] = []
+    healed = 0
+    try:
+        await runner.start_browser(headless=True)
+        await runner.page.goto(f"{base_url}{LOGIN_PATH}", wait_until="networkidle")
+        for _ in range(heals):
+            started = time.perf_counter()
+            result = await heal_selector(runner.page, "#login-btn-legacy", "Submit sign-in", provider=STUB_PROVIDER)
+            samples.append((time.perf_counter() - started) * 1000)
+            healed += bool(result)
+    finally:
+        await runner.stop_browser()
+
+    return {
+        "healer_p50_ms": Metric(round(_percentile(samples, 50), 2), "ms", False),
+        "healer_p95_ms": Metric(round(_percentile(samples, 95), 2), "ms", False),
+        "healer_success_rate": Metric(round(healed / heals, 3), "ratio"),
+    }
+
+
+async def bench_crawler(base_url: str, pages: int) -> Dict[str, Metric]:
+    """Scout crawl of the fixture site with stub analysis."""
+    runner = AutomationRunner(run_id="bench-crawler", provider=STUB_PROVIDER, base_url=base_url)
+    crawler = AutonomousCrawler(
+        start_url=f"{base_url}/", run_id="bench-crawler", user_id="bench", max_pages=pages, provider=STUB_PROVIDER
+    )
+    try:
+        await runner.start_browser(headless=True)
+        started = time.perf_counter()
+        data = await crawler.run(runner.page)
+        elapsed = time.perf_counter() - started
+    finally:
+        await runner.stop_browser()
+        checkpoint_store.clear("bench-crawler")
+
+    return {
+        "crawler_pages_per_s": Metric(round(len(crawler.visited) / elapsed, 3), "pages/s"),
+        "crawler_analyzed_pages": Metric(len(data), "pages"),
+    }
+
+
+async def bench_missions(base_url: str, missions: int, concurrency: int) -> Dict[str, Metric]:
+    """End-to-end sniper missions: stub planning plus runner execution."""
+    statuses: Dict[str, str] = {}
+    record = async_db_bridge.update_run_status
+
+    async def recording(run_id: str, status: str) -> bool:
+        statuses[run_id] = status
+        return await record(run_id, status)
+
+    gate = asyncio.Semaphore(max(1, concurrency))
+    durations: List[float] = []
+
+    async def mission(idx: int):
+        run_id = f"bench-mission-{idx}"
+        async with gate:
+            started = time.perf_counter()
+            plan = await generate_test_plan(
+                raw_input=f"Sign in to {base_url} and add a product to the cart", provider=STUB_PROVIDER
+            )
+            runner = AutomationRunner(run_id=run_id, provider=STUB_PROVIDER, base_url=base_url)
+            await runner.execute_plan(plan)
+            durations.append(time.perf_counter() - started)
+
+    async_db_bridge.update_run_status = recording
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(mission(i) for i in range(missions)))
+        elapsed = time.perf_counter() - started
+    finally:
+        async_db_bridge.update_run_status = record
+
+    failed = sum(1 for s in statuses.values() if s != "COMPLETED") + (missions - len(statuses))
+    return {
+        "missions_per_min": Metric(round(missions / elapsed * 60, 2), "missions/min"),
+        "mission_p50_s": Metric(round(_percentile(durations, 50), 3), "s", False),
+        "missions_failed": Metric(failed, "missions", False),
+    }
+
+
+# --- Orchestration ---
+
+async def run_suite(options: BenchOptions) -> Dict[str, Any]:
+    # Offline by construction: nothing may reach the real database or storage.
+    db_bridge.client = None
+    async_db_bridge.url = ""
+
+    metrics: Dict[str, Metric] = {}
+    skipped: Dict[str, str] = {}
+
+    # Evidence and reports go to a throwaway content-addressed store.
+    with tempfile.TemporaryDirectory(prefix="argus-bench-") as artifacts, FixtureSite() as site:
+        async_db_bridge.storage = LocalContentStore(Path(artifacts))
+        stub = StubLLM(site.base_url, latency_ms=options.latency_ms).install()
+
+        wanted = [b for b in BENCHMARKS if b in options.only]
+        blocked = await _browser_unavailable() if BROWSER_BENCHMARKS & set(wanted) else None
+
+        runners: Dict[str, Callable[[], Awaitable[Dict[str, Metric]]]] = {
+            "startup": lambda: asyncio.to_thread(bench_startup),
+            "isolation": bench_isolation,
+            "extract_json": lambda: asyncio.to_thread(bench_extract_json, stub, options.min_seconds),
+            "planner": lambda: bench_planner(stub, options.plans),
+            "report": lambda: bench_report(options.report_sizes, site.base_url),
+            "healer": lambda: bench_healer(site.base_url, options.heals),
+            "crawler": lambda: bench_crawler(site.base_url, options.pages),
+            "missions": lambda: bench_missions(site.base_url, options.missions, options.concurrency),
+        }
+
+        for name in wanted:
+            if name in BROWSER_BENCHMARKS and blocked:
+                skipped[name] = f"browser unavailable: {blocked}"
+                logger.warning(f"⏭️ {name} skipped ({skipped[name]})")
+                continue
+            started = time.perf_counter()
+            try:
+                metrics.update(await runners[name]())
+                logger.warning(f"⏱️ {name} done in {time.perf_counter() - started:.1f}s")
+            except Exception as e:
+                skipped[name] = f"error: {e}"
+                logger.exception(f"💥 {name} failed: {e}")
+
+    metrics["peak_rss_mb"] = Metric(round(_peak_rss_mb(), 1), "MB", False)
+
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": asdict(options),
+        "stub_calls": dict(stub.calls),
+        "metrics": {name: asdict(m) for name, m in metrics.items()},
+        "skipped": skipped,
+    }
+
+
+def save_results(results: Dict[str, Any], directory: Path = RESULTS_DIR) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = results["created_at"].replace(":", "").replace("-", "").split("+")[0]
+    path = directory / f"{stamp}_{results['commit']}.json"
+    path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return path
+
+
+def load_previous(directory: Path = RESULTS_DIR, exclude: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Most recent stored run, used as the regression baseline."""
+    if not directory.exists():
+        return None
+    candidates = sorted(p for p in directory.glob("*.json") if p != exclude)
+    return json.loads(candidates[-1].read_text(encoding="utf-8")) if candidates else None
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Per-metric deltas; a change worse than `threshold` (relative) is a regression."""
+    rows = []
+    for name, now in current["metrics"].items():
+        before = baseline.get("metrics", {}).get(name)
+        if not before or not before["value"]:
+            continue
+        change = (now["value"] - before["value"]) / abs(before["value"])
+        worse = -change if now["higher_is_better"] else change
+        rows.append({
+            "metric": name,
+            "baseline": before["value"],
+            "current": now["value"],
+            "unit": now["unit"],
+            "change": round(change, 4),
+            "regression": worse > threshold,
+        })
+    return rows
@@ -23,6 +23,12 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = Field(default="")
     SUPABASE_SERVICE_ROLE_KEY: str = Field(default="")
     VAULT_MASTER_KEY: str = Field(default="")
+    SUPABASE_HTTP2: bool = True # async bridge multiplexes over HTTP/2 when h2 is installed
+    SUPABASE_POOL_SIZE: int = 20 # pooled connections shared by every mission on the loop
+    SUPABASE_TIMEOUT_SECONDS: float = 10.0
+    USER_SETTINGS_CACHE_SIZE: int = 1024 # users (and runs) whose privacy settings stay cached
+    USER_SETTINGS_CACHE_TTL_SECONDS: float = 60 # upper bound on a missed invalidation
+    USER_SETTINGS_SYNC_SECONDS: float = 5 # poll user_settings.updated_at so every worker sees changes (0 = off)
 
     # --- STABLE MODELS ---
     # Gemini
@@ -45,9 +51,87 @@ class Settings(BaseSettings):
     PERPLEXITY_API_KEY: str = Field(default="")
     PERPLEXITY_MODEL: str = "sonar-reasoning-pro"
 
+    # Planning (targeted fix-up calls for invalid steps before a plan is regenerated)
+    PLAN_REPAIR_ROUNDS: int = 2
+
+    # Network Routing Profiles (full | no-media | dom-only)
+    DEFAULT_ROUTING_PROFILE: str = "full"
+    SCOUT_ROUTING_PROFILE: str = "no-media"
+    CRAWLER_BOILERPLATE_MIN_PAGES: int = 2 # strip text blocks seen on N earlier pages (0 = off)
+    CRAWLER_RAW_TEXT_CHARS: int = 100_000 # innerText read per page before stripping
+
+    # Report Rendering (process pool size for reportlab builds; 0 = render in a thread)
+    REPORT_RENDER_WORKERS: int = 2
+    REPORT_STREAMING_THRESHOLD: int = 25
+    REPORT_FORMATS: str = "json,html,pdf"
+    REPORT_PDF_MODE: str = "eager" # eager | lazy (render on first download)
+    WORKER_PUBLIC_URL: str = Field(default="")
+
+    # Mission Execution (inline = worker event loop | process = one spawned process per running mission)
+    MISSION_EXECUTOR: str = "inline"
+    MISSION_PROCESSES: int = 0 # concurrent missions; 0 = one per CPU core
+    MISSIONS_PER_PROCESS: int = 20 # recycle a mission process after N missions
+
+    # Evidence Capture (always | on-change | failure-only | trace; png | jpeg | webp)
+    CAPTURE_POLICY: str = "on-change"
+    CAPTURE_FORMAT: str = "webp"
+    CAPTURE_QUALITY: int = 70
+    CAPTURE_THUMBNAIL_WIDTH: int = 320 # 0 = no thumbnails
+    CAPTURE_HASH_DISTANCE: int = 1 # dHash bits (of 256); higher = more aggressive dedup
+    TRACE_COMPRESS: bool = True # repack the mission trace with max deflate before storing
+    TRACE_MAX_AGE_HOURS: int = 72 # local copies in VIDEOS_DIR
+    FINGERPRINT_CAPTURE: bool = True # element DNA of every visited page, stored only when changed
+    FINGERPRINT_MAX_ELEMENTS: int = 300
+
+    # Visual Regression (Golden Path replays diff every step against a baseline)
+    VISUAL_REGRESSION: bool = True
+    VISUAL_PIXEL_THRESHOLD: int = 24 # per-channel delta ignored as anti-aliasing noise
+    VISUAL_BLOCK_SIZE: int = 16
+    VISUAL_BLOCK_THRESHOLD: float = 0.05 # changed-pixel share that flags a block
+    VISUAL_TOLERANCE: float = 0.005 # changed-block share a step may drift
+    VISUAL_IGNORE_SELECTORS: str = "" # comma-separated dynamic regions (clocks, ads)
+
+    # Chaos Protocol (attack vectors run in isolated contexts; 1 = sequential plan)
+    CHAOS_CONCURRENCY: int = 4
+    CHAOS_VECTOR_TIMEOUT_SECONDS: float = 120 # wall-clock limit per vector, setup included
+
+    # Job Claiming (workers pull QUEUED test_runs under a renewable lease)
+    JOB_POLLING: bool = False
+    JOB_CONCURRENCY: int = 0 # 0 = one slot per mission process
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0
+    JOB_LEASE_SECONDS: int = 60
+    JOB_MAX_ATTEMPTS: int = 3
+    WORKER_ID: str = "" # defaults to hostname:pid
+    JOB_QUEUE_DSN: str = "" # direct Postgres (psycopg) instead of Supabase RPC
+
+    # Mission Budgets (0 = unlimited; payload "budget": {"tokens", "seconds"} overrides)
+    MISSION_TOKEN_BUDGET: int = 0
+    MISSION_TIME_BUDGET_SECONDS: float = 0
+    MISSION_DEADLINE_SECONDS: float = 0 # hard stop (0 = none); payload "deadline_seconds" overrides
+    MISSION_CANCEL_GRACE_SECONDS: float = 30 # partial results + cleanup before a mission process is killed
+
+    # Worker Warm-up (runs after startup; GET /ready answers 200 once it is done)
+    BROWSER_PRELAUNCH: bool = True # keep one Chromium launched ahead of the next inline mission
+    WARMUP_PROVIDERS: str = "" # provider SDKs imported at warm-up besides AI_PROVIDER (comma-separated)
+
     # Tactical Storage Paths
     SCREENSHOTS_DIR: Path = BASE_DIR / "public" / "screenshots"
     VIDEOS_DIR: Path = BASE_DIR / "public" / "videos"
+    CHECKPOINTS_DIR: Path = BASE_DIR / "public" / "checkpoints"
+    SESSIONS_DIR: Path = BASE_DIR / "public" / "sessions"
+    BASELINES_DIR: Path = BASE_DIR / "public" / "baselines"
+    ARTIFACTS_DIR: Path = BASE_DIR / "public" / "artifacts"
+
+    # Artifact Storage (supabase | local content-addressed store | writethrough = local + supabase)
+    STORAGE_BACKEND: str = "supabase"
+
+    # Mission Checkpoints (disk | database | both)
+    CHECKPOINT_BACKEND: str = "disk"
+    CHECKPOINT_MAX_AGE_HOURS: int = 72
+    CRAWL_CHECKPOINT_SECONDS: float = 30 # at most one full crawl snapshot per interval (0 = before every page)
+
+    # Authenticated Sessions (Vault-encrypted storage state per domain + credentials)
+    SESSION_CACHE_TTL_HOURS: int = 12
 
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE_PATH),
@@ -57,12 +141,34 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
+STORAGE_DIRS = ["SCREENSHOTS_DIR", "VIDEOS_DIR", "CHECKPOINTS_DIR", "SESSIONS_DIR", "BASELINES_DIR", "ARTIFACTS_DIR"]
+
+def _writable(path: Path) -> bool:
+    """Whether `path` can be written or created, judged by its nearest existing ancestor."""
+    for candidate in (path, *path.parents):
+        if candidate.exists():
+            return os.access(candidate, os.W_OK)
+    return False
+
+def resolve_storage_dirs():
+    """
+    Redirects unwritable storage directories to /tmp before any store reads
+    them. Permission checks only: nothing is created at import time.
+    """
+    for path_attr in STORAGE_DIRS:
+        target_path = getattr(settings, path_attr)
+        if not _writable(target_path):
+            fallback = Path("/tmp") / target_path.relative_to(BASE_DIR)
+            setattr(settings, path_attr, fallback)
+            logger.warning(f"⚠️ Storage Redirect: {target_path} -> {fallback} (Reason: not writable)")
+
 def bootstrap_system():
     """
     Ensures directories exist with a fallback to /tmp for
-    restricted environments like Hugging Face Spaces.
+    restricted environments like Hugging Face Spaces. Called by the
+    worker warm-up and by mission processes.
     """
-    for path_attr in ["SCREENSHOTS_DIR", "VIDEOS_DIR"]:
+    for path_attr in STORAGE_DIRS:
         target_path = getattr(settings, path_attr)
         try:
             target_path.mkdir(parents=True, exist_ok=True)
@@ -75,5 +181,5 @@ def bootstrap_system():
             setattr(settings, path_attr, fallback)
             logger.warning(f"⚠️ Storage Redirect: {target_path} -> {fallback} (Reason: {e})")
 
-# Execute directory check on import
-bootstrap_system()
+# Module-level stores capture these paths on import, so fallbacks are decided now.
+resolve_storage_dirs()
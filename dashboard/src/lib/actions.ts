@@ -157,13 +157,46 @@ type ScoutPayload = WorkerPayloadBase & {
 
 type ReplayPayload = WorkerPayloadBase & {
   mode: 'replay'
-  steps: AutomationStep[]
+  test_id: number
+  steps: AutomationStep[] | Database['public']['Tables']['saved_tests']['Row']['steps_json']
   context: TestContext
 }
 
 type WorkerPayload = SniperPayload | ScoutPayload | ReplayPayload
 
-async function dispatchToWorker(payload: WorkerPayload): Promise<void> {
+type SupabaseRLS = Awaited<ReturnType<typeof getSupabaseWithRLS>>['supabase']
+
+/**
+ * Persist the payload on the run so lease-polling workers can claim it.
+ * Scout passwords are vault-encrypted before they are stored.
+ */
+async function queueMission(supabase: SupabaseRLS, payload: WorkerPayload): Promise<void> {
+  const stored =
+    payload.mode === 'scout' && payload.credentials?.password
+      ? {
+          ...payload,
+          credentials: {
+            ...payload.credentials,
+            password: encrypt(payload.credentials.password),
+            encrypted: true,
+          },
+        }
+      : payload
+
+  const { error } = await supabase
+    .from('test_runs')
+    .update({ payload: stored })
+    .eq('id', payload.run_id)
+
+  if (error) throw new Error(`Mission queueing failed: ${error.message}`)
+}
+
+async function dispatchToWorker(supabase: SupabaseRLS, payload: WorkerPayload): Promise<void> {
+  await queueMission(supabase, payload)
+
+  // MISSION_DISPATCH=pull leaves the run QUEUED for polling workers.
+  if (process.env.MISSION_DISPATCH === 'pull') return
+
   try {
     const workerUrl = process.env.AI_WORKER_URL
     if (!workerUrl) {
@@ -353,7 +386,7 @@ export async function runTest(formData: FormData): Promise<ActionResponse> {
 
     const runId = await createTestRun(supabase, userId, url, intent, isChaos ? 'chaos' : 'sniper')
 
-    await dispatchToWorker({
+    await dispatchToWorker(supabase, {
       user_id: userId,
       run_id: runId,
       api_key: encryptedKey,
@@ -409,7 +442,7 @@ export async function runScoutMission(
           ? 'gpt-4o-mini'
           : 'gemini-1.5-flash'
 
-    await dispatchToWorker({
+    await dispatchToWorker(supabase, {
       user_id: userId,
       run_id: runId,
       api_key: encryptedKey,
@@ -498,7 +531,7 @@ export async function saveRunToRegistry(runId: string, testName: string): Promis
       intent: run.intent,
       url: run.url,
       run_id: run.id,
-      steps_json: {},
+      steps_json: run.plan ?? {},
     })
 
     if (insertError) throw insertError
@@ -559,13 +592,14 @@ export async function runSavedTest(testId: string): Promise<ActionResponse> {
       'replay'
     )
 
-    await dispatchToWorker({
+    await dispatchToWorker(supabase, {
       user_id: userId,
       run_id: runId,
       api_key: encryptedKey,
       provider,
       model,
       mode: 'replay',
+      test_id: blueprint.id,
       context: {
         baseUrl: blueprint.url,
       },
@@ -730,6 +764,37 @@ export async function deleteRun(runId: string): Promise<ActionResponse> {
   }
 }
 
+export async function cancelRun(runId: string): Promise<ActionResponse> {
+  try {
+    const { supabase } = await getSupabaseWithRLS()
+    // RLS scopes the lookup to the caller's runs; the worker itself trusts only the service key.
+    const { data: run, error } = await supabase.from('test_runs').select('id').eq('id', runId).single()
+    if (error || !run) throw new Error('UNAUTHORIZED')
+
+    const workerUrl = process.env.AI_WORKER_URL
+    if (!workerUrl) {
+      throw new Error('AI_WORKER_URL environment variable not configured')
+    }
+
+    const response = await fetch(`${workerUrl}/mission/${runId}/cancel`, {
+      method: 'POST',
+      headers: { Authorization: `Bearer ${process.env.SUPABASE_SERVICE_ROLE_KEY}` },
+    })
+    if (response.status === 404) {
+      return { success: false, message: 'Mission is not running.' }
+    }
+    if (!response.ok) throw new Error(`Worker Error: ${response.status}`)
+
+    revalidatePath(`/runs/${runId}`)
+    return { success: true, message: 'Mission cancelling.' }
+  } catch (err) {
+    if (err instanceof Error && err.message.includes('UNAUTHORIZED')) {
+      return { success: false, message: 'Unauthorized' }
+    }
+    return createErrorResponse(err, 'Cancel Failed')
+  }
+}
+
 export async function deleteSavedTest(testId: number): Promise<ActionResponse> {
   try {
     const { supabase } = await getSupabaseWithRLS()
@@ -772,6 +837,16 @@ export async function updateTelemetrySettings(enabled: boolean): Promise<ActionR
 
     if (error) throw error
 
+    // Workers cache privacy settings; drop this user's entry so the change applies immediately.
+    // Other workers of a fleet pick the change up from updated_at within seconds.
+    const workerUrl = process.env.AI_WORKER_URL
+    if (workerUrl) {
+      await fetch(`${workerUrl}/settings/${userId}/invalidate`, {
+        method: 'POST',
+        headers: { Authorization: `Bearer ${process.env.SUPABASE_SERVICE_ROLE_KEY}` },
+      }).catch(() => null)
+    }
+
     revalidatePath('/settings')
     return { success: true, message: 'Privacy settings updated' }
   } catch (err) {
@@ -14,6 +14,6 @@ export type TestRunInsert = PublicTable['test_runs']['Insert']
 export type TestRunUpdate = PublicTable['test_runs']['Update']
 
 // Application Logic Enums (Keep these for UI and Type-safety in code)
-export type RunStatus = 'QUEUED' | 'PENDING' | 'RUNNING' | 'COMPLETED' | 'FAILED' | 'HEALED'
+export type RunStatus = 'QUEUED' | 'PENDING' | 'RUNNING' | 'COMPLETED' | 'FAILED' | 'HEALED' | 'CANCELLED'
 export type RunMode = 'sniper' | 'scout' | 'chaos' | 'replay'
 export type AIProvider = 'groq' | 'gemini' | 'openai' | 'anthropic' | 'sonar'
@@ -0,0 +1,4 @@
+-- Index of published Scout audit artifacts (json / html / pdf URLs)
+ALTER TABLE public.test_runs
+  ADD COLUMN IF NOT EXISTS report_url TEXT,
+  ADD COLUMN IF NOT EXISTS report_artifacts JSONB;
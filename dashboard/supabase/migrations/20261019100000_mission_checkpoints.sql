@@ -0,0 +1,18 @@
+-- Resumable mission state (crawler frontier, runner step index, healed selectors)
+CREATE TABLE IF NOT EXISTS public.mission_checkpoints (
+  run_id UUID PRIMARY KEY REFERENCES public.test_runs(id) ON DELETE CASCADE,
+  state JSONB NOT NULL,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+ALTER TABLE public.mission_checkpoints ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS mission_checkpoints_owner_policy ON public.mission_checkpoints;
+CREATE POLICY mission_checkpoints_owner_policy ON public.mission_checkpoints
+  FOR ALL
+  USING (
+    run_id IN (
+      SELECT id FROM public.test_runs
+      WHERE user_id = COALESCE((auth.jwt()->>'user_id'), '')
+    )
+  );
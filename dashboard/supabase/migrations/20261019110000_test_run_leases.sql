@@ -0,0 +1,120 @@
+-- Pull-based mission queue: workers claim QUEUED runs under a renewable lease.
+-- Plain PL/pgSQL with no Supabase-specific references, so the same functions
+-- can be loaded into any local Postgres that has a test_runs table.
+
+ALTER TABLE public.test_runs
+  ADD COLUMN IF NOT EXISTS payload JSONB,
+  ADD COLUMN IF NOT EXISTS lease_owner TEXT,
+  ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ,
+  ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
+-- Only claimable rows are indexed; finished runs never enter the scan.
+CREATE INDEX IF NOT EXISTS idx_test_runs_claimable
+  ON public.test_runs (created_at)
+  WHERE status = 'QUEUED' AND payload IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_test_runs_lease_expiry
+  ON public.test_runs (lease_expires_at)
+  WHERE status = 'RUNNING' AND lease_owner IS NOT NULL;
+
+-- Claim the oldest claimable run (or one specific run when p_run_id is given).
+-- A run is claimable when it is QUEUED, or RUNNING under a lease that expired.
+-- SKIP LOCKED lets any number of workers poll concurrently without blocking.
+CREATE OR REPLACE FUNCTION public.claim_test_run(
+  p_worker TEXT,
+  p_lease_seconds INTEGER DEFAULT 60,
+  p_max_attempts INTEGER DEFAULT 3,
+  p_run_id UUID DEFAULT NULL
+)
+RETURNS SETOF public.test_runs
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  -- Runs whose lease expired too many times are poison; stop recycling them.
+  UPDATE public.test_runs
+     SET status = 'FAILED', lease_owner = NULL, lease_expires_at = NULL
+   WHERE status = 'RUNNING'
+     AND lease_owner IS NOT NULL
+     AND lease_expires_at < now()
+     AND attempts >= p_max_attempts;
+
+  RETURN QUERY
+  WITH candidate AS (
+    SELECT id
+      FROM public.test_runs
+     WHERE (p_run_id IS NULL OR id = p_run_id)
+       AND (
+         (status = 'QUEUED' AND (payload IS NOT NULL OR p_run_id IS NOT NULL))
+         OR (status = 'RUNNING' AND lease_owner IS NOT NULL AND lease_expires_at < now())
+       )
+     ORDER BY created_at
+     LIMIT 1
+     FOR UPDATE SKIP LOCKED
+  ), claimed AS (
+    UPDATE public.test_runs t
+       SET status = 'RUNNING',
+           lease_owner = p_worker,
+           lease_expires_at = now() + make_interval(secs => p_lease_seconds),
+           attempts = t.attempts + 1
+      FROM candidate
+     WHERE t.id = candidate.id
+    RETURNING t.*
+  )
+  SELECT * FROM claimed;
+END;
+$$;
+
+-- Extend a held lease. Returns false when the lease was lost to another worker.
+CREATE OR REPLACE FUNCTION public.renew_test_run_lease(
+  p_run_id UUID,
+  p_worker TEXT,
+  p_lease_seconds INTEGER DEFAULT 60
+)
+RETURNS BOOLEAN
+LANGUAGE sql
+AS $$
+  WITH renewed AS (
+    UPDATE public.test_runs
+       SET lease_expires_at = now() + make_interval(secs => p_lease_seconds)
+     WHERE id = p_run_id AND lease_owner = p_worker
+    RETURNING 1
+  )
+  SELECT EXISTS (SELECT 1 FROM renewed);
+$$;
+
+-- Drop a lease once the mission reached a terminal state (or was abandoned).
+CREATE OR REPLACE FUNCTION public.release_test_run_lease(
+  p_run_id UUID,
+  p_worker TEXT
+)
+RETURNS BOOLEAN
+LANGUAGE sql
+AS $$
+  WITH released AS (
+    UPDATE public.test_runs
+       SET lease_owner = NULL, lease_expires_at = NULL
+     WHERE id = p_run_id AND lease_owner = p_worker
+    RETURNING 1
+  )
+  SELECT EXISTS (SELECT 1 FROM released);
+$$;
+
+-- Workers call these with the service role; dashboard users never need them.
+REVOKE ALL ON FUNCTION public.claim_test_run(TEXT, INTEGER, INTEGER, UUID) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.renew_test_run_lease(UUID, TEXT, INTEGER) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.release_test_run_lease(UUID, TEXT) FROM PUBLIC;
+
+DO $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+    REVOKE ALL ON FUNCTION public.claim_test_run(TEXT, INTEGER, INTEGER, UUID) FROM anon, authenticated;
+    REVOKE ALL ON FUNCTION public.renew_test_run_lease(UUID, TEXT, INTEGER) FROM anon, authenticated;
+    REVOKE ALL ON FUNCTION public.release_test_run_lease(UUID, TEXT) FROM anon, authenticated;
+  END IF;
+  IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'service_role') THEN
+    GRANT EXECUTE ON FUNCTION public.claim_test_run(TEXT, INTEGER, INTEGER, UUID) TO service_role;
+    GRANT EXECUTE ON FUNCTION public.renew_test_run_lease(UUID, TEXT, INTEGER) TO service_role;
+    GRANT EXECUTE ON FUNCTION public.release_test_run_lease(UUID, TEXT) TO service_role;
+  END IF;
+END;
+$$;
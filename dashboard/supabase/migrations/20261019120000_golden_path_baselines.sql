@@ -0,0 +1,8 @@
+-- Golden Path visual regression: keep the executed plan on each run so a
+-- promotion replays real steps, and a private bucket for baseline frames.
+ALTER TABLE public.test_runs
+  ADD COLUMN IF NOT EXISTS plan JSONB;
+
+INSERT INTO storage.buckets (id, name, public)
+VALUES ('baselines', 'baselines', false)
+ON CONFLICT (id) DO NOTHING;
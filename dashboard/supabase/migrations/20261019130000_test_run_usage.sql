@@ -0,0 +1,4 @@
+-- Per-mission LLM accounting: token counts and model latency by call site
+-- (planner, crawler, healer, reporter), plus the budget the run was held to.
+ALTER TABLE public.test_runs
+  ADD COLUMN IF NOT EXISTS usage JSONB;
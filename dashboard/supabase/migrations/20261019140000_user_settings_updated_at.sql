@@ -0,0 +1,22 @@
+-- Workers poll user_settings.updated_at to drop cached privacy settings
+-- fleet-wide, so every change has to move it, whichever client wrote it.
+ALTER TABLE public.user_settings
+  ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT now();
+
+CREATE OR REPLACE FUNCTION public.touch_user_settings()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  NEW.updated_at := now();
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS user_settings_touch ON public.user_settings;
+CREATE TRIGGER user_settings_touch
+  BEFORE UPDATE ON public.user_settings
+  FOR EACH ROW EXECUTE FUNCTION public.touch_user_settings();
+
+CREATE INDEX IF NOT EXISTS idx_user_settings_updated_at
+  ON public.user_settings (updated_at);
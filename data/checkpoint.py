@@ -0,0 +1,137 @@
+import datetime
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from configs.settings import settings
+from data.supabase_client import db_bridge
+
+logger = logging.getLogger("orchestrator.checkpoint")
+
+
+class CheckpointStore:
+    """
+    Mission state snapshots taken at step and page boundaries.
+
+    Snapshots are written atomically to local disk and, when the backend is
+    'database' or 'both', mirrored to public.mission_checkpoints so a
+    mission re-queued on another worker can pick up where it stopped.
+    """
+
+    def __init__(self, root: Path, backend: str = "disk"):
+        self.root = Path(root)
+        self.backend = backend.lower()
+
+    @property
+    def _use_disk(self) -> bool:
+        return self.backend in ("disk", "both")
+
+    @property
+    def _use_db(self) -> bool:
+        return self.backend in ("database", "both") and db_bridge.client is not None
+
+    def _path(self, run_id: str) -> Path:
+        safe_id = "".join(c for c in str(run_id) if c.isalnum() or c in "-_")
+        return self.root / f"{safe_id}.json"
+
+    def save(self, run_id: str, state: Dict[str, Any]) -> bool:
+        """Persist a snapshot; never raises so a mission is not killed by I/O."""
+        if not run_id:
+            return False
+
+        record = {**state, "run_id": run_id, "saved_at": time.time()}
+        ok = True
+
+        if self._use_disk:
+            tmp_path = None
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(record, fh, default=str)
+                os.replace(tmp_path, self._path(run_id))
+            except Exception as e:
+                logger.warning(f"[Checkpoint] Disk write failed for {run_id}: {e}")
+                ok = False
+                if tmp_path:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+
+        if self._use_db:
+            try:
+                db_bridge.client.table("mission_checkpoints").upsert({
+                    "run_id": run_id,
+                    "state": json.loads(json.dumps(record, default=str)),
+                    "updated_at": datetime.datetime.fromtimestamp(record["saved_at"], datetime.timezone.utc).isoformat(),
+                }).execute()
+            except Exception as e:
+                logger.warning(f"[Checkpoint] Database write failed for {run_id}: {e}")
+                ok = False
+
+        return ok
+
+    def load(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Return the latest snapshot for a run, preferring local disk."""
+        if not run_id:
+            return None
+
+        if self._use_disk:
+            path = self._path(run_id)
+            if path.exists():
+                try:
+                    return json.loads(path.read_text(encoding="utf-8"))
+                except Exception as e:
+                    logger.warning(f"[Checkpoint] Corrupt snapshot for {run_id}: {e}")
+
+        if self._use_db:
+            try:
+                res = db_bridge.client.table("mission_checkpoints")\
+                    .select("state")\
+                    .eq("run_id", run_id)\
+                    .maybe_single()\
+                    .execute()
+                if res and res.data:
+                    return res.data.get("state")
+            except Exception as e:
+                logger.warning(f"[Checkpoint] Database read failed for {run_id}: {e}")
+
+        return None
+
+    def prune(self, max_age_seconds: float) -> int:
+        """Delete local snapshots of missions abandoned for longer than max_age."""
+        if not self._use_disk or not self.root.exists():
+            return 0
+
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for path in self.root.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def clear(self, run_id: str):
+        """Drop the snapshot once a mission reaches a terminal state."""
+        if self._use_disk:
+            try:
+                self._path(run_id).unlink(missing_ok=True)
+            except Exception as e:
+                logger.warning(f"[Checkpoint] Disk cleanup failed for {run_id}: {e}")
+
+        if self._use_db:
+            try:
+                db_bridge.client.table("mission_checkpoints").delete().eq("run_id", run_id).execute()
+            except Exception as e:
+                logger.warning(f"[Checkpoint] Database cleanup failed for {run_id}: {e}")
+
+
+checkpoint_store = CheckpointStore(settings.CHECKPOINTS_DIR, settings.CHECKPOINT_BACKEND)
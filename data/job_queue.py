@@ -0,0 +1,174 @@
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ai.vault import Vault
+from configs.settings import settings
+from data.supabase_client import db_bridge
+
+logger = logging.getLogger("orchestrator.job_queue")
+
+
+class _SupabaseLeases:
+    """Lease calls routed through PostgREST RPC (production path)."""
+
+    def claim(self, worker: str, lease_seconds: int, max_attempts: int, run_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        res = db_bridge.client.rpc("claim_test_run", {
+            "p_worker": worker,
+            "p_lease_seconds": lease_seconds,
+            "p_max_attempts": max_attempts,
+            "p_run_id": run_id,
+        }).execute()
+        return res.data[0] if res.data else None
+
+    def renew(self, run_id: str, worker: str, lease_seconds: int) -> bool:
+        res = db_bridge.client.rpc("renew_test_run_lease", {
+            "p_run_id": run_id, "p_worker": worker, "p_lease_seconds": lease_seconds,
+        }).execute()
+        return bool(res.data)
+
+    def release(self, run_id: str, worker: str) -> bool:
+        res = db_bridge.client.rpc("release_test_run_lease", {
+            "p_run_id": run_id, "p_worker": worker,
+        }).execute()
+        return bool(res.data)
+
+    def exists(self, run_id: str) -> bool:
+        res = db_bridge.client.table("test_runs").select("id").eq("id", run_id).maybe_single().execute()
+        return bool(res and res.data)
+
+
+class _PostgresLeases:
+    """
+    Same lease functions over a direct Postgres connection. Lets the claiming
+    logic be exercised against any local Postgres loaded with the migration.
+    """
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self.conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        """The shared connection, (re)opened on first use and after it dropped."""
+        import psycopg  # only needed when JOB_QUEUE_DSN is set
+        from psycopg.rows import dict_row
+
+        with self._lock:
+            if self.conn is None or self.conn.closed or self.conn.broken:
+                self.conn = psycopg.connect(self.dsn, autocommit=True, row_factory=dict_row, connect_timeout=10)
+            return self.conn
+
+    def _one(self, sql: str, params: tuple) -> Optional[Dict[str, Any]]:
+        conn = self._connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                return cur.fetchone()
+        except Exception:
+            if conn.broken:
+                conn.close() # reconnect on the next call
+            raise
+
+    def claim(self, worker: str, lease_seconds: int, max_attempts: int, run_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        return self._one(
+            "SELECT * FROM public.claim_test_run(%s, %s, %s, %s::uuid)",
+            (worker, lease_seconds, max_attempts, run_id),
+        )
+
+    def renew(self, run_id: str, worker: str, lease_seconds: int) -> bool:
+        row = self._one("SELECT public.renew_test_run_lease(%s::uuid, %s, %s) AS ok", (run_id, worker, lease_seconds))
+        return bool(row and row["ok"])
+
+    def release(self, run_id: str, worker: str) -> bool:
+        row = self._one("SELECT public.release_test_run_lease(%s::uuid, %s) AS ok", (run_id, worker))
+        return bool(row and row["ok"])
+
+    def exists(self, run_id: str) -> bool:
+        return self._one("SELECT 1 FROM public.test_runs WHERE id = %s::uuid", (run_id,)) is not None
+
+
+class JobQueue:
+    """
+    Pull side of the mission queue. Workers claim QUEUED test_runs rows under
+    a lease, renew it while the mission runs, and release it when done.
+    A worker that dies simply stops renewing; once the lease expires the run
+    becomes claimable again and resumes from its checkpoint elsewhere.
+    """
+
+    def __init__(self, worker_id: str = "", lease_seconds: int = 60, max_attempts: int = 3, dsn: str = ""):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backend = _PostgresLeases(dsn) if dsn else _SupabaseLeases()
+        self._renew_failing_since: Dict[str, float] = {}
+
+    @property
+    def available(self) -> bool:
+        return isinstance(self.backend, _PostgresLeases) or db_bridge.client is not None
+
+    def claim(self, run_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Lease the oldest claimable run, or a specific one when run_id is given."""
+        if not self.available:
+            return None
+        try:
+            row = self.backend.claim(self.worker_id, self.lease_seconds, self.max_attempts, run_id)
+        except Exception as e:
+            logger.error(f"[JobQueue] Claim failed on {self.worker_id}: {e}")
+            return None
+        if row:
+            logger.info(f"🔐 LEASED: {row['id']} -> {self.worker_id} (attempt {row.get('attempts')})")
+        return row
+
+    def renew(self, run_id: str) -> bool:
+        """Extend our lease; False means another worker now owns (or may own) the run."""
+        try:
+            renewed = self.backend.renew(run_id, self.worker_id, self.lease_seconds)
+            self._renew_failing_since.pop(run_id, None)
+            return renewed
+        except Exception as e:
+            # A transient error is not a lost lease, but one that outlasts the
+            # lease is: the row expired meanwhile and may be claimed elsewhere.
+            since = self._renew_failing_since.setdefault(run_id, time.monotonic())
+            failing = time.monotonic() - since
+            logger.warning(f"[JobQueue] Heartbeat failed for {run_id} ({failing:.0f}s): {e}")
+            return failing < self.lease_seconds
+
+    def release(self, run_id: str) -> bool:
+        self._renew_failing_since.pop(run_id, None)
+        try:
+            return self.backend.release(run_id, self.worker_id)
+        except Exception as e:
+            logger.warning(f"[JobQueue] Release failed for {run_id}: {e}")
+            return False
+
+    def exists(self, run_id: str) -> bool:
+        try:
+            return self.backend.exists(run_id)
+        except Exception as e:
+            logger.warning(f"[JobQueue] Lookup failed for {run_id}: {e}")
+            return False
+
+    @staticmethod
+    def payload_for(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the worker payload the dashboard queued alongside the run."""
+        payload = dict(row.get("payload") or {})
+        payload.update({
+            "run_id": str(row["id"]),
+            "user_id": row.get("user_id"),
+            "mode": payload.get("mode") or row.get("mode") or "sniper",
+        })
+
+        credentials = payload.get("credentials") or {}
+        if credentials.pop("encrypted", False) and credentials.get("password"):
+            credentials["password"] = Vault.decrypt_key(credentials["password"])
+        return payload
+
+
+job_queue: Optional[JobQueue] = (
+    JobQueue(settings.WORKER_ID, settings.JOB_LEASE_SECONDS, settings.JOB_MAX_ATTEMPTS, settings.JOB_QUEUE_DSN)
+    if settings.JOB_POLLING else None
+)
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from ai.vault import Vault
+from configs.settings import settings
+
+logger = logging.getLogger("orchestrator.session_cache")
+
+
+class SessionCache:
+    """
+    Playwright storage state (cookies + localStorage) cached per target
+    domain and credential hash, encrypted at rest with the Vault key.
+
+    Raw credentials never reach disk: the file name is a SHA-256 over the
+    owner, domain and credentials, and the state itself is Vault-encrypted.
+    """
+
+    def __init__(self, root: Path, ttl_seconds: float):
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlparse(url).netloc.lower().replace("www.", "")
+
+    def _path(self, user_id: str, url: str, credentials: Dict[str, Any]) -> Path:
+        material = "\x00".join([
+            str(user_id or ""),
+            self._domain(url),
+            str(credentials.get("username", "")),
+            str(credentials.get("password", "")),
+        ])
+        return self.root / f"{hashlib.sha256(material.encode('utf-8')).hexdigest()}.session"
+
+    @staticmethod
+    def usable(credentials: Optional[Dict[str, Any]]) -> bool:
+        return bool(credentials and credentials.get("username") and credentials.get("password") and settings.VAULT_MASTER_KEY)
+
+    def load(self, user_id: str, url: str, credentials: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return a still-fresh storage state for these credentials, if any."""
+        if not self.usable(credentials):
+            return None
+
+        path = self._path(user_id, url, credentials)
+        try:
+            if not path.exists():
+                return None
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+
+            plain = Vault.decrypt_key(path.read_text(encoding="utf-8"))
+            if not plain:
+                # Rotated Vault key or a corrupt file: fall back to a full login.
+                path.unlink(missing_ok=True)
+                return None
+
+            logger.info(f"🔑 Reusing cached session for {self._domain(url)}")
+            return json.loads(plain)
+        except Exception as e:
+            logger.warning(f"[SessionCache] Load failed for {self._domain(url)}: {e}")
+            return None
+
+    def save(self, user_id: str, url: str, credentials: Optional[Dict[str, Any]], state: Dict[str, Any]) -> bool:
+        if not self.usable(credentials):
+            return False
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            token = Vault.encrypt_key(json.dumps(state))
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(token)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self._path(user_id, url, credentials))
+            logger.info(f"🔐 Session cached for {self._domain(url)}")
+            return True
+        except Exception as e:
+            logger.warning(f"[SessionCache] Save failed for {self._domain(url)}: {e}")
+            return False
+
+    def invalidate(self, user_id: str, url: str, credentials: Optional[Dict[str, Any]]):
+        """Drop a session the target rejected."""
+        if not self.usable(credentials):
+            return
+        try:
+            self._path(user_id, url, credentials).unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"[SessionCache] Invalidate failed for {self._domain(url)}: {e}")
+
+
+session_cache = SessionCache(settings.SESSIONS_DIR, settings.SESSION_CACHE_TTL_HOURS * 3600)
@@ -0,0 +1,89 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from configs.settings import settings
+
+logger = logging.getLogger("orchestrator.settings_cache")
+
+MISS = object()
+
+
+class UserSettingsCache:
+    """
+    Bounded LRU of `user_settings` rows keyed by user_id, each entry valid
+    for `ttl_seconds`. Shared by the sync and async bridges so a privacy
+    check costs one query per user per TTL instead of one per run or call.
+
+    Run ownership (run_id -> user_id) never changes and is kept in a
+    separate LRU without expiry. Entries are dropped early through
+    `invalidate` when a user changes their preferences.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._prefs: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._owners: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> Any:
+        """Cached preferences for a user, or `MISS` when absent or expired."""
+        with self._lock:
+            entry = self._prefs.get(user_id)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                self._prefs.pop(user_id, None)
+                self.misses += 1
+                return MISS
+            self._prefs.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user_id: str, prefs: Optional[Dict[str, Any]]):
+        """Store a user's row; None (no row yet) is cached as defaults."""
+        with self._lock:
+            self._prefs[user_id] = (time.monotonic(), dict(prefs or {}))
+            self._prefs.move_to_end(user_id)
+            while len(self._prefs) > self.max_entries:
+                self._prefs.popitem(last=False)
+
+    def owner(self, run_id: str) -> Any:
+        with self._lock:
+            if run_id not in self._owners:
+                return MISS
+            self._owners.move_to_end(run_id)
+            return self._owners[run_id]
+
+    def remember_owner(self, run_id: str, user_id: Optional[str]):
+        with self._lock:
+            self._owners[run_id] = user_id
+            self._owners.move_to_end(run_id)
+            while len(self._owners) > self.max_entries:
+                self._owners.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[str] = None) -> int:
+        """Drop one user's preferences, or everything when user_id is None."""
+        with self._lock:
+            if user_id is None:
+                removed = len(self._prefs)
+                self._prefs.clear()
+            else:
+                removed = 1 if self._prefs.pop(user_id, None) is not None else 0
+        if removed:
+            logger.info(f"♻️ User settings cache invalidated ({user_id or 'all users'})")
+        return removed
+
+    @staticmethod
+    def telemetry_enabled(prefs: Dict[str, Any]) -> bool:
+        return bool(prefs.get("telemetry_enabled", True))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"users": len(self._prefs), "runs": len(self._owners), "hits": self.hits, "misses": self.misses}
+
+
+user_settings_cache = UserSettingsCache(settings.USER_SETTINGS_CACHE_SIZE, settings.USER_SETTINGS_CACHE_TTL_SECONDS)
@@ -0,0 +1,272 @@
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from configs.settings import settings
+
+logger = logging.getLogger("orchestrator.storage")
+
+STORAGE_BACKENDS = ("supabase", "local", "writethrough")
+
+CONTENT_TYPES = {
+    ".png": "image/png",
+    ".jpeg": "image/jpeg",
+    ".jpg": "image/jpeg",
+    ".webp": "image/webp",
+    ".json": "application/json",
+    ".html": "text/html",
+    ".pdf": "application/pdf",
+}
+
+
+class StorageBackend:
+    """
+    Binary artifact storage behind screenshot and report uploads.
+
+    `put` returns the URL the dashboard should link to; `get` supports
+    ranged reads (`end` inclusive, like an HTTP Range header).
+    """
+    name = "none"
+
+    @property
+    def available(self) -> bool:
+        return False
+
+    async def put(self, bucket: str, name: str, data: bytes, content_type: str, upsert: bool = False) -> str:
+        raise NotImplementedError
+
+    async def get(self, bucket: str, name: str, start: int = 0, end: Optional[int] = None) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def url_for(self, bucket: str, name: str) -> Optional[str]:
+        """Public URL of an existing object, None when it is not stored."""
+        raise NotImplementedError
+
+
+class SupabaseStorage(StorageBackend):
+    """Supabase Storage over the async bridge's pooled client."""
+    name = "supabase"
+
+    def __init__(self, bridge: Any):
+        self.bridge = bridge
+
+    @property
+    def available(self) -> bool:
+        return self.bridge.online
+
+    async def put(self, bucket: str, name: str, data: bytes, content_type: str, upsert: bool = False) -> str:
+        return await self.bridge.upload_file(bucket, name, data, content_type, upsert=upsert)
+
+    async def get(self, bucket: str, name: str, start: int = 0, end: Optional[int] = None) -> Optional[bytes]:
+        headers = {}
+        if start or end is not None:
+            headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+        res = await self.bridge._http().get(f"/storage/v1/object/{bucket}/{name}", headers=headers)
+        if res.status_code in (400, 404):
+            return None
+        res.raise_for_status()
+        return res.content
+
+    async def url_for(self, bucket: str, name: str) -> Optional[str]:
+        folder, _, filename = name.rpartition("/")
+        res = await self.bridge._http().post(
+            f"/storage/v1/object/list/{bucket}",
+            json={"prefix": folder, "search": filename, "limit": 1},
+        )
+        res.raise_for_status()
+        if any(item.get("name") == filename for item in res.json() or []):
+            return f"{self.bridge.url}/storage/v1/object/public/{bucket}/{name}"
+        return None
+
+
+class LocalContentStore(StorageBackend):
+    """
+    Content-addressed filesystem store. Blobs live once under
+    objects/<sha256[:2]>/<sha256>, so a frame uploaded by every step of a
+    mission costs one write; bucket/name pairs are small ref files that
+    point at a blob. URLs are served by the worker's /artifacts route when
+    WORKER_PUBLIC_URL is set, otherwise they are file:// URIs.
+    """
+    name = "local"
+
+    def __init__(self, root: Path, public_url: str = ""):
+        self.root = Path(root)
+        self.public_url = public_url.rstrip("/")
+        self.writes = 0
+        self.deduplicated = 0
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def _ref_path(self, bucket: str, name: str) -> Path:
+        ref = (self.root / "refs" / bucket / name).resolve()
+        if not ref.is_relative_to((self.root / "refs").resolve()):
+            raise ValueError(f"Invalid object name: {name}")
+        return ref
+
+    def url(self, digest: str, suffix: str = "") -> str:
+        if self.public_url:
+            return f"{self.public_url}/artifacts/{digest}{suffix}"
+        return self.object_path(digest).resolve().as_uri()
+
+    def resolve(self, artifact: str) -> Optional[Path]:
+        """Blob path for an /artifacts/<sha256>[.ext] request."""
+        digest = Path(artifact).stem.lower()
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            return None
+        path = self.object_path(digest)
+        return path if path.exists() else None
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+
+    def _put(self, bucket: str, name: str, data: bytes, upsert: bool) -> str:
+        digest = self.digest(data)
+        blob = self.object_path(digest)
+        if blob.exists():
+            self.deduplicated += 1
+        else:
+            self._write_atomic(blob, data)
+            self.writes += 1
+
+        ref = self._ref_path(bucket, name)
+        if upsert or not ref.exists():
+            self._write_atomic(ref, digest.encode("ascii"))
+        return self.url(digest, Path(name).suffix)
+
+    def _lookup(self, bucket: str, name: str) -> Optional[str]:
+        ref = self._ref_path(bucket, name)
+        return ref.read_text(encoding="ascii").strip() if ref.exists() else None
+
+    @staticmethod
+    def read_range(path: Path, start: int = 0, end: Optional[int] = None) -> bytes:
+        with open(path, "rb") as fh:
+            fh.seek(start)
+            return fh.read() if end is None else fh.read(max(0, end - start + 1))
+
+    def _get(self, bucket: str, name: str, start: int, end: Optional[int]) -> Optional[bytes]:
+        digest = self._lookup(bucket, name)
+        if not digest or not self.object_path(digest).exists():
+            return None
+        return self.read_range(self.object_path(digest), start, end)
+
+    async def put(self, bucket: str, name: str, data: bytes, content_type: str, upsert: bool = False) -> str:
+        return await asyncio.to_thread(self._put, bucket, name, data, upsert)
+
+    async def get(self, bucket: str, name: str, start: int = 0, end: Optional[int] = None) -> Optional[bytes]:
+        return await asyncio.to_thread(self._get, bucket, name, start, end)
+
+    async def url_for(self, bucket: str, name: str) -> Optional[str]:
+        digest = await asyncio.to_thread(self._lookup, bucket, name)
+        return self.url(digest, Path(name).suffix) if digest else None
+
+
+class WriteThroughStorage(StorageBackend):
+    """
+    Local store first, then the remote backend. Reads are served locally
+    and fall back to the remote (caching what they fetch); the remote URL is
+    returned whenever the remote write succeeded.
+    """
+    name = "writethrough"
+
+    def __init__(self, local: LocalContentStore, remote: StorageBackend):
+        self.local = local
+        self.remote = remote
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    async def put(self, bucket: str, name: str, data: bytes, content_type: str, upsert: bool = False) -> str:
+        local_url = await self.local.put(bucket, name, data, content_type, upsert)
+        if not self.remote.available:
+            return local_url
+        try:
+            return await self.remote.put(bucket, name, data, content_type, upsert)
+        except Exception as e:
+            logger.warning(f"[Storage] Remote write failed for {bucket}/{name}, keeping local copy: {e}")
+            return local_url
+
+    async def get(self, bucket: str, name: str, start: int = 0, end: Optional[int] = None) -> Optional[bytes]:
+        data = await self.local.get(bucket, name, start, end)
+        if data is not None or not self.remote.available:
+            return data
+        full = await self.remote.get(bucket, name)
+        if full is None:
+            return None
+        content_type = CONTENT_TYPES.get(Path(name).suffix, "application/octet-stream")
+        await self.local.put(bucket, name, full, content_type, upsert=True)
+        return full[start:] if end is None else full[start:end + 1]
+
+    async def url_for(self, bucket: str, name: str) -> Optional[str]:
+        if self.remote.available:
+            url = await self.remote.url_for(bucket, name)
+            if url:
+                return url
+        return await self.local.url_for(bucket, name)
+
+
+def local_store(storage: StorageBackend) -> Optional[LocalContentStore]:
+    """The content-addressed store behind a backend, if it has one."""
+    if isinstance(storage, LocalContentStore):
+        return storage
+    return getattr(storage, "local", None)
+
+
+class RangeNotSatisfiable(ValueError):
+    """A well-formed byte range that selects nothing of the object (answered with 416)."""
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Single `bytes=a-b` / `bytes=-n` range as inclusive offsets. None when the
+    header is absent or should be ignored (other units, several ranges,
+    malformed), so the whole object is served; raises RangeNotSatisfiable
+    when the range lies past the end of the object.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, sep, last = header[6:].strip().partition("-")
+    if not sep or not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        return None
+    if not first:
+        suffix = int(last)
+        if not suffix or not size:
+            raise RangeNotSatisfiable(header)
+        return max(0, size - suffix), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+def build_storage(bridge: Any, backend: Optional[str] = None) -> StorageBackend:
+    backend = (backend or settings.STORAGE_BACKEND).lower()
+    if backend not in STORAGE_BACKENDS:
+        logger.warning(f"Unknown STORAGE_BACKEND '{backend}', using supabase")
+        backend = "supabase"
+
+    remote = SupabaseStorage(bridge)
+    if backend == "supabase":
+        return remote
+    local = LocalContentStore(settings.ARTIFACTS_DIR, settings.WORKER_PUBLIC_URL)
+    return local if backend == "local" else WriteThroughStorage(local, remote)
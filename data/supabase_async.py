@@ -0,0 +1,357 @@
+import asyncio
+import datetime
+import logging
+import uuid
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+
+from configs.settings import settings
+from data.settings_cache import MISS, user_settings_cache
+from data.storage import build_storage
+
+logger = logging.getLogger("orchestrator.supabase_async")
+
+try:
+    import h2  # noqa: F401  (httpx only needs it importable for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+VALID_STATUSES = ["QUEUED", "PENDING", "RUNNING", "COMPLETED", "FAILED", "HEALED", "CANCELLED"]
+
+
+class AsyncSupabaseBridge:
+    """
+    Non-blocking twin of SupabaseBridge for code running on the worker loop.
+
+    Talks to PostgREST and Storage directly over one pooled httpx client
+    (HTTP/2 when h2 is installed), shared by every mission on the loop.
+    Method names and return values mirror the sync bridge, which stays
+    available for scripts and thread-bound code.
+    """
+
+    def __init__(self, url: str, key: str):
+        self.url = (url or "").rstrip("/")
+        self.key = key or ""
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.storage = build_storage(self)
+
+    @property
+    def online(self) -> bool:
+        return bool(self.url and self.key)
+
+    def _http(self) -> httpx.AsyncClient:
+        """The pooled client for the running loop (mission processes run a loop per mission)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.url,
+                headers={"apikey": self.key, "Authorization": f"Bearer {self.key}"},
+                http2=settings.SUPABASE_HTTP2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=settings.SUPABASE_POOL_SIZE,
+                    max_keepalive_connections=settings.SUPABASE_POOL_SIZE,
+                ),
+                timeout=httpx.Timeout(settings.SUPABASE_TIMEOUT_SECONDS, connect=5.0),
+            )
+            self._loop = loop
+        return self._client
+
+    async def warm(self) -> bool:
+        """Open the pooled connection (TLS + HTTP/2 handshake) before the first mission needs it."""
+        if not self.online: return False
+        try:
+            res = await self._http().head("/rest/v1/test_runs", params={"select": "id", "limit": "1"})
+            return res.status_code < 500
+        except Exception as e:
+            logger.warning(f"[Warmup] Supabase connection not established: {e}")
+            return False
+
+    async def aclose(self):
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    # --- PostgREST / Storage primitives ---
+
+    async def _insert(self, table: str, payload: Union[Dict[str, Any], List[Dict[str, Any]]], on_conflict: Optional[str] = None):
+        prefer = "return=minimal" + (",resolution=merge-duplicates" if on_conflict else "")
+        params = {"on_conflict": on_conflict} if on_conflict else None
+        res = await self._http().post(f"/rest/v1/{table}", json=payload, params=params, headers={"Prefer": prefer})
+        res.raise_for_status()
+
+    async def _update(self, table: str, values: Dict[str, Any], **filters: Any):
+        params = {k: f"eq.{v}" for k, v in filters.items()}
+        res = await self._http().patch(f"/rest/v1/{table}", json=values, params=params, headers={"Prefer": "return=minimal"})
+        res.raise_for_status()
+
+    async def _select_one(self, table: str, columns: str, **filters: Any) -> Optional[Dict[str, Any]]:
+        params = {"select": columns, "limit": "1", **{k: f"eq.{v}" for k, v in filters.items()}}
+        res = await self._http().get(f"/rest/v1/{table}", params=params)
+        res.raise_for_status()
+        rows: List[Dict[str, Any]] = res.json()
+        return rows[0] if rows else None
+
+    async def upload_file(self, bucket: str, path: str, data: bytes, content_type: str, upsert: bool = False) -> str:
+        """Store an object and return its public URL."""
+        res = await self._http().post(
+            f"/storage/v1/object/{bucket}/{path}",
+            content=data,
+            headers={"Content-Type": content_type, "x-upsert": "true" if upsert else "false"},
+        )
+        res.raise_for_status()
+        return f"{self.url}/storage/v1/object/public/{bucket}/{path}"
+
+    # --- Bridge surface ---
+
+    async def upload_screenshot(
+        self,
+        screenshot_bytes: bytes,
+        run_id: Optional[str] = None,
+        content_type: str = "image/png",
+        extension: str = "png",
+        thumbnail: Optional[bytes] = None,
+    ) -> Optional[str]:
+        """Store one evidence frame; a thumbnail is stored next to it as *_thumb."""
+        if not self.storage.available: return None
+        try:
+            stem = f"{run_id}/trace_{uuid.uuid4()}" if run_id else f"trace_{uuid.uuid4()}"
+            uploads = [self.storage.put("screenshots", f"{stem}.{extension}", screenshot_bytes, content_type)]
+            if thumbnail:
+                uploads.append(self.storage.put("screenshots", f"{stem}_thumb.{extension}", thumbnail, content_type))
+            urls = await asyncio.gather(*uploads)
+            return urls[0]
+        except Exception as e:
+            logger.error(f"Screenshot upload failed: {e}")
+            return None
+
+    async def _user_prefs(self, user_id: str) -> Dict[str, Any]:
+        """The user's settings row, served from the shared TTL cache."""
+        prefs = user_settings_cache.get(user_id)
+        if prefs is MISS:
+            prefs = await self._select_one("user_settings", "telemetry_enabled", user_id=user_id) or {}
+            user_settings_cache.put(user_id, prefs)
+        return prefs
+
+    async def _should_log_sensitive(self, run_id: str) -> bool:
+        if not self.online:
+            return False
+
+        try:
+            user_id = user_settings_cache.owner(run_id)
+            if user_id is MISS:
+                run = await self._select_one("test_runs", "user_id", id=run_id)
+                user_id = run["user_id"] if run else None
+                user_settings_cache.remember_owner(run_id, user_id)
+                if not user_id:
+                    logger.warning(f"Run {run_id} not found - defaulting to PRIVATE")
+
+            if not user_id:
+                return False
+            return user_settings_cache.telemetry_enabled(await self._user_prefs(user_id))
+
+        except Exception as e:
+            logger.error(f"❌ PRIVACY_CHECK_FAILED for run {run_id}: {e}")
+            return False
+
+    async def init_run(self, run_id: str, user_id: str, url: str, mode: str, intent: str) -> bool:
+        if not self.online: return False
+        try:
+            await self._insert("test_runs", {
+                "id": run_id,
+                "user_id": user_id,
+                "url": url,
+                "mode": mode,
+                "intent": intent,
+                "status": "RUNNING"
+            }, on_conflict="id")
+            user_settings_cache.remember_owner(run_id, user_id)
+            return True
+        except Exception as e:
+            logger.error(f"[RunInit] Failed to initialize run {run_id} for user {user_id}: {e}")
+            return False
+
+    async def log_step(
+        self,
+        run_id: str,
+        step_id: int = 0,
+        role: str = "customer",
+        action: str = "info",
+        status: str = "INFO",
+        message: str = "",
+        **kwargs
+    ) -> bool:
+        if not self.online:
+            return False
+
+        telemetry_enabled = await self._should_log_sensitive(run_id)
+
+        payload = {
+            "run_id": run_id,
+            "step_id": step_id,
+            "role": role,
+            "action": action,
+            "status": status,
+            "message": message,
+            "url": kwargs.get("url"),
+            "details": kwargs.get("details", ""),
+            "screenshot_url": kwargs.get("screenshot_url"),
+        }
+
+        if not telemetry_enabled:
+            if action in ["analysis", "fingerprint"]:
+                logger.info(f"🛡️ [Privacy Active] Suppressed Cloud Log: {action} at {kwargs.get('url')}")
+                return True
+
+            payload["selector"] = None
+            payload["value"] = None
+        else:
+            payload["selector"] = kwargs.get("selector")
+            payload["value"] = kwargs.get("value")
+
+        try:
+            await self._insert("execution_logs", payload)
+            return True
+        except Exception as e:
+            logger.error(f"[Telemetry] Failed to log step {step_id} for run {run_id}: {e}")
+            return False
+
+    async def save_fingerprint(
+        self, user_id: str, url: str, selector: str, dna: Dict[str, Any]
+    ) -> bool:
+        if not self.online:
+            return False
+
+        try:
+            if not user_settings_cache.telemetry_enabled(await self._user_prefs(user_id)):
+                logger.info(f"🛡️ [Privacy Active] DNA storage blocked for {url}")
+                return True
+
+            await self._insert("element_fingerprints", {
+                "user_id": user_id,
+                "url": url,
+                "selector": selector,
+                "tag_name": dna.get("tag"),
+                "inner_text": dna.get("text"),
+                "attributes": dna.get("attributes", {}),
+            }, on_conflict="user_id,url,selector")
+            return True
+        except Exception as e:
+            logger.error(f"[Fingerprint] Storage failed for {url} > {selector}: {e}")
+            return False
+
+    async def save_fingerprints(self, user_id: str, url: str, fingerprints: List[Dict[str, Any]]) -> int:
+        """Bulk upsert of one page's element DNA; returns rows stored, -1 on failure."""
+        if not self.online or not fingerprints:
+            return 0
+
+        try:
+            if not user_settings_cache.telemetry_enabled(await self._user_prefs(user_id)):
+                logger.info(f"🛡️ [Privacy Active] DNA storage blocked for {url}")
+                return 0
+
+            seen_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            await self._insert("element_fingerprints", [{
+                "user_id": user_id,
+                "url": url,
+                "selector": dna["selector"],
+                "tag_name": dna.get("tag"),
+                "inner_text": dna.get("text"),
+                "attributes": dna.get("attributes", {}),
+                "last_seen": seen_at,
+            } for dna in fingerprints], on_conflict="user_id,url,selector")
+            return len(fingerprints)
+        except Exception as e:
+            logger.error(f"[Fingerprint] Bulk storage failed for {url} ({len(fingerprints)} elements): {e}")
+            return -1
+
+    async def start_run(self, run_id: str, mode: str) -> bool:
+        if not self.online: return False
+        try:
+            await self._update("test_runs", {"status": "RUNNING", "mode": mode}, id=run_id)
+            return True
+        except Exception as e:
+            logger.error(f"[RunStart] Failed to start run {run_id}: {e}")
+            return False
+
+    async def save_run_plan(self, run_id: str, plan: Dict[str, Any]) -> bool:
+        """Keep the executed (healed) plan so the run can be promoted to a Golden Path."""
+        if not self.online: return False
+        try:
+            await self._update("test_runs", {"plan": plan}, id=run_id)
+            return True
+        except Exception as e:
+            logger.error(f"[RunPlan] Failed to store plan for run {run_id}: {e}")
+            return False
+
+    async def save_run_usage(self, run_id: str, usage: Dict[str, Any]) -> bool:
+        """Persist per-mission LLM token and latency accounting."""
+        if not self.online: return False
+        try:
+            await self._update("test_runs", {"usage": usage}, id=run_id)
+            return True
+        except Exception as e:
+            logger.error(f"[RunUsage] Failed to store usage for run {run_id}: {e}")
+            return False
+
+    async def set_report_url(self, run_id: str, report_url: str) -> bool:
+        if not self.online: return False
+        try:
+            await self._update("test_runs", {"report_url": report_url}, id=run_id)
+            return True
+        except Exception as e:
+            logger.error(f"[RunReport] Failed to attach report to run {run_id}: {e}")
+            return False
+
+    async def save_report_artifacts(self, run_id: str, artifacts: Dict[str, str]) -> bool:
+        """Index the published report formats (format -> URL) on the run."""
+        if not self.online: return False
+        try:
+            await self._update("test_runs", {"report_artifacts": artifacts}, id=run_id)
+            return True
+        except Exception as e:
+            logger.warning(f"Report artifact index not stored for {run_id}: {e}")
+            return False
+
+    async def cancel_queued_run(self, run_id: str) -> bool:
+        """Cancel a run no worker has picked up yet; False if it is not QUEUED."""
+        if not self.online: return False
+        try:
+            res = await self._http().patch(
+                "/rest/v1/test_runs",
+                json={"status": "CANCELLED"},
+                params={"id": f"eq.{run_id}", "status": "eq.QUEUED", "select": "id"},
+                headers={"Prefer": "return=representation"},
+            )
+            res.raise_for_status()
+            return bool(res.json())
+        except Exception as e:
+            logger.error(f"[RunCancel] Failed to cancel queued run {run_id}: {e}")
+            return False
+
+    async def changed_user_settings(self, since: str, limit: int = 500) -> List[Dict[str, Any]]:
+        """user_id/updated_at of settings rows changed after `since` (ISO timestamp), oldest first."""
+        if not self.online: return []
+        res = await self._http().get("/rest/v1/user_settings", params={
+            "select": "user_id,updated_at",
+            "updated_at": f"gt.{since}",
+            "order": "updated_at.asc",
+            "limit": str(limit),
+        })
+        res.raise_for_status()
+        return res.json()
+
+    async def update_run_status(self, run_id: str, status: str) -> bool:
+        if not self.online: return False
+        status_upper = status.upper() if status.upper() in VALID_STATUSES else "FAILED"
+        try:
+            await self._update("test_runs", {"status": status_upper}, id=run_id)
+            return True
+        except Exception as e:
+            logger.error(f"[RunStatus] Failed to update run {run_id} to {status_upper}: {e}")
+            return False
+
+
+async_db_bridge = AsyncSupabaseBridge(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
@@ -1,71 +1,95 @@
+import datetime
 import logging
 import uuid
-from typing import List, Dict, Any, Optional
-from supabase import create_client, Client
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from configs.settings import settings
+from data.settings_cache import MISS, user_settings_cache
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 logger = logging.getLogger("orchestrator.supabase")
 
 class SupabaseBridge:
-    def __init__(self):
+    @cached_property
+    def client(self) -> Optional["Client"]:
+        """Created on first use: the supabase SDK is a slow import most worker paths never need."""
         url = settings.SUPABASE_URL
         key = settings.SUPABASE_SERVICE_ROLE_KEY
-        self.telemetry_cache: Dict[str, bool] = {}
 
         if not url or not key:
             logger.warning("Supabase credentials missing. Database operations will be skipped.")
-            self.client: Optional[Client] = None
-        else:
-            self.client = create_client(url, key)
+            return None
+
+        from supabase import create_client
+        return create_client(url, key)
 
-    def upload_screenshot(self, screenshot_bytes: bytes) -> Optional[str]:
+    def upload_screenshot(
+        self,
+        screenshot_bytes: bytes,
+        run_id: Optional[str] = None,
+        content_type: str = "image/png",
+        extension: str = "png",
+        thumbnail: Optional[bytes] = None,
+    ) -> Optional[str]:
+        """Store one evidence frame; a thumbnail is stored next to it as *_thumb."""
         if not self.client: return None
         try:
-            filename = f"trace_{uuid.uuid4()}.png"
-            self.client.storage.from_("screenshots").upload(
-                path=filename,
+            stem = f"{run_id}/trace_{uuid.uuid4()}" if run_id else f"trace_{uuid.uuid4()}"
+            bucket = self.client.storage.from_("screenshots")
+            bucket.upload(
+                path=f"{stem}.{extension}",
                 file=screenshot_bytes,
-                file_options={"content-type": "image/png"}
+                file_options={"content-type": content_type}
             )
-            return self.client.storage.from_("screenshots").get_public_url(filename)
+            if thumbnail:
+                bucket.upload(
+                    path=f"{stem}_thumb.{extension}",
+                    file=thumbnail,
+                    file_options={"content-type": content_type}
+                )
+            return bucket.get_public_url(f"{stem}.{extension}")
         except Exception as e:
             logger.error(f"Screenshot upload failed: {e}")
             return None
 
+    def _user_prefs(self, user_id: str) -> Dict[str, Any]:
+        """The user's settings row, served from the shared TTL cache."""
+        prefs = user_settings_cache.get(user_id)
+        if prefs is MISS:
+            query = self.client.table("user_settings")\
+                .select("telemetry_enabled")\
+                .eq("user_id", user_id)\
+                .maybe_single()\
+                .execute()
+            prefs = (query.data if query else None) or {}
+            user_settings_cache.put(user_id, prefs)
+        return prefs
+
     def _should_log_sensitive(self, run_id: str) -> bool:
         if not self.client:
             return False
 
-        if run_id in self.telemetry_cache:
-            return self.telemetry_cache[run_id]
-
         try:
-            run_query = self.client.table("test_runs")\
-                .select("user_id")\
-                .eq("id", run_id)\
-                .maybe_single()\
-                .execute()
+            user_id = user_settings_cache.owner(run_id)
+            if user_id is MISS:
+                run_query = self.client.table("test_runs")\
+                    .select("user_id")\
+                    .eq("id", run_id)\
+                    .maybe_single()\
+                    .execute()
+                user_id = run_query.data["user_id"] if run_query and run_query.data else None
+                user_settings_cache.remember_owner(run_id, user_id)
+                if not user_id:
+                    logger.warning(f"Run {run_id} not found - defaulting to PRIVATE")
 
-            if not run_query.data:
-                logger.warning(f"Run {run_id} not found - defaulting to PRIVATE")
-                self.telemetry_cache[run_id] = False
+            if not user_id:
                 return False
-
-            user_id = run_query.data["user_id"]
-            settings_query = self.client.table("user_settings")\
-                .select("telemetry_enabled")\
-                .eq("user_id", user_id)\
-                .maybe_single()\
-                .execute()
-
-            is_enabled = settings_query.data.get("telemetry_enabled", True) if settings_query.data else True
-
-            self.telemetry_cache[run_id] = is_enabled
-            return is_enabled
+            return user_settings_cache.telemetry_enabled(self._user_prefs(user_id))
 
         except Exception as e:
             logger.error(f"❌ PRIVACY_CHECK_FAILED for run {run_id}: {e}")
-            self.telemetry_cache[run_id] = False
             return False
 
     def init_run(self, run_id: str, user_id: str, url: str, mode: str, intent: str) -> bool:
@@ -80,6 +104,7 @@ class SupabaseBridge:
                 "status": "RUNNING"
             }
             self.client.table("test_runs").upsert(payload).execute()
+            user_settings_cache.remember_owner(run_id, user_id)
             return True
         except Exception as e:
             logger.error(f"[RunInit] Failed to initialize run {run_id} for user {user_id}: {e}")
@@ -109,6 +134,7 @@ class SupabaseBridge:
             "message": message,
             "url": kwargs.get("url"),
             "details": kwargs.get("details", ""),
+            "screenshot_url": kwargs.get("screenshot_url"),
         }
 
         if not telemetry_enabled:
@@ -136,8 +162,7 @@ class SupabaseBridge:
             return False
 
         try:
-            sq = self.client.table("user_settings").select("telemetry_enabled").eq("user_id", user_id).maybe_single().execute()
-            if sq.data and not sq.data.get("telemetry_enabled", True):
+            if not user_settings_cache.telemetry_enabled(self._user_prefs(user_id)):
                 logger.info(f"🛡️ [Privacy Active] DNA storage blocked for {url}")
                 return True
 
@@ -159,6 +184,31 @@ class SupabaseBridge:
             logger.error(f"[Fingerprint] Storage failed for {url} > {selector}: {e}")
             return False
 
+    def save_fingerprints(self, user_id: str, url: str, fingerprints: List[Dict[str, Any]]) -> int:
+        """Bulk upsert of one page's element DNA; returns rows stored, -1 on failure."""
+        if not self.client or not fingerprints:
+            return 0
+
+        try:
+            if not user_settings_cache.telemetry_enabled(self._user_prefs(user_id)):
+                logger.info(f"🛡️ [Privacy Active] DNA storage blocked for {url}")
+                return 0
+
+            seen_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            self.client.table("element_fingerprints").upsert([{
+                "user_id": user_id,
+                "url": url,
+                "selector": dna["selector"],
+                "tag_name": dna.get("tag"),
+                "inner_text": dna.get("text"),
+                "attributes": dna.get("attributes", {}),
+                "last_seen": seen_at,
+            } for dna in fingerprints], on_conflict="user_id,url,selector").execute()
+            return len(fingerprints)
+        except Exception as e:
+            logger.error(f"[Fingerprint] Bulk storage failed for {url} ({len(fingerprints)} elements): {e}")
+            return -1
+
     def start_run(self, run_id: str, mode: str) -> bool:
         if not self.client: return False
         try:
@@ -170,9 +220,38 @@ class SupabaseBridge:
             logger.error(f"[RunStart] Failed to start run {run_id}: {e}")
             return False
 
+    def save_run_plan(self, run_id: str, plan: Dict[str, Any]) -> bool:
+        """Keep the executed (healed) plan so the run can be promoted to a Golden Path."""
+        if not self.client: return False
+        try:
+            self.client.table("test_runs").update({"plan": plan}).eq("id", run_id).execute()
+            return True
+        except Exception as e:
+            logger.error(f"[RunPlan] Failed to store plan for run {run_id}: {e}")
+            return False
+
+    def save_run_usage(self, run_id: str, usage: Dict[str, Any]) -> bool:
+        """Persist per-mission LLM token and latency accounting."""
+        if not self.client: return False
+        try:
+            self.client.table("test_runs").update({"usage": usage}).eq("id", run_id).execute()
+            return True
+        except Exception as e:
+            logger.error(f"[RunUsage] Failed to store usage for run {run_id}: {e}")
+            return False
+
+    def set_report_url(self, run_id: str, report_url: str) -> bool:
+        if not self.client: return False
+        try:
+            self.client.table("test_runs").update({"report_url": report_url}).eq("id", run_id).execute()
+            return True
+        except Exception as e:
+            logger.error(f"[RunReport] Failed to attach report to run {run_id}: {e}")
+            return False
+
     def update_run_status(self, run_id: str, status: str) -> bool:
         if not self.client: return False
-        valid_statuses = ["QUEUED", "PENDING", "RUNNING", "COMPLETED", "FAILED", "HEALED"]
+        valid_statuses = ["QUEUED", "PENDING", "RUNNING", "COMPLETED", "FAILED", "HEALED", "CANCELLED"]
         status_upper = status.upper() if status.upper() in valid_statuses else "FAILED"
         try:
             self.client.table("test_runs").update({"status": status_upper}).eq(
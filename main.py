@@ -1,17 +1,54 @@
 import asyncio
-import time
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ai.planner import generate_test_plan
 from ai.reporter import QA_Reporter
 from ai.crawler import AutonomousCrawler
 from automation.core.runner import AutomationRunner
-from data.supabase_client import db_bridge
+from automation.core.chaos import ChaosExecutor
+from automation.core.visual import build_visual_regression
+from automation.core.cancellation import mission_registry, resolve_deadline, record_stop, absorb_stop
+from data.supabase_async import async_db_bridge
+from data.checkpoint import checkpoint_store
+from data.session_cache import session_cache
+from ai.usage import begin_mission, end_mission
+from ai.models import ActionType, TestPlan, TestStep
+from configs.settings import settings
 from ai.prompts import CHAOS_SYSTEM_PROMPT, PLANNER_SYSTEM_PROMPT
 
 logger = logging.getLogger("orchestrator.main")
 
+# Dashboard AutomationStep actions that differ from ActionType names.
+REPLAY_ACTION_ALIASES = {"scrape": "extract_text"}
+
+
+def _replay_plan(payload_data: Dict[str, Any]) -> Optional[TestPlan]:
+    """Rebuild a Golden Path plan from the saved blueprint instead of re-planning."""
+    blueprint = payload_data.get("steps")
+    if isinstance(blueprint, dict):
+        blueprint = blueprint.get("steps")
+    if not blueprint:
+        return None
+
+    steps = []
+    for idx, raw in enumerate(blueprint, start=1):
+        action = REPLAY_ACTION_ALIASES.get(raw.get("action"), raw.get("action"))
+        if action not in ActionType._value2member_map_:
+            logger.warning(f"Replay step {idx}: unsupported action '{raw.get('action')}' skipped")
+            continue
+        steps.append(TestStep(
+            step_id=raw.get("step_id", idx),
+            role=raw.get("role", "customer"),
+            action=action,
+            description=raw.get("description") or f"{action} {raw.get('selector') or ''}".strip(),
+            selector=raw.get("selector"),
+            value=raw.get("value") or raw.get("url"),
+        ))
+
+    target_url = payload_data.get("context", {}).get("baseUrl")
+    return TestPlan(intent=f"REPLAY {payload_data.get('test_id', '')}".strip(), steps=steps, target_url=target_url) if steps else None
+
 async def run_sniper_mode(payload_data: Dict[str, Any]):
     user_id = payload_data.get("user_id")
     instructions = payload_data.get("instructions", "")
@@ -21,37 +58,73 @@ async def run_sniper_mode(payload_data: Dict[str, Any]):
     target_model = payload_data.get("model")
     mode = payload_data.get("mode", "sniper")
     api_key = payload_data.get("api_key")
+    routing_profile = payload_data.get("routing_profile")
+    capture_policy = payload_data.get("capture_policy")
+    credentials = payload_data.get("credentials")
 
     if not run_id:
         logger.error("❌ No run_id provided. Aborting.")
         return
 
     is_chaos = (mode == "chaos")
-    if not db_bridge.start_run(run_id=run_id, mode=mode):
+    if not await async_db_bridge.start_run(run_id=run_id, mode=mode):
         return
 
     runner = None
+    plan = None
+    ledger = None
+    scope = None
     try:
-        db_bridge.log_step(
-            run_id, 0, "system", "planner", "RUNNING",
-            f"🧠 Initializing {target_model} via {provider}..."
-        )
+        ledger = begin_mission(run_id, payload_data)
+        scope = mission_registry.enter(run_id, resolve_deadline(payload_data))
+        checkpoint = await asyncio.to_thread(checkpoint_store.load, run_id)
+        if checkpoint and checkpoint.get("plan"):
+            plan = TestPlan.model_validate(checkpoint["plan"])
+            progress = (
+                f"{len(checkpoint['vector_results'])} chaos vectors done" if checkpoint.get("vector_results")
+                else f"step {int(checkpoint.get('step_index', 0)) + 1}/{len(plan.steps)}"
+            )
+            await async_db_bridge.log_step(
+                run_id, 0, "system", "planner", "RUNNING",
+                f"♻️ Resuming checkpointed plan at {progress}"
+            )
+        elif mode == "replay":
+            checkpoint = None
+            plan = _replay_plan(payload_data)
+            if not plan:
+                await async_db_bridge.log_step(run_id, 0, "system", "planner", "FAILED", "REPLAY_ABORTED: Blueprint has no recorded steps.")
+                await async_db_bridge.update_run_status(run_id, "FAILED")
+                return
+            await async_db_bridge.log_step(run_id, 0, "system", "planner", "RUNNING", f"🔄 Replaying Golden Path: {len(plan.steps)} steps")
+        else:
+            checkpoint = None
+            await async_db_bridge.log_step(
+                run_id, 0, "system", "planner", "RUNNING",
+                f"🧠 Initializing {target_model} via {provider}..."
+            )
 
-        system_prompt = CHAOS_SYSTEM_PROMPT if is_chaos else PLANNER_SYSTEM_PROMPT
+            system_prompt = CHAOS_SYSTEM_PROMPT if is_chaos else PLANNER_SYSTEM_PROMPT
 
-        plan = await generate_test_plan(
-            raw_input=instructions,
-            system_prompt_override=system_prompt,
-            provider=provider,
-            model=target_model,
-            encrypted_key=api_key,
-        )
+            plan = await generate_test_plan(
+                raw_input=instructions,
+                system_prompt_override=system_prompt,
+                provider=provider,
+                model=target_model,
+                encrypted_key=api_key,
+            )
+
+            if not plan or not plan.steps:
+                error_msg = f"UPLINK_FAILURE: {provider} returned an empty plan."
+                await async_db_bridge.log_step(run_id, 0, "system", "planner", "FAILED", error_msg)
+                await async_db_bridge.update_run_status(run_id, "FAILED")
+                return
 
-        if not plan or not plan.steps:
-            error_msg = f"UPLINK_FAILURE: {provider} returned an empty plan."
-            db_bridge.log_step(run_id, 0, "system", "planner", "FAILED", error_msg)
-            db_bridge.update_run_status(run_id, "FAILED")
-            return
+            await asyncio.to_thread(checkpoint_store.save, run_id, {
+                "mode": mode,
+                "phase": "planned",
+                "plan": plan.model_dump(mode="json"),
+                "step_index": 0,
+            })
 
         runner = AutomationRunner(
             run_id=run_id,
@@ -59,18 +132,66 @@ async def run_sniper_mode(payload_data: Dict[str, Any]):
             provider=provider,
             model=target_model,
             api_key=api_key,
-            base_url=target_url
+            base_url=target_url,
+            routing_profile=routing_profile,
+            capture_policy=capture_policy
         )
+        if mode == "replay":
+            runner.visual = build_visual_regression(run_id, user_id, payload_data)
+        session_state = await asyncio.to_thread(session_cache.load, user_id, target_url, credentials)
+        fan_out = is_chaos and settings.CHAOS_CONCURRENCY > 1
+        # Chaos fan-out opens one context per vector; the runner's own page would go unused.
+        await runner.start_browser(headless=True, storage_state=session_state, open_page=not fan_out)
 
-        await runner.execute_plan(plan)
+        if fan_out:
+            chaos = ChaosExecutor(runner, settings.CHAOS_CONCURRENCY, settings.CHAOS_VECTOR_TIMEOUT_SECONDS)
+            await chaos.execute(plan, checkpoint=checkpoint)
+        else:
+            await runner.execute_plan(plan, checkpoint=checkpoint)
 
+    except asyncio.CancelledError:
+        if not scope or not scope.records_outcome:
+            raise # worker shutdown or lost lease: the run stays with whoever resumes it
+        absorb_stop()
+        if runner and plan:
+            progress = f"{runner.completed_steps}/{len(plan.steps)} steps completed"
+        else:
+            progress = "stopped before execution"
+        await record_stop(scope, progress)
+        await asyncio.to_thread(checkpoint_store.clear, run_id)
     except Exception as e:
         logger.error(f"💥 Sniper Mode Crash: {e}")
-        db_bridge.log_step(run_id, 999, "system", "crash", "FAILED", f"CRITICAL_FAILURE: {str(e)}")
-        db_bridge.update_run_status(run_id, "FAILED")
+        await async_db_bridge.log_step(run_id, 999, "system", "crash", "FAILED", f"CRITICAL_FAILURE: {str(e)}")
+        await async_db_bridge.update_run_status(run_id, "FAILED")
     finally:
+        if scope:
+            mission_registry.exit(scope)
         if runner:
-            await runner.stop_browser()
+            await asyncio.shield(runner.stop_browser())
+        if ledger:
+            await end_mission(ledger)
+
+async def _publish_partial_audit(run_id: str, crawler: Optional[AutonomousCrawler], ledger, payload_data: Dict[str, Any]) -> str:
+    """Report on the pages mapped before a Scout was stopped; returns a progress note."""
+    if not crawler or not crawler.report_data:
+        return "stopped before any page was mapped"
+    ledger.halt("stopped") # the report uses its built-in summary instead of another model call
+    note = f"partial audit of {len(crawler.report_data)} pages"
+    try:
+        report_path = await asyncio.wait_for(QA_Reporter.generate_report(
+            crawl_data=crawler.report_data,
+            total_time_seconds=crawler.elapsed(),
+            provider=payload_data.get("provider"),
+            model=payload_data.get("model"),
+            encrypted_key=payload_data.get("api_key"),
+            run_id=run_id
+        ), timeout=settings.MISSION_CANCEL_GRACE_SECONDS)
+        if report_path.startswith("http"):
+            await async_db_bridge.set_report_url(run_id, report_path)
+        return f"{note} published"
+    except Exception as e:
+        logger.error(f"Partial audit for {run_id} failed: {e}")
+        return f"{note} could not be published"
 
 async def run_scout_mode(payload_data: Dict[str, Any]):
     user_id = payload_data.get("user_id")
@@ -80,27 +201,34 @@ async def run_scout_mode(payload_data: Dict[str, Any]):
     target_model = payload_data.get("model")
     api_key = payload_data.get("api_key")
     credentials = payload_data.get("credentials")
+    routing_profile = payload_data.get("routing_profile") or settings.SCOUT_ROUTING_PROFILE
 
     if not api_key:
-        db_bridge.log_step(run_id, 0, "system", "scout", "FAILED", "ABORTED: API Key is missing.")
-        db_bridge.update_run_status(run_id, "FAILED")
+        await async_db_bridge.log_step(run_id, 0, "system", "scout", "FAILED", "ABORTED: API Key is missing.")
+        await async_db_bridge.update_run_status(run_id, "FAILED")
         return
 
-    db_bridge.start_run(run_id=run_id, mode="scout")
-    start_time = time.time()
+    await async_db_bridge.start_run(run_id=run_id, mode="scout")
 
     runner = None
+    crawler = None
+    ledger = None
+    scope = None
     try:
+        ledger = begin_mission(run_id, payload_data)
+        scope = mission_registry.enter(run_id, resolve_deadline(payload_data))
         runner = AutomationRunner(
             run_id=run_id,
             user_id=user_id,
             provider=provider,
             model=target_model,
-            api_key=api_key
+            api_key=api_key,
+            routing_profile=routing_profile
         )
 
-        db_bridge.log_step(run_id, 0, "system", "scout", "RUNNING", f"🚀 Launching Scout via {target_model}...")
-        await runner.start_browser(headless=True)
+        await async_db_bridge.log_step(run_id, 0, "system", "scout", "RUNNING", f"🚀 Launching Scout via {target_model}...")
+        session_state = await asyncio.to_thread(session_cache.load, user_id, start_url, credentials)
+        await runner.start_browser(headless=True, storage_state=session_state)
 
         crawler = AutonomousCrawler(
             start_url=start_url,
@@ -109,11 +237,26 @@ async def run_scout_mode(payload_data: Dict[str, Any]):
             credentials=credentials,
             api_key=api_key,
             provider=provider,
-            model=target_model
+            model=target_model,
+            session_restored=session_state is not None
         )
 
-        crawl_results = await crawler.run(runner.page)
-        duration = time.time() - start_time
+        checkpoint = await asyncio.to_thread(checkpoint_store.load, run_id)
+        if checkpoint and checkpoint.get("crawler"):
+            crawler.restore(checkpoint["crawler"])
+            await async_db_bridge.log_step(
+                run_id, 0, "system", "scout", "RUNNING",
+                f"♻️ Resuming Scout: {len(crawler.visited)} nodes already mapped"
+            )
+
+        if checkpoint and checkpoint.get("phase") == "reporting":
+            crawl_results = crawler.report_data
+        else:
+            crawl_results = await crawler.run(runner.page)
+            await asyncio.to_thread(checkpoint_store.save, run_id, {"mode": "scout", "phase": "reporting", "crawler": crawler.snapshot()})
+
+        duration = crawler.elapsed()
+        await runner.log_network_savings()
 
         report_path = await QA_Reporter.generate_report(
             crawl_data=crawl_results,
@@ -125,20 +268,29 @@ async def run_scout_mode(payload_data: Dict[str, Any]):
         )
 
         if report_path.startswith("http"):
-            db_bridge.client.table("test_runs").update({
-                "report_url": report_path
-            }).eq("id", run_id).execute()
+            await async_db_bridge.set_report_url(run_id, report_path)
 
-        db_bridge.log_step(
+        await async_db_bridge.log_step(
             run_id, 999, "system", "scout", "COMPLETED",
             "Mission finalized. Executive Audit is now ready for review."
         )
-        db_bridge.update_run_status(run_id, "COMPLETED")
+        await async_db_bridge.update_run_status(run_id, "COMPLETED")
+        await asyncio.to_thread(checkpoint_store.clear, run_id)
 
+    except asyncio.CancelledError:
+        if not scope or not scope.records_outcome:
+            raise # worker shutdown or lost lease: the run stays with whoever resumes it
+        absorb_stop()
+        await record_stop(scope, await _publish_partial_audit(scope.run_id, crawler, ledger, payload_data))
+        await asyncio.to_thread(checkpoint_store.clear, run_id)
     except Exception as e:
-        db_bridge.log_step(run_id, 999, "system", "scout", "FAILED", f"SCOUT_HALTED: {str(e)}")
-        db_bridge.update_run_status(run_id, "FAILED")
+        await async_db_bridge.log_step(run_id, 999, "system", "scout", "FAILED", f"SCOUT_HALTED: {str(e)}")
+        await async_db_bridge.update_run_status(run_id, "FAILED")
         logger.error(f"💥 Scout Mode Failed: {e}")
     finally:
+        if scope:
+            mission_registry.exit(scope)
         if runner:
-            await runner.stop_browser()
+            await asyncio.shield(runner.stop_browser())
+        if ledger:
+            await end_mission(ledger)
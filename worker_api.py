@@ -1,23 +1,136 @@
 from fastapi import FastAPI, BackgroundTasks, Request, HTTPException
+from fastapi.responses import JSONResponse, RedirectResponse, Response
+from contextlib import asynccontextmanager
+import asyncio
 import base64
+import hmac
 import json
+import os
 import uvicorn
 import logging
 from main import run_sniper_mode, run_scout_mode
-from data.supabase_client import db_bridge
+from data.supabase_async import async_db_bridge
+from ai.reporter import QA_Reporter, shutdown_render_pool
+from configs.settings import settings
+from data.storage import CONTENT_TYPES, LocalContentStore, RangeNotSatisfiable, local_store, parse_range
+from automation.core.executor import mission_executor
+from automation.core.cancellation import mission_registry
+from automation.core.poller import build_poller
+from automation.core.tracing import frame_on_demand
+from automation.core.browser import browser_launcher
+from automation.core.settings_sync import settings_sync
+from automation.core.warmup import worker_warmup
+from data.job_queue import job_queue
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("argus-worker")
 
-app = FastAPI(title="Argus Neural Worker", version="1.2.0")
+job_poller = build_poller(job_queue)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if mission_executor:
+        mission_executor.start()
+    # Pushed missions are accepted right away; polled ones wait for a warm worker.
+    worker_warmup.start(on_ready=job_poller.start if job_poller else None)
+    settings_sync.start()
+    yield
+    await settings_sync.stop()
+    await worker_warmup.stop()
+    if job_poller:
+        await job_poller.stop()
+    if mission_executor:
+        mission_executor.shutdown()
+    shutdown_render_pool()
+    await browser_launcher.close()
+    await async_db_bridge.aclose()
+
+app = FastAPI(title="Argus Neural Worker", version="1.2.0", lifespan=lifespan)
 
 @app.get("/")
 async def health_check():
     return {
         "status": "online",
         "service": "argus-orchestrator",
-        "workload": "idle"
+        "workload": mission_executor.status() if mission_executor else "inline",
+        "queue": job_poller.status() if job_poller else "push-only"
+    }
+
+@app.get("/ready")
+async def readiness_check():
+    """503 until the startup warm-up has finished."""
+    return JSONResponse(worker_warmup.status(), status_code=200 if worker_warmup.ready else 503)
+
+@app.get("/reports/{trace_id}.pdf")
+async def download_report(trace_id: str):
+    """Serve the audit PDF, rendering it from the JSON artifact on first download."""
+    url = await QA_Reporter.render_pdf_on_demand(trace_id)
+    if not url:
+        raise HTTPException(status_code=404, detail="Report artifact not found")
+    return RedirectResponse(url)
+
+@app.get("/traces/{run_id}/frames/{wall_ms}.jpeg")
+async def trace_frame(run_id: str, wall_ms: int):
+    """Evidence frame of a trace-captured mission, cut from its trace on first view."""
+    if not run_id.replace("-", "").replace("_", "").isalnum():
+        raise HTTPException(status_code=404, detail="Trace not found")
+    url = await frame_on_demand(run_id, wall_ms)
+    if not url:
+        raise HTTPException(status_code=404, detail="Trace frame not found")
+    return RedirectResponse(url)
+
+@app.get("/artifacts/{artifact}")
+async def serve_artifact(artifact: str, request: Request):
+    """Content-addressed artifacts from the local store, with Range support."""
+    store = local_store(async_db_bridge.storage)
+    path = store.resolve(artifact) if store else None
+    if not path:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+
+    size = path.stat().st_size
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "public, max-age=31536000, immutable", # the name is the content hash
     }
+    media_type = CONTENT_TYPES.get(os.path.splitext(artifact)[1].lower(), "application/octet-stream")
+    try:
+        span = parse_range(request.headers.get("range"), size)
+    except RangeNotSatisfiable:
+        raise HTTPException(status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"})
+    if not span:
+        data = await asyncio.to_thread(LocalContentStore.read_range, path)
+        return Response(data, media_type=media_type, headers=headers)
+
+    start, end = span
+    data = await asyncio.to_thread(LocalContentStore.read_range, path, start, end)
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return Response(data, status_code=206, media_type=media_type, headers=headers)
+
+def require_service_key(request: Request):
+    """Internal routes answer only callers holding the Supabase service role key."""
+    expected = settings.SUPABASE_SERVICE_ROLE_KEY
+    supplied = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+    if not expected or not hmac.compare_digest(supplied.encode(), expected.encode()):
+        raise HTTPException(status_code=401, detail="Service key required")
+
+@app.post("/settings/{user_id}/invalidate")
+async def invalidate_user_settings(user_id: str, request: Request):
+    """Called by the dashboard after a privacy change so the next check refetches (here and in mission processes)."""
+    require_service_key(request)
+    removed = settings_sync.invalidate(user_id)
+    return {"status": "invalidated", "user_id": user_id, "entries": removed}
+
+@app.post("/mission/{run_id}/cancel")
+async def cancel_mission(run_id: str, request: Request):
+    """Stop a mission running on this worker, or drop it from the queue if nobody claimed it."""
+    require_service_key(request)
+    if mission_registry.cancel(run_id):
+        return {"status": "cancelling", "run_id": run_id}
+    if mission_executor and await mission_executor.cancel(run_id):
+        return {"status": "cancelling", "run_id": run_id}
+    if await async_db_bridge.cancel_queued_run(run_id):
+        return {"status": "cancelled", "run_id": run_id}
+    raise HTTPException(status_code=404, detail="Mission is not running on this worker")
 
 @app.post("/")
 @app.post("/mission")
@@ -47,8 +160,18 @@ async def trigger_test(request: Request, background_tasks: BackgroundTasks):
         if not run_id or not user_id:
             raise HTTPException(status_code=400, detail="Missing run_id or user_id")
 
+        if job_poller:
+            # Lease-aware fleet: the pushed run may already be claimed by a poller.
+            lease = await asyncio.to_thread(job_queue.claim, run_id)
+            if lease:
+                job_poller.adopt(lease, decoded)
+                logger.info(f"🚀 MISSION_RECEIVED (leased): {run_id}")
+                return {"status": "leased", "run_id": run_id, "mode": mode, "worker": job_queue.worker_id}
+            if await asyncio.to_thread(job_queue.exists, run_id):
+                return {"status": "skipped", "run_id": run_id, "message": "Run already claimed by another worker."}
+
         # Initialize the database record with user_id to prevent 404 in dashboard
-        db_bridge.init_run(
+        await async_db_bridge.init_run(
             run_id=run_id,
             user_id=user_id,
             url=target_url,
@@ -60,7 +183,9 @@ async def trigger_test(request: Request, background_tasks: BackgroundTasks):
         logger.info(f"📡 NEURAL_MODE: {mode.upper()}")
         logger.info(f"🧠 TARGET_MODEL: {target_model}")
 
-        if mode == "scout":
+        if mission_executor:
+            await mission_executor.submit(mode, decoded)
+        elif mode == "scout":
             background_tasks.add_task(run_scout_mode, decoded)
         else:
             background_tasks.add_task(run_sniper_mode, decoded)